@@ -1,5 +1,7 @@
 import pygame
 import confi
+import assets
+from pool import PooledSprite
 
 
 # SpaceObject represents ONE department in space.
@@ -13,25 +15,35 @@ import confi
 # - be put into a sprite group
 # - be updated automatically with group.update()
 # - be removed using kill()
-class Border(pygame.sprite.Sprite):
+#
+# Departments are pooled (see pool.py): a department that left the
+# screen is reused for the next one.
+class Border(PooledSprite):
 
     def __init__(self, stop_x, image_path, dept_id, title, y):
         # __init__ runs when a new department object is created.
-        # All important properties of the department are set here.
 
         # Call the parent Sprite class constructor.
         # This is REQUIRED whenever you inherit from pygame.sprite.Sprite.
         super().__init__()
 
+        # The rectangle is created once and reused when the department is reused.
+        self.rect = pygame.Rect(0, 0, 0, 0)
+
+        self.reset(stop_x, image_path, dept_id, title, y)
+
+    def reset(self, stop_x, image_path, dept_id, title, y):
+        # All important properties of the department are set here
+        # (new or reused from the pool).
+
         # ---- IMAGE ----
-        # Load the department image from the given file path.
-        # convert_alpha() keeps transparency (important for PNG images).
-        # smoothscale() resizes the image nicely to 220x220 pixels.
-        self.image = pygame.transform.smoothscale(pygame.image.load(image_path).convert_alpha(),(220, 220))
+        # Get the department image from the shared asset cache.
+        # smooth=True means it is resized nicely (smoothscale) to 220x220 pixels.
+        self.image = assets.image(image_path, (220, 220), smooth=True)
 
-        # Create a rectangle around the image.
+        # A rectangle around the image.
         # The rect stores the position and size of the department.
-        self.rect = self.image.get_rect()
+        self.rect.size = self.image.get_size()
 
         # Start the department completely off-screen on the right.
         # bg.WIDTH is the screen width, so this means "just outside the view".
@@ -75,7 +87,7 @@ class Border(pygame.sprite.Sprite):
         self.fly_out = True
 
     def update(self):
-        # update() is called every frame by the sprite group.
+        # update() is called once per simulation step by the sprite group.
         # It controls how the department moves.
 
         # ---- NORMAL STATE (not leaving yet) ----
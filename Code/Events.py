@@ -1,5 +1,7 @@
 import pygame
-from random import randint
+
+# The game's random generator (seedable, see rng.py)
+from rng import rng
 
 # ---------------------------------------------------------
 # IMPORT GAME OBJECTS
@@ -23,12 +25,22 @@ from departments_data import Departments
 # Final planet AIity
 from planet import Planet
 
+# Timers that count game time (see scheduler.py)
+from scheduler import Scheduler
+
+# Killed sprites are reused (see pool.py)
+from pool import Pool
+
+# Timeline of timers for slow-frame hunting (see tracing.py)
+import tracing
+from confi import POOL_CAP, ASTEROID_STORM, STORM_ASTEROIDS, PIXEL_COLLISION
+
 
 # ---------------------------------------------------------
-# CUSTOM EVENTS & TIMERS
+# TIMER NAMES & TIMES
 # ---------------------------------------------------------
-# pygame.USEREVENT is the first free ID for custom events.
-# We add +2, +3, +4 so each event is unique.
+# Each timer has a unique number as its name
+# (they used to be custom pygame events, pygame.USEREVENT + n).
 
 Key_fly_in = pygame.USEREVENT + 2          # spawn health keys
 Department_fly_in = pygame.USEREVENT + 3   # spawn departments
@@ -42,74 +54,148 @@ AIity_delay = 3_000       # short pause before planet appears
 # Total number of departments (so we don’t hardcode "5")
 Total_departments = len(Departments)
 
+# How many asteroids fly at the same time
+# (the "asteroid storm" stress mode has hundreds)
+Max_asteroids = STORM_ASTEROIDS if ASTEROID_STORM else 3
+
+# True = pixel-perfect collisions (masks), False = hitbox rectangles
+Pixel_collision = PIXEL_COLLISION
+
+# Sprite pools: new asteroids/keys/departments reuse killed ones
+comet_pool = Pool(Komets, cap=max(POOL_CAP, Max_asteroids))
+key_pool = Pool(Key, cap=POOL_CAP)
+department_pool = Pool(Border, cap=POOL_CAP)
+
+
+# ---------------------------------------------------------
+# GAME-CLOCK TIMERS
+# ---------------------------------------------------------
+# pygame.time.set_timer counts REAL time (wall clock).
+# Our timers count GAME time instead: they only move forward
+# when the game world moves forward (tick_timers() is called once
+# per simulation step). So:
+# - a slow computer gets its keys/departments at the same game moment
+# - headless test runs and replays (much faster than real time) behave the same
+timers = Scheduler()
+
+# Timer names as shown in traces (see tracing.py)
+Timer_labels = {
+    Key_fly_in: "timer: key",
+    Department_fly_in: "timer: department",
+    AIity_fly_in: "timer: planet",
+}
+
+
+def schedule(name, delay, callback, interval=0):
+    # timers.schedule(), but the callback shows up as a bar in traces.
+    label = Timer_labels[name]
+
+    def fire():
+        with tracing.span(label, "timer"):
+            callback()
+
+    timers.schedule(name, delay, fire, interval)
+
+
+def tick_timers(millis):
+    # Moves the game clock forward by "millis" and runs the timers that are due
+    # (spawn keys, departments, planet).
+    # Returns the names of the timers that fired.
+    return timers.advance(millis)
+
 
 # ---------------------------------------------------------
 # INITIALIZE GAME TIMERS
 # ---------------------------------------------------------
-def init_events():
+def init_events(objects, group_keys, scores):
     # This function starts the timers used in the game.
     # It is called when:
     # - the game starts
     # - the game restarts
 
-    # Every 10 seconds → spawn a health key
-    pygame.time.set_timer(Key_fly_in, Key_between_time_distance)
+    timers.clear()
+    # Forget all timers of the last run
+
+    # Every 9 seconds → spawn a health key
+    schedule(Key_fly_in, Key_between_time_distance,
+             lambda: spawn_key(group_keys),
+             interval=Key_between_time_distance)
+
+    # After 12 seconds → spawn the first department (only once)
+    schedule_department(objects, scores)
 
-    # After 10 seconds → spawn the first department
-    # loops=1 means it triggers ONLY once
-    pygame.time.set_timer(Department_fly_in, Departments_between_time_distance, loops=1)
+
+def stop_timers():
+    # Removes all timers (the game world is reset).
+    timers.clear()
 
 
 # ---------------------------------------------------------
 # TIMER CONTROL (IMPORTANT FOR QUIZ LOGIC)
 # ---------------------------------------------------------
 def pause_timers():
-    # This function stops ALL timers.
+    # This function stops the game clock for ALL timers.
     # We use it when:
     # - a quiz opens
+    # - the pause screen opens
     # - the player loses
     #
     # Why?
-    # Because otherwise timer events keep piling up in the background.
-
-    pygame.time.set_timer(Key_fly_in, 0)
-    pygame.time.set_timer(Department_fly_in, 0)
-    pygame.time.set_timer(AIity_fly_in, 0)
+    # Because otherwise keys and departments keep coming in the background.
+    # Each timer keeps the time it has left, so resuming goes on from there.
 
-    # Remove already-queued timer events from the event queue
-    pygame.event.clear([Key_fly_in, Department_fly_in, AIity_fly_in])
+    timers.pause()
 
 
-def resume_after_quiz(scores):
+def resume_after_quiz(objects, scores):
     # This function resumes timers AFTER a quiz is finished.
 
-    # Restart health key timer
-    pygame.time.set_timer(Key_fly_in, 10_000)
+    timers.resume()
+    # The key timer goes on with the time it had left
 
-    # Only restart department timer if we are NOT in planet phase
+    # The next department comes a full interval after the quiz,
+    # but only if we are NOT in planet phase
     if not scores.to_planet:
-        pygame.time.set_timer(Department_fly_in, Departments_between_time_distance, loops=1)
+        schedule_department(objects, scores)
+
+
+def resume_after_pause(test_screen):
+    # This function resumes timers AFTER the pause screen is closed.
+
+    # A quiz keeps its timers stopped until the quiz is finished.
+    if test_screen.quiz_active:
+        return
+
+    timers.resume()
+    # Every timer (also a planet that is on its way) goes on
+    # with the time it had left.
 
 
 # ---------------------------------------------------------
 # HEALTH KEYS
 # ---------------------------------------------------------
-def spawn_key_if_needed(event, group_keys):
-    # This function checks:
-    # "Is the current event the Key_fly_in?"
-
-    if event.type == Key_fly_in:
-        # If yes → create a new Key object
-        # and add it to the sprite group
-        group_keys.add(Key())
+def spawn_key(group_keys):
+    # Called by the key timer:
+    # get a Key (new or reused) and add it to the sprite group
+    group_keys.add(key_pool.acquire())
 
 
 # ---------------------------------------------------------
 # DEPARTMENT SPAWNING
 # ---------------------------------------------------------
+def schedule_department(objects, scores):
+    # The next department flies in after Departments_between_time_distance
+    schedule(Department_fly_in, Departments_between_time_distance,
+             lambda: fly_in_next_department(objects, scores))
+
+
 def fly_in_next_department(objects, scores):
     # This function spawns ONE department at a time.
 
+    # In planet phase no departments come anymore
+    if scores.to_planet:
+        return
+
     # First: check if a department is still on screen
     for dept in objects:
         if not dept.fly_out:
@@ -121,9 +207,9 @@ def fly_in_next_department(objects, scores):
     for d in Departments:
         if d["id"] not in scores.completed_departments:
 
-            # Create a Border (department)
+            # Get a Border (department), new or reused
             objects.add(
-                Border(
+                department_pool.acquire(
                     stop_x=d["stop_x"],
                     image_path=d["image"],
                     dept_id=d["id"],
@@ -164,87 +250,32 @@ def find_dept_data(dept_id):
 # ---------------------------------------------------------
 # PLANET SPAWNING
 # ---------------------------------------------------------
-def schedule_planet_spawn():
+def schedule_planet_spawn(planets, scores):
     # Schedules the final planet to appear after a short delay
-    pygame.time.set_timer(AIity_fly_in, AIity_delay, loops=1)
+    schedule(AIity_fly_in, AIity_delay, lambda: spawn_planet(planets, scores))
 
 
-def spawn_planet_if_needed(event, planets, scores):
+def spawn_planet(planets, scores):
+    # Called by the planet timer.
     # Conditions for planet spawn:
-    # 1. Planet timer fired
-    # 2. We are in planet phase
-    # 3. No planet exists yet
+    # 1. We are in planet phase
+    # 2. No planet exists yet
 
-    if event.type == AIity_fly_in and scores.to_planet and len(planets) == 0:
+    if scores.to_planet and len(planets) == 0:
         planets.add(Planet())
 
 
-def collide_with_planet(hero, planets, scores):
-    # Checks if hero collides with the final planet
-
-    if not scores.to_planet:
-        return False
-
-    for p in planets:
-        if hero.hitbox.colliderect(p.hitbox):
-            scores.reached_planet = True
-            p.kill()
-            return True
-
-    return False
-
-
-# ---------------------------------------------------------
-# PAUSE SYSTEM
-# ---------------------------------------------------------
-def do_pause(window, clock):
-    # Freezes the game until SPACE is pressed again
-
-    pause = True
-    font = pygame.font.SysFont("Optima", 50)
-
-    while pause:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return "quit"
-
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-                pause = False
-
-        # Dark overlay
-        overlay = pygame.Surface(window.get_size())
-        overlay.set_alpha(150)
-        overlay.fill((39, 44, 78))
-        window.blit(overlay, (0, 0))
-
-        pause_text = font.render(
-            "Pause! Press SPACE to continue", True, "white"
-        )
-        window.blit(
-            pause_text,
-            pause_text.get_rect(
-                center=(window.get_width() // 2, window.get_height() // 2)
-            )
-        )
-
-        pygame.display.update()
-        clock.tick(30)
-
-    return "resume"
-
-
 # ---------------------------------------------------------
 # MAIN EVENT HANDLER (GAME HEART)
 # ---------------------------------------------------------
-def handle_events(events, window, clock,
+def handle_events(events,
                   objects, group_keys, scores,
                   test_screen, active_house, planets):
 
     # This function handles:
     # - mouse clicks
     # - keyboard input
-    # - timers
-    # - pause
+    # - pause (main.py shows the pause screen)
     # - restart
     #
     # It is called ONCE PER FRAME from main.py
@@ -265,19 +296,10 @@ def handle_events(events, window, clock,
 
             continue  # ignore all other events
 
-        # Spawn timers only if quiz is NOT active
-        if not test_screen.quiz_active:
-            spawn_key_if_needed(event, group_keys)
-
-            if event.type == Department_fly_in and not scores.to_planet:
-                fly_in_next_department(objects, scores)
-
-            spawn_planet_if_needed(event, planets, scores)
-
-        # Pause key
+        # Pause key -> main.py switches to the "pause" state
         if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-            if do_pause(window, clock) == "quit":
-                return "quit", active_house
+            pause_timers()
+            return "pause", active_house
 
         # Mouse clicks
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -294,12 +316,12 @@ def handle_events(events, window, clock,
                     active_house = None
 
                     # Resume timers safely
-                    resume_after_quiz(scores)
+                    resume_after_quiz(objects, scores)
 
                     if len(scores.completed_departments) >= Total_departments:
                         scores.to_planet = True
-                        pygame.time.set_timer(Department_fly_in, 0)
-                        schedule_planet_spawn()
+                        timers.cancel(Department_fly_in)
+                        schedule_planet_spawn(planets, scores)
 
             # Quiz not active → open department
             else:
@@ -318,29 +340,50 @@ def handle_events(events, window, clock,
 # ---------------------------------------------------------
 # ASTEROIDS
 # ---------------------------------------------------------
-def make_comet(enemies, window):
+def make_comet(enemies):
+    # Moves the asteroids and adds a new one when fewer than Max_asteroids exist.
+    # (Drawing happens in main.py.)
     enemies.update()
-    enemies.draw(window)
-    if len(enemies) < 3:
-        enemies.add(Komets(randint(4, 6)))
+    if len(enemies) < Max_asteroids:
+        enemies.add(comet_pool.acquire(rng.randint(4, 6)))
 
 
 # ---------------------------------------------------------
 # COLLISIONS
 # ---------------------------------------------------------
-def collide(hero, enemies, group_keys):
-    for comet in enemies:
-        if hero.hitbox.colliderect(comet.hitbox):
-            hit_cometa()
-            comet.kill()
-            hero.health -= 1
+def collide(hero, enemies, group_keys, planets, scores):
+    # Checks the rocket against asteroids, keys and the planet.
+    # The groups are HitboxGroups (see collision.py): they compare
+    # hitboxes (or pixels, with Pixel_collision) in pygame's C code.
+    # Returns (hits, heals) of this step, so statistics can count them.
+    hits = 0
+    heals = 0
+
+    for comet in enemies.collide(hero, Pixel_collision):
+        hit_cometa()
+        comet.kill()
+        hero.health -= 1
+        hits += 1
+
+    keys_found = group_keys.collide(hero, Pixel_collision)
+    for key in keys_found:
+        key.kill()
+
+    if keys_found and hero.health < 3:
+        hero.health += 1
+        heal_rocket()
+        heals += 1
+
+    # Did the hero reach the planet? (only in planet phase)
+    if scores.to_planet:
+        for p in planets.collide(hero, Pixel_collision):
+            scores.reached_planet = True
+            p.kill()
+            break
 
-    if pygame.sprite.spritecollide(hero, group_keys, True):
-        if hero.health < 3:
-            hero.health += 1
-            heal_rocket()
+    return hits, heals
 
 
-def move_key(window, group_keys):
+def move_key(group_keys):
+    # Moves the keys. (Drawing happens in main.py.)
     group_keys.update()
-    group_keys.draw(window)
@@ -1,6 +1,9 @@
 import pygame
 import confi
 import departments_data
+import fonts
+import text_layout
+import tracing
 
 
 # We use MMain.WIDTH and MMain.HEIGHT to position quiz elements
@@ -78,7 +81,6 @@ class Quiz:
         # -------------------------
         # RESULTS BUTTON RECTANGLE
         # -------------------------
-        self.answer_rects = [] #A list of invisible boxes that sit on top of the answer texts so the game knows where the player clicked
         self.continue_rect = pygame.Rect(
             confi.WIDTH // 2 - 200,      # x-position: center the button horizontally
             confi.HEIGHT // 2 + 120,     # y-position: below the center area
@@ -88,68 +90,149 @@ class Quiz:
         # This rectangle is used for the "Continue" button.
         # We draw it on the results screen and check clicks inside it.
 
+        # -------------------------
+        # PRE-DRAWN PARTS (CREATED ONCE)
+        # -------------------------
+        # These never change, so we draw them one time here
+        # and later only blit them.
+
+        self.overlay = pygame.Surface((confi.WIDTH, confi.HEIGHT))
+        self.overlay.set_alpha(220)
+        self.overlay.fill((0, 0, 0))
+        # Dark, semi-transparent full-screen overlay.
+
+        self.answer_box = self._make_box((1100, 75), (255, 255, 255), (200, 200, 200), 1)
+        # White answer box with a light grey border.
+
+        self.continue_box = self._make_box(self.continue_rect.size, (60, 60, 60), (200, 200, 200), 2)
+        # Grey "Continue" button with a light grey border.
+
+        # -------------------------
+        # PAGE LAYOUTS
+        # -------------------------
+        self.layouts = []
+        # One QuizLayout per question, built in open_quiz().
+
+        self.results_layout = None
+        # Layout of the results page, built when the last question is answered.
+
+    def _make_box(self, size, fill, border, border_width):
+        # Draws a rounded box onto its own transparent surface.
+        box = pygame.Surface(size, pygame.SRCALPHA)
+        rect = box.get_rect()
+        pygame.draw.rect(box, fill, rect, border_radius=12)
+        pygame.draw.rect(box, border, rect, border_width, border_radius=12)
+        return box
+
     #Open and close of the quiz window
     def open_quiz (self,dept_data):
+        tracing.instant("quiz open", "quiz", {"title": dept_data["title"]})
         self.quiz_active = True
         self.department_title = dept_data ["title"]
         self.list_of_questions = dept_data ["questions"]
         self.question_index = 0
         self.correct_answered_q = 0
 
+        # Wrap and render every question page NOW (once),
+        # so draw() only has to blit the finished surfaces.
+        with tracing.span("quiz layout", "quiz"):
+            self.layouts = [self._layout_question(i) for i in range(len(self.list_of_questions))]
+            # (no questions -> the results page is shown at once)
+            self.results_layout = None if self.list_of_questions else self._layout_results()
+
     def close_quiz (self):
+        if self.quiz_active:
+            tracing.instant("quiz close", "quiz", {"correct": self.correct_answered_q})
         self.quiz_active = False
 
     def wrap_to_three_lines(self, text, font, max_width):
+        # Question text -> 3 lines, "..." at the end if it is too long.
+        # The real work is done by the text layout engine.
+        q1, q2, q3 = text_layout.wrap(text, font, max_width, 3)
+        return q1, q2, q3
 
-        words = text.split()
-        lines = ["","",""]
-        line_index = 0
-        i = 0
-
-        # Build first line
-        while i < len(words) and line_index < 3:
-            test = (lines[line_index] + " " + words[i]).strip()
-            if font.size(test)[0] <= max_width:
-                lines[line_index] = test
-                i += 1
-            else:
-                line_index += 1
+    def wrap_answer_to_two_lines(self, text, font, max_width):
+        # Answer text -> 2 lines, "..." at the end if it is too long.
+        a1, a2 = text_layout.wrap(text, font, max_width, 2, sep=" ")
+        return a1, a2
 
-        # If still words left -> add ellipsis to line2
-        if i < len(words):
-                while font.size(lines[2] + "...")[0] > max_width and len(lines[2]) > 0:
-                    lines[2] = lines[2][:-1].rstrip()
-                lines[2] = (lines[2] + "...") if lines[2] else "..."
-        return lines [0], lines [1], lines [2]
+    # ------------------------------------------------------------
+    # LAYOUTS (computed once, drawn many times)
+    # ------------------------------------------------------------
+    def _layout_question(self, index):
+        # Builds the finished page for question number "index".
 
-    def wrap_answer_to_two_lines(self, text, font, max_width):
-        words = text.split(" ")
-        line1 = ""
-        i = 0
-
-        while i < len(words):
-            test = (line1 + " " + words[i]).strip()
-            if font.size(test)[0] <= max_width:
-                line1 = test
-                i += 1
-            else:
-                break
+        q, answers, _ = self.list_of_questions[index]
+        # q = question text
+        # answers = list of answers
+        # _ = correct index (not needed for drawing)
+
+        layout = QuizLayout()
+
+        # Line 1: Department title
+        line1 = fonts.render(self.department_title, self.font_small, "white")
+        layout.add(line1, line1.get_rect(center=(confi.WIDTH // 2, 110)))
 
-        line2 = ""
+        # 2) + 3) + 4) Lines: question, wrapped into max 3 lines
+        question_text = f"Q{index + 1}/{len(self.list_of_questions)}: {q}"
+        q_lines = self.wrap_to_three_lines(question_text, self.font_big, max_width=1150)
 
-        while i < len(words):
-            test = (line2 + " " + words[i]).strip()
-            if font.size(test)[0] <= max_width:
-                line2 = test
-                i += 1
+        for n, text in enumerate(q_lines):
+            q_line = fonts.render(text, self.font_big, "white")
+            layout.add(q_line, q_line.get_rect(center=(confi.WIDTH // 2, 145 + n * 30)))
+
+        # Answer boxes (the rects are also the click areas)
+        for i, ans in enumerate(answers):
+            rect = pygame.Rect(confi.WIDTH // 2 - 550, 260 + i * 95, 1100, 75)
+            layout.answer_rects.append(rect)
+            layout.add(self.answer_box, rect)
+
+            a1, a2 = self.wrap_answer_to_two_lines(ans, self.font_small, max_width=1000)
+
+            if a2 == "":
+                a_line = fonts.render(a1, self.font_small, "black")
+                layout.add(a_line, a_line.get_rect(center=rect.center))
             else:
-                break
+                a_line_1 = fonts.render(a1, self.font_small, "black")
+                a_line_2 = fonts.render(a2, self.font_small, "black")
+
+                line_spacing = 24
+                center_y = rect.centery
+
+                layout.add(a_line_1, a_line_1.get_rect(center=(rect.centerx, center_y - line_spacing // 2)))
+                layout.add(a_line_2, a_line_2.get_rect(center=(rect.centerx, center_y + line_spacing // 2)))
+
+        return layout
+
+    def _layout_results(self):
+        # Builds the results page (title, score, Continue button).
+
+        layout = QuizLayout()
 
-        if i < len(words):
-            while font.size(line2 + "...")[0] > max_width and len(line2) > 0:
-                line2 = line2[:-1].rstrip()
-            line2 += "..."
-        return line1, line2
+        title = fonts.render(f"{self.department_title} - RESULTS", self.font_big, "white")
+        layout.add(title, title.get_rect(center=(confi.WIDTH // 2, confi.HEIGHT // 2 - 60)))
+        # Title centered slightly above the center.
+
+        res = fonts.render(
+            f"Correct: {self.correct_answered_q} / {len(self.list_of_questions)}",
+            self.font_medium,
+            "white"
+        )
+        layout.add(res, res.get_rect(center=(confi.WIDTH // 2, confi.HEIGHT // 2 + 10)))
+        # Results text slightly below the center.
+
+        layout.add(self.continue_box, self.continue_rect)
+        t = fonts.render("Continue", self.font_medium, "white")
+        layout.add(t, t.get_rect(center=self.continue_rect.center))
+
+        return layout
+
+    def current_layout(self):
+        # The page that is shown right now.
+        if self.question_index >= len(self.list_of_questions):
+            return self.results_layout
+
+        return self.layouts[self.question_index]
 
     #Clicks in the test
     def handle_click(self, pos):
@@ -164,7 +247,8 @@ class Quiz:
 
             # Otherwise: we are in question screen
             # Check if user clicked one of the answer boxes
-        for i, rect in enumerate(self.answer_rects):
+            # (the boxes come from the layout, not from the last draw() call)
+        for i, rect in enumerate(self.current_layout().answer_rects):
             if rect.collidepoint(pos):
                 _, _, correct_idx = self.list_of_questions[self.question_index]
 
@@ -172,6 +256,12 @@ class Quiz:
                     self.correct_answered_q += 1
 
                 self.question_index += 1  # go to next question
+
+                if self.question_index >= len(self.list_of_questions):
+                    # Last answer -> build the results page now (in the
+                    # click), not in the next draw() while a frame is made
+                    with tracing.span("quiz results layout", "quiz"):
+                        self.results_layout = self._layout_results()
                 return "answered"
 
         return None
@@ -179,116 +269,33 @@ class Quiz:
 
     def draw(self, window):
         # draw() draws the quiz overlay onto the window.
+        # Everything was prepared in the layout, so this is only blits.
 
         if not self.quiz_active:
             # If quiz is not active, do not draw anything.
             return
 
-        # -------------------------
-        # DARK OVERLAY
-        # -------------------------
-        overlay = pygame.Surface((confi.WIDTH, confi.HEIGHT))
-        # Create a full-screen surface.
-
-        overlay.set_alpha(220)
-        # Make it semi-transparent (0 invisible, 255 fully opaque).
-
-        overlay.fill((0, 0, 0))
-        # Fill overlay with black color.
-
-        window.blit(overlay, (0, 0))
-        # Draw overlay on top of the screen.
-
-        # -------------------------
-        # RESULTS SCREEN DRAWING
-        # -------------------------
-        if self.question_index >= len(self.list_of_questions):
-            title = self.font_big.render(f"{self.department_title} - RESULTS", True, "white")
-            # Render the title text.
-
-            window.blit(title, title.get_rect(center=(confi.WIDTH // 2, confi.HEIGHT // 2 - 60)))
-            # Draw title centered slightly above the center.
-
-            res = self.font_medium.render(
-                f"Correct: {self.correct_answered_q} / {len(self.list_of_questions)}",
-                True,
-                "white"
-            )
-            # Render result line showing score.
-
-            window.blit(res, res.get_rect(center=(confi.WIDTH // 2, confi.HEIGHT // 2 + 10)))
-            # Draw results text slightly below the center.
-
-            # Draw Continue button background
-            pygame.draw.rect(window, (60, 60, 60), self.continue_rect, border_radius=12)
-
-            # Draw Continue button border
-            pygame.draw.rect(window, (200, 200, 200), self.continue_rect, 2, border_radius=12)
-
-            # Draw Continue text
-            t = self.font_medium.render("Continue", True, "white")
-            window.blit(t, t.get_rect(center=self.continue_rect.center))
-
-            return
-            # Stop here so we don't draw question screen too.
-
-        # -------------------------
-        # QUESTION SCREEN DRAWING
-        # -------------------------
+        # Dark overlay on top of the game
+        window.blit(self.overlay, (0, 0))
 
-        q, answers, _ = self.list_of_questions[self.question_index]
-        # Get current question tuple:
-        # q = question text
-        # answers = list of 4 answers
-        # _ = correct index (we do not need it for drawing)
+        # Current page (question or results)
+        window.blits(self.current_layout().blits, doreturn=False)
 
-        # -------------------------
-        # QUESTION HEADER (2 LINES)
-        # -------------------------
-
-        # Line 1: Department title (big font)
-        line1 = self.font_small.render(self.department_title, True, "white")
-        window.blit(
-            line1,
-            line1.get_rect(center=(confi.WIDTH // 2, 110))
-        )
-
-        # 2) + 3) Lines: question (small), wrapped into max 2 lines
-        question_text = f"Q{self.question_index + 1}/{len(self.list_of_questions)}: {q}"
-        q1, q2, q3 = self.wrap_to_three_lines(question_text, self.font_big, max_width=1150)
-
-        q_line_1 = self.font_big.render(q1, True, "white")
-        q_line_2 = self.font_big.render(q2, True, "white")
-        q_line_3 = self.font_big.render(q3, True, "white")
-
-        window.blit(q_line_1, q_line_1.get_rect(center=(confi.WIDTH // 2, 145)))
-        window.blit(q_line_2, q_line_2.get_rect(center=(confi.WIDTH // 2, 175)))
-        window.blit(q_line_3, q_line_3.get_rect(center=(confi.WIDTH // 2, 205)))
-
-        # Answer rectangles
-        self.answer_rects.clear()
-
-        for i, ans in enumerate (answers):
-            rect = pygame.Rect(confi.WIDTH // 2 - 550, 260 + i * 95, 1100, 75)
-            self.answer_rects.append(rect)
-
-            pygame.draw.rect(window, (255, 255, 255), rect, border_radius=12)
-            pygame.draw.rect(window, (200, 200, 200), rect, 1, border_radius=12)
-
-            a1,a2 = self.wrap_answer_to_two_lines(ans, self.font_small, max_width=1000)
+    def get_score(self):
+        return self.correct_answered_q
 
-            if a2 == "":
-                a_line = self.font_small.render(a1, True, "black")
-                window.blit(a_line, a_line.get_rect(center=rect.center))
-            else:
-                a_line_1 = self.font_small.render(a1, True, "black")
-                a_line_2 = self.font_small.render(a2, True, "black")
 
-                line_spacing = 24
-                center_y = rect.centery
+# ============================================================
+#                       QUIZ LAYOUT
+# ============================================================
+# A QuizLayout is one finished quiz page:
+# - blits: every (surface, position) pair to draw, in order
+# - answer_rects: the clickable answer boxes (empty on the results page)
+class QuizLayout:
 
-                window.blit(a_line_1, a_line_1.get_rect(center=(rect.centerx, center_y - line_spacing // 2)))
-                window.blit(a_line_2, a_line_2.get_rect(center=(rect.centerx, center_y + line_spacing // 2)))
+    def __init__(self):
+        self.blits = []
+        self.answer_rects = []
 
-    def get_score(self):
-        return self.correct_answered_q
+    def add(self, surface, position):
+        self.blits.append((surface, position))
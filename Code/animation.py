@@ -0,0 +1,56 @@
+import assets
+import atlas
+
+
+# =====================================================
+#                  ANIMATION CLIPS
+# =====================================================
+# A clip = the frames of one animation + how long each one is shown.
+# Time is counted in simulation steps ("ticks"), like everything that
+# moves, so an animation runs at the same speed at any frame rate.
+#
+#     clip = AnimationClip(frames, steps=6)
+#     sprite.image = clip.frame(sprite.index)
+#     sprite.index = clip.next(sprite.index)
+#
+# The clip itself does not change while playing: the tick counter
+# belongs to the sprite, so many sprites can share one clip.
+#
+# from_sheet() makes a clip from a sprite sheet (atlas.py), also
+# flipped left <-> right (mirrored=True).
+
+
+class AnimationClip:
+
+    def __init__(self, frames, steps=6, length=None):
+        # frames -> surfaces, in order
+        # steps  -> ticks each frame is shown
+        # length -> ticks until the clip starts again
+        #           (default: every frame "steps" ticks long)
+        self.frames = list(frames)
+        self.steps = steps
+        self.length = length if length is not None else steps * len(self.frames)
+
+        last = len(self.frames) - 1
+        self._at = [self.frames[min(tick // steps, last)] for tick in range(self.length)]
+        # Frame for every tick of one loop (no division while playing)
+
+    def __len__(self):
+        return len(self.frames)
+
+    def frame(self, tick):
+        # The frame shown at this tick.
+        return self._at[tick % self.length]
+
+    def next(self, tick):
+        # The tick after "tick" (back to 0 at the end of the loop).
+        tick += 1
+        return tick if tick < self.length else 0
+
+
+def from_sheet(sheet, size, steps=6, length=None, mirrored=False):
+    # A clip with all frames of a sprite sheet (in table order),
+    # scaled to "size" and taken from the asset cache.
+    # mirrored=True -> flipped left <-> right.
+    load = assets.mirrored if mirrored else assets.image
+    return AnimationClip([load(path, size) for path in atlas.frames(sheet)], steps, length)
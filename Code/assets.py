@@ -0,0 +1,488 @@
+import json
+import os
+import struct
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import mmap
+except ImportError:
+    # (not every Python build has mmap -> the bundle is read instead)
+    mmap = None
+
+import pygame
+# Import pygame.
+# We need it for loading and resizing images.
+
+import tracing
+import atlas
+# Frames of sprite sheets ("sheet.png#frame") load like image files.
+
+from departments_data import Departments
+# We need the department list so we can preload every department picture.
+
+from confi import PIXEL_COLLISION, BAKED_DIR, BUNDLE_FILE
+# Pixel-perfect collisions need a mask for every image that can collide.
+# BAKED_DIR: images scaled in advance by build_assets.py (see below).
+
+
+# =====================================================
+#                  ASSET CACHE
+# =====================================================
+# Loading a PNG from disk and resizing it is SLOW.
+# Before this file existed, every new asteroid, key, department
+# and planet loaded its picture again inside the game loop.
+#
+# Now all sprite classes ask this module for their image.
+# The first request loads + converts + scales the picture.
+# Every later request with the same settings gets the SAME surface back.
+#
+# IMPORTANT:
+# The returned surfaces are shared between sprites.
+# Never draw ON a cached image, only draw the image somewhere else.
+
+# _cache stores finished surfaces.
+# key   -> (path, size, alpha, smooth)
+# value -> pygame.Surface ready for blitting
+_cache = {}
+
+# stats counts how well the cache works.
+# hits   = image was already in memory
+# misses = image had to be loaded from disk
+# baked  = of the misses, loaded already scaled from BAKED_DIR
+# bundle = of the misses, made from raw pixels in the bundle (no decoding)
+stats = {"hits": 0, "misses": 0, "masks": 0, "baked": 0, "bundle": 0}
+
+# _masks stores collision masks (which pixels are not transparent).
+# key   -> a cached surface
+# value -> pygame.mask.Mask of that surface
+# Building a mask looks at every pixel, so it is done ONCE per image
+# (and per rocket animation frame), never per sprite or per frame.
+_masks = {}
+
+
+# =====================================================
+#                  PRELOAD LIST
+# =====================================================
+# Every image the game needs during play, with the exact settings
+# the sprite classes use. preload() loads all of them at startup,
+# so no PNG is decoded while the player is flying.
+#
+# (path, size, alpha, smooth)
+PRELOAD = [
+    # Background (no transparency needed)
+    ("PICS/Background/cosmos4.png", (1365, 763), False, False),
+
+    # Asteroids
+    ("PICS/Enemy/Stone1.png", (106, 88), True, False),
+    ("PICS/Enemy/Stone2.png", (106, 88), True, False),
+
+    # Health key
+    ("PICS/Stats/key.png", (106, 88), True, False),
+
+    # Final planet
+    ("PICS/New Hero, Rocket/last planet.png", (360, 360), True, False),
+
+    # HUD icons
+    ("PICS/Stats/gear-cog-setting.png", (70, 70), True, True),
+    ("PICS/Departaments/visited depa.png", (132, 90), True, True),
+
+    # Menu logo
+    ("PICS/Player_right/LOGO.png", (950, 300), True, True),
+]
+
+# Rocket animation frames (one sprite sheet, see atlas.py)
+ROCKET_FRAMES = atlas.frames("PICS/Player_right/rocket.png")
+for _path in ROCKET_FRAMES:
+    PRELOAD.append((_path, (230, 150), True, False))
+
+# Department pictures
+for _d in Departments:
+    PRELOAD.append((_d["image"], (220, 220), True, True))
+
+# Images of things the rocket can collide with (and the rocket itself).
+# With PIXEL_COLLISION their masks are built in preload() too.
+MASKED = {
+    "PICS/Enemy/Stone1.png",
+    "PICS/Enemy/Stone2.png",
+    "PICS/Stats/key.png",
+    "PICS/New Hero, Rocket/last planet.png",
+}
+MASKED.update(ROCKET_FRAMES)
+
+# Images that are also needed flipped left <-> right (see mirrored()):
+# the rocket flying left.
+MIRRORED = [(_path, (230, 150), True, False) for _path in ROCKET_FRAMES]
+
+
+def image(path, size=None, alpha=True, smooth=False):
+    # Returns a ready-to-draw surface for "path".
+    #
+    # path   -> image file (or sprite sheet frame, "sheet.png#frame")
+    # size   -> (width, height) or None to keep the original size
+    # alpha  -> True = convert_alpha() (keeps transparency)
+    #           False = convert() (faster for solid pictures)
+    # smooth -> True = smoothscale(), False = scale()
+
+    key = (path, size, alpha, smooth)
+
+    surface = _cache.get(key)
+    if surface is not None:
+        # Already loaded -> just give it back.
+        stats["hits"] += 1
+        return surface
+
+    # Not loaded yet -> do the slow work ONE time.
+    stats["misses"] += 1
+
+    with tracing.span("load " + path, "assets"):
+        # (a bar in the trace timeline, see tracing.py)
+        surface = finish(path, size, alpha, smooth, decode(path, size, alpha, smooth))
+
+    _cache[key] = surface
+    return surface
+
+
+def mirrored(path, size=None, alpha=True, smooth=False):
+    # image() flipped left <-> right (e.g. the rocket flying left).
+    # Made from the cached image when needed, never stored as a file.
+    key = (path, size, alpha, smooth, "mirrored")
+
+    surface = _cache.get(key)
+    if surface is not None:
+        stats["hits"] += 1
+        return surface
+
+    surface = pygame.transform.flip(image(path, size, alpha, smooth), True, False)
+    _cache[key] = surface
+    return surface
+
+
+def decode(path, size=None, alpha=True, smooth=False):
+    # The part of loading that needs no window: reading the file and
+    # decoding the PNG. Safe in a worker thread (see preload_steps()).
+    # Returns (surface, where) for finish():
+    #     "bundle"   -> raw pixels from the bundle (nothing to decode)
+    #     "baked"    -> baked file, already scaled by build_assets.py
+    #     "original" -> original file, still to be scaled
+    raw = bundle.raw(path, size, alpha, smooth)
+    if raw is not None:
+        return raw, "bundle"
+    file = baked(path, size, alpha, smooth)
+    if file is not None:
+        return pygame.image.load(file), "baked"
+    return atlas.load(path), "original"
+
+
+def finish(path, size, alpha, smooth, decoded):
+    # Main thread part: converts a decode() result into the window
+    # format (and scales an original). Same pixels as load_scaled().
+    surface, where = decoded
+    if where == "original":
+        return _scale(_convert(surface, alpha), size, smooth)
+    stats[where] += 1
+    # (bundle: convert() copies the pixels, nothing points into the bundle afterwards)
+    return _convert(surface, alpha)
+
+
+def _convert(surface, alpha):
+    # convert()/convert_alpha() change the pixels into the window format.
+    # This needs a window, so call this only AFTER set_mode().
+    if alpha:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+def load_scaled(path, size=None, alpha=True, smooth=False):
+    # Loads the original file, converts and scales it
+    # (no cache; build_assets.py bakes images with this, too).
+    return _scale(_convert(atlas.load(path), alpha), size, smooth)
+
+
+def _scale(surface, size, smooth):
+    if size is not None:
+        if smooth:
+            surface = pygame.transform.smoothscale(surface, size)
+        else:
+            surface = pygame.transform.scale(surface, size)
+
+    return surface
+
+
+# =====================================================
+#                  BAKED IMAGES
+# =====================================================
+# Most pictures are much bigger than on screen (rocket frames, logo,
+# rules slides...). Scaling them at every start costs time, and the
+# browser build has to download the big originals.
+#
+# build_assets.py ("offline", before packaging) writes every image of
+# the manifest already scaled into BAKED_DIR, plus manifest.json:
+#     (source, size, alpha, smooth) -> baked file
+# If that manifest exists, image() loads the small baked file instead
+# (same pixels, only the scaling is skipped).
+# A baked file whose original was changed afterwards is not used.
+
+MANIFEST = "manifest.json"
+
+
+def baked_name(path, size, alpha, smooth):
+    # File name of a baked image inside BAKED_DIR, e.g.
+    # "PICS/Enemy/Stone1-106x88.png", "PICS/Background/cosmos4-1365x763-opaque.png"
+    # (a sheet frame: "PICS/Player_right/rocket-R11-230x150.png")
+    file, frame = atlas.split(path)
+    stem = os.path.splitext(file)[0]
+    if frame is not None:
+        stem += "-" + frame
+    if size is not None:
+        stem += f"-{size[0]}x{size[1]}"
+    if smooth:
+        stem += "-smooth"
+    if not alpha:
+        stem += "-opaque"
+    return stem + ".png"
+
+
+def _read_manifest(folder):
+    # (path, size, alpha, smooth) -> [baked file, mtime of the original]
+    try:
+        with open(os.path.join(folder, MANIFEST)) as f:
+            entries = json.load(f)["images"]
+    except (OSError, ValueError, KeyError):
+        return {}
+
+    baked = {}
+    for e in entries:
+        size = tuple(e["size"]) if e["size"] else None
+        key = (e["source"], size, e["alpha"], e["smooth"])
+        baked[key] = [os.path.join(folder, e["file"]), e["source_mtime"]]
+    return baked
+
+
+_baked = _read_manifest(BAKED_DIR)
+
+
+def baked(path, size=None, alpha=True, smooth=False):
+    # The baked file for these settings, or None (then load the original).
+    entry = _baked.get((path, size, alpha, smooth))
+    if entry is None:
+        return None
+
+    file, source_mtime = entry
+    if not _fresh(path, source_mtime):
+        return None
+    return file
+
+
+def _fresh(path, source_mtime):
+    # False if the original was changed after baking.
+    try:
+        return os.path.getmtime(atlas.source(path)) <= source_mtime
+    except OSError:
+        # The original is not shipped (browser build) -> the baked one it is
+        return True
+
+
+# =====================================================
+#                  ASSET BUNDLE
+# =====================================================
+# Even baked, every image is its own PNG file: one file to open (one
+# download in the browser) and one PNG to decode per image.
+#
+# build_assets.py also packs the images into ONE bundle file
+# (BUNDLE_FILE):
+#
+#     "KIKOPAK1"                   8 bytes
+#     index length                 4 bytes (little endian)
+#     index                        JSON, one entry per image:
+#                                  source, size, alpha, smooth,
+#                                  offset, width, height, source_mtime
+#     (zero bytes up to a multiple of 16)
+#     pixels                       raw BGRA, 4 bytes per pixel, each
+#                                  image starting at a multiple of 16
+#                                  ("offset" counts from the first image)
+#
+# BGRA is how the window stores its pixels on usual systems (32-bit
+# XRGB/ARGB, little endian), so convert() is a plain copy.
+#
+# The file is memory-mapped: nothing is read until an image needs its
+# pixels, and pygame.image.frombuffer() uses those bytes directly
+# (no PNG decoding). convert() then copies them into a normal surface,
+# so nothing points into the mapped file afterwards.
+#
+# Without the bundle (development) the baked PNGs or the original
+# files are loaded as before.
+
+BUNDLE_MAGIC = b"KIKOPAK1"
+BUNDLE_FORMAT = "BGRA"
+BUNDLE_ALIGN = 16
+
+
+class Bundle:
+
+    def __init__(self, path):
+        self.path = path
+        self.index = {}
+        # (path, size, alpha, smooth) -> index entry
+        self.data = None
+        # The mapped file (or its bytes without mmap)
+
+        try:
+            self._open(path)
+        except (OSError, ValueError, KeyError, struct.error):
+            # No bundle (or a broken one) -> loose files
+            self.index = {}
+            self.data = None
+
+    def _open(self, path):
+        with open(path, "rb") as f:
+            if mmap is not None:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                data = f.read()
+
+        if data[:8] != BUNDLE_MAGIC:
+            raise ValueError("not an asset bundle")
+        (length,) = struct.unpack_from("<I", data, 8)
+        index = json.loads(bytes(data[12:12 + length]))
+        self.base = 12 + length + (-(12 + length) % BUNDLE_ALIGN)
+        # Where the first image starts
+
+        for e in index["images"]:
+            size = tuple(e["size"]) if e["size"] else None
+            self.index[(e["source"], size, e["alpha"], e["smooth"])] = e
+        self.data = data
+
+    def raw(self, path, size=None, alpha=True, smooth=False):
+        # A surface directly on the bundle's bytes (not converted, no copy),
+        # or None if the image is not in the bundle.
+        # Convert it before using it for long (see finish()).
+        e = self.index.get((path, size, alpha, smooth))
+        if e is None or not _fresh(path, e["source_mtime"]):
+            return None
+
+        width, height = e["width"], e["height"]
+        start = self.base + e["offset"]
+        pixels = memoryview(self.data)[start:start + width * height * 4]
+        return pygame.image.frombuffer(pixels, (width, height), BUNDLE_FORMAT)
+
+    def close(self):
+        if mmap is not None and isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.data = None
+        self.index = {}
+
+
+bundle = Bundle(BUNDLE_FILE)
+
+
+def mask(surface):
+    # Returns the collision mask of a cached surface (built only once).
+    m = _masks.get(surface)
+    if m is None:
+        m = pygame.mask.from_surface(surface)
+        _masks[surface] = m
+        stats["masks"] += 1
+    return m
+
+
+THREADS = sys.platform != "emscripten"
+# preload_steps() may decode in worker threads (not in the browser build)
+
+
+def preload():
+    # Loads every image from PRELOAD into the cache.
+    # (headless.py; main.py uses preload_steps() behind the boot screen)
+    for _ in preload_steps():
+        pass
+
+
+def preload_steps(threads=0):
+    # preload() one image at a time: a generator that yields the path
+    # of every finished image, so the boot screen can draw its progress
+    # bar in between (see boot.py).
+    #
+    # threads > 0: the files are decoded in that many worker threads
+    # (PNG decoding does not hold the GIL, so they really run at the
+    # same time). Converting needs the window, so it is done here,
+    # in the main thread, as soon as an image is decoded.
+    # The browser build has no threads: one after another there.
+    #
+    # Yields preload_count() times.
+    yield from _decode_steps(threads)
+
+    # The flipped images (quick: made from the cached ones)
+    for entry in MIRRORED:
+        _preloaded(entry, mirrored(*entry))
+        yield entry[0]
+
+    atlas.release()
+    # The decoded sprite sheets are not needed any more:
+    # all their frames are in the cache now.
+
+
+def preload_count():
+    # How many images preload_steps() yields.
+    return len(PRELOAD) + len(MIRRORED)
+
+
+def _decode_steps(threads):
+    # The PRELOAD part of preload_steps().
+    todo = []
+    for entry in PRELOAD:
+        if entry in _cache:
+            yield entry[0]
+        else:
+            todo.append(entry)
+
+    if threads <= 0 or not THREADS:
+        for entry in todo:
+            _preloaded(entry, image(*entry))
+            yield entry[0]
+        return
+
+    with ThreadPoolExecutor(max_workers=threads, thread_name_prefix="decode") as pool:
+        futures = {pool.submit(_decode_traced, *entry): entry for entry in todo}
+        for future in as_completed(futures):
+            entry = futures[future]
+            stats["misses"] += 1
+            surface = finish(*entry, future.result())
+            _cache[entry] = surface
+            _preloaded(entry, surface)
+            yield entry[0]
+
+
+def _decode_traced(path, size, alpha, smooth):
+    # decode() in a worker thread, as a bar in the trace timeline.
+    with tracing.span("decode " + path, "assets"):
+        return decode(path, size, alpha, smooth)
+
+
+def _preloaded(entry, surface):
+    # Collision masks are made right after the image.
+    if PIXEL_COLLISION and entry[0] in MASKED:
+        mask(surface)
+
+
+def cache_info():
+    # Small summary for debugging:
+    # how many images are stored and how often the cache helped.
+    return {
+        "images": len(_cache),
+        "masks": len(_masks),
+        "hits": stats["hits"],
+        "misses": stats["misses"],
+        "baked": stats["baked"],
+        "bundle": stats["bundle"],
+    }
+
+
+def clear():
+    # Forget all cached images and reset the counters.
+    _cache.clear()
+    _masks.clear()
+    stats["hits"] = 0
+    stats["misses"] = 0
+    stats["masks"] = 0
+    stats["baked"] = 0
+    stats["bundle"] = 0
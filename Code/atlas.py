@@ -0,0 +1,166 @@
+import argparse
+import json
+import os
+import threading
+
+import pygame
+
+
+# =====================================================
+#                  SPRITE SHEETS (ATLAS)
+# =====================================================
+# An animation used to be one PNG file per frame (the rocket had 12:
+# R11..R66 flying right, L11..L66 flying left). Now the frames are
+# packed into ONE sheet image, with a frame table next to it:
+#
+#     PICS/Player_right/rocket.png     all frames, side by side
+#     PICS/Player_right/rocket.json    {"frames": [{"name": "R11",
+#                                        "x": 0, "y": 0, "w": 230, "h": 150}, ...]}
+#
+# One frame of a sheet is addressed like a file, with "#" and its name:
+#     "PICS/Player_right/rocket.png#R11"
+# assets.image() (and the baked images / the bundle) accept these paths
+# like any other image, so frames are cached and preloaded as before.
+#
+# Mirrored frames (flying left) are not stored: they are made from the
+# right-facing ones with pygame.transform.flip (assets.mirrored()).
+#
+# Making a sheet (run from the Code folder):
+#     python atlas.py PICS/Player_right/rocket.png PICS/Player_right/R11.png ... --size 230x150
+# --size scales every frame first, exactly like the game does
+# (pygame.transform.scale), so the game gets the same pixels.
+
+SEP = "#"
+# Between the sheet file and the frame name
+
+MAX_WIDTH = 2048
+# Frames go left to right; a new row starts after this width.
+
+_tables = {}
+# sheet file -> {frame name: pygame.Rect}, in frame order
+
+_sheets = {}
+# sheet file -> decoded sheet (not converted, see load())
+
+_lock = threading.Lock()
+# Frames may be loaded by several worker threads at once (assets.preload_steps)
+
+
+def split(path):
+    # "sheet.png#R11" -> ("sheet.png", "R11"),  "file.png" -> ("file.png", None)
+    file, _, name = path.partition(SEP)
+    return file, name or None
+
+
+def source(path):
+    # The file on disk for "path" (the sheet for a frame).
+    return split(path)[0]
+
+
+def table_path(sheet):
+    # "PICS/Player_right/rocket.png" -> "PICS/Player_right/rocket.json"
+    return os.path.splitext(sheet)[0] + ".json"
+
+
+def table(sheet):
+    # Frame table of a sheet: {name: Rect}, in frame order.
+    rects = _tables.get(sheet)
+    if rects is None:
+        with open(table_path(sheet)) as f:
+            frames = json.load(f)["frames"]
+        rects = {e["name"]: pygame.Rect(e["x"], e["y"], e["w"], e["h"]) for e in frames}
+        _tables[sheet] = rects
+    return rects
+
+
+def frames(sheet):
+    # Paths of all frames of a sheet, in order:
+    # ["sheet.png#R11", "sheet.png#R22", ...]
+    return [sheet + SEP + name for name in table(sheet)]
+
+
+def load(path):
+    # pygame.image.load() that also understands "sheet.png#frame".
+    # (not converted: assets.finish() does that in the main thread)
+    file, name = split(path)
+    if name is None:
+        return pygame.image.load(path)
+
+    rect = table(file)[name]
+    with _lock:
+        sheet = _sheets.get(file)
+        if sheet is None:
+            sheet = pygame.image.load(file)
+            _sheets[file] = sheet
+            # Decoded once for all its frames
+        return sheet.subsurface(rect).copy()
+
+
+def release():
+    # Forgets the decoded sheets (their frames are in the asset cache now).
+    with _lock:
+        _sheets.clear()
+
+
+def pack(files, sheet, size=None):
+    # Packs image files into one sheet + frame table.
+    # size -> (width, height) every frame is scaled to first, or None.
+    # The frame names are the file names without extension.
+    # Needs a window (convert_alpha), like build_assets.py.
+    images = []
+    for file in files:
+        surface = pygame.image.load(file).convert_alpha()
+        if size is not None:
+            surface = pygame.transform.scale(surface, size)
+            # (the same as assets.load_scaled() with smooth=False)
+        images.append((os.path.splitext(os.path.basename(file))[0], surface))
+
+    # Left to right, new row after MAX_WIDTH
+    placed = []
+    x = y = row_height = width = 0
+    for name, surface in images:
+        w, h = surface.get_size()
+        if x and x + w > MAX_WIDTH:
+            x, y = 0, y + row_height
+            row_height = 0
+        placed.append((name, surface, pygame.Rect(x, y, w, h)))
+        x += w
+        width = max(width, x)
+        row_height = max(row_height, h)
+
+    out = pygame.Surface((width, y + row_height), pygame.SRCALPHA)
+    out.fill((0, 0, 0, 0))
+    for name, surface, rect in placed:
+        out.blit(surface, rect)
+        # (on fully transparent pixels the frame's pixels are copied unchanged)
+    pygame.image.save(out, sheet)
+
+    entries = [{"name": name, "x": r.x, "y": r.y, "w": r.width, "h": r.height}
+               for name, surface, r in placed]
+    with open(table_path(sheet), "w") as f:
+        json.dump({"frames": entries}, f, indent=1)
+    _tables.pop(sheet, None)
+    return len(placed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack animation frames into one sprite sheet.")
+    parser.add_argument("sheet", help="sheet image to write (the frame table goes next to it)")
+    parser.add_argument("files", nargs="+", help="frame images, in animation order")
+    parser.add_argument("--size", help="scale every frame to WIDTHxHEIGHT first, e.g. 230x150")
+    args = parser.parse_args()
+
+    size = tuple(int(n) for n in args.size.split("x")) if args.size else None
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    # convert_alpha() needs a (dummy) window
+
+    count = pack(args.files, args.sheet, size)
+    print(f"{count} frames -> {args.sheet} + {table_path(args.sheet)}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-import pygame
+import assets
 
 # Background is a class that represents the moving space background.
 # It is NOT a Sprite.
@@ -12,17 +12,14 @@ class Background:
         # This is the "birth moment" of the background.
 
         # ---- BACKGROUND IMAGE ----
-        # Load the background image from file.
+        # Get the background image from the shared asset cache.
         # convert() (without alpha) is enough here because the background
         # does not need transparency.
         # scale(...) resizes the image slightly larger than the window.
         #
         # Why larger?
         # So scrolling looks smooth and no empty gaps appear.
-        self.image = pygame.transform.scale(
-            pygame.image.load("PICS/Background/cosmos4.png").convert(),
-            (1365, 763)
-        )
+        self.image = assets.image("PICS/Background/cosmos4.png", (1365, 763), alpha=False)
 
         # Create a rectangle around the background image.
         # This rectangle stores the image width and height.
@@ -43,8 +40,18 @@ class Background:
         self.bgX2 = self.rect.width
         self.bgY2 = 0
 
+        # Positions before the last update (used to draw smoothly
+        # between two updates, see timestep.py).
+        self.prevX1 = self.bgX1
+        self.prevX2 = self.bgX2
+
+    def snapshot(self):
+        # Remember the current positions before an update.
+        self.prevX1 = self.bgX1
+        self.prevX2 = self.bgX2
+
     def update(self):
-        # update() is called every frame.
+        # update() is called once per simulation step.
         # It moves the background images to create a scrolling effect.
 
         # Move both background images to the LEFT.
@@ -64,12 +71,20 @@ class Background:
         if self.bgX2 <= -self.rect.width:
             self.bgX2 = self.rect.width
 
-    def render(self, window):
+    def _between(self, prev, now, alpha):
+        # Position between the last two updates.
+        # If the image just jumped to the right side (loop), don't slide it back.
+        if abs(now - prev) > self.moving_speed:
+            return now
+        return round(prev + (now - prev) * alpha)
+
+    def render(self, window, alpha=1.0):
         # render() draws the background images on the screen.
+        # alpha (0..1) = how far we are between the last two updates.
 
         # Draw first background image at its current position.
-        window.blit(self.image, (self.bgX1, self.bgY1))
+        window.blit(self.image, (self._between(self.prevX1, self.bgX1, alpha), self.bgY1))
 
         # Draw second background image right after it.
         # Together they fill the whole screen and scroll endlessly.
-        window.blit(self.image, (self.bgX2, self.bgY2))
+        window.blit(self.image, (self._between(self.prevX2, self.bgX2, alpha), self.bgY2))
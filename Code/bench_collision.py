@@ -0,0 +1,118 @@
+import itertools
+import random
+import time
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
+
+import pygame
+
+from collision import HitboxGroup
+
+
+# =====================================================
+#      MICRO-BENCHMARK: COLLISION CHECKS
+# =====================================================
+# Compares three ways to find the asteroids that touch the rocket:
+# - old:   Python loop over all asteroids (the old Events.collide)
+# - sweep: sort-and-sweep on x, sorted again every step (Python)
+# - group: HitboxGroup.collide (collision.py), used by the game
+#
+# All three must find exactly the same asteroids.
+# We measure the time per simulation step for 3 asteroids (normal game)
+# up to an "asteroid storm" with hundreds.
+#
+# The objects move left like in the game, and now and then an asteroid
+# leaves the screen and a new one comes in (the group changes).
+#
+# Run from the Code folder:
+#     python bench_collision.py
+
+
+class Thing(pygame.sprite.Sprite):
+    # Just enough of an asteroid: a hitbox that moves left.
+    # number -> the same asteroid has the same number in every run
+    #           (to compare WHICH asteroids were found, not only how many)
+    def __init__(self, rnd, number):
+        super().__init__()
+        self.rnd = rnd
+        self.number = number
+        self.hitbox = pygame.Rect(rnd.randint(0, 1300), rnd.randint(0, 620), 91, 23)
+        self.speed = rnd.randint(4, 6)
+
+    def update(self):
+        self.hitbox.x -= self.speed
+
+
+def respawn(group, count, rnd, numbers):
+    # Like make_comet: asteroids that left the screen are replaced.
+    for t in group.sprites():
+        if t.hitbox.right < 0:
+            t.kill()
+    while len(group) < count:
+        t = Thing(rnd, next(numbers))
+        t.hitbox.x = 1200
+        group.add(t)
+
+
+def find_old(hero, group):
+    return [t for t in group if hero.hitbox.colliderect(t.hitbox)]
+
+
+_left = attrgetter("hitbox.left")
+
+
+def find_sweep(hero, group):
+    things = sorted(group, key=_left)
+    lefts = [t.hitbox.left for t in things]
+    widest = max((t.hitbox.width for t in things), default=0)
+    box = hero.hitbox
+    start = bisect_right(lefts, box.left - widest)
+    end = bisect_left(lefts, box.right)
+    return [t for t in things[start:end] if box.colliderect(t.hitbox)]
+
+
+def find_group(hero, group):
+    return group.collide(hero)
+
+
+def run(find, hero, count, steps, measure=True):
+    rnd = random.Random(count)
+    numbers = itertools.count()
+    group = HitboxGroup(*[Thing(rnd, next(numbers)) for _ in range(count)])
+    found = []
+    spent = 0.0
+
+    for _ in range(steps):
+        group.update()
+        respawn(group, count, rnd, numbers)
+
+        start = time.perf_counter()
+        hits = find(hero, group)
+        spent += time.perf_counter() - start
+
+        found.append(sorted(t.number for t in hits))
+
+    return spent, found
+
+
+def main():
+    hero = Thing(random.Random(0), -1)
+    hero.hitbox = pygame.Rect(485, 375, 230, 50)
+    steps = 600
+
+    for count in (3, 30, 300, 1000):
+        print(f"{count} asteroids, {steps} steps:")
+
+        results = {}
+        for name, find in (("old", find_old), ("sweep", find_sweep), ("group", find_group)):
+            spent, found = run(find, hero, count, steps)
+            results[name] = found
+            print(f"  {name:<6} {spent / steps * 1e6:8.1f} us per step")
+
+        if not results["old"] == results["sweep"] == results["group"]:
+            raise SystemExit("  MISMATCH: different collisions found")
+        print(f"  same collisions: yes ({sum(len(f) for f in results['old'])} hits)")
+
+
+if __name__ == "__main__":
+    main()
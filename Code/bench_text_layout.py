@@ -0,0 +1,154 @@
+import os
+import time
+
+# No window is needed, fonts work without one.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+import text_layout
+from departments_data import Departments
+
+
+# =====================================================
+#      MICRO-BENCHMARK: QUIZ TEXT WRAPPING
+# =====================================================
+# Compares the old Quiz wrapping functions (copied below unchanged)
+# with text_layout.wrap():
+# - both must give exactly the same lines
+# - we count font.size() calls and measure the time
+#
+# Run from the Code folder:
+#     python bench_text_layout.py
+
+
+# ---------- OLD FUNCTIONS (from Test.Quiz) ----------
+def legacy_wrap_to_three_lines(text, font, max_width):
+
+    words = text.split()
+    lines = ["","",""]
+    line_index = 0
+    i = 0
+
+    while i < len(words) and line_index < 3:
+        test = (lines[line_index] + " " + words[i]).strip()
+        if font.size(test)[0] <= max_width:
+            lines[line_index] = test
+            i += 1
+        else:
+            line_index += 1
+
+    if i < len(words):
+            while font.size(lines[2] + "...")[0] > max_width and len(lines[2]) > 0:
+                lines[2] = lines[2][:-1].rstrip()
+            lines[2] = (lines[2] + "...") if lines[2] else "..."
+    return lines [0], lines [1], lines [2]
+
+
+def legacy_wrap_answer_to_two_lines(text, font, max_width):
+    words = text.split(" ")
+    line1 = ""
+    i = 0
+
+    while i < len(words):
+        test = (line1 + " " + words[i]).strip()
+        if font.size(test)[0] <= max_width:
+            line1 = test
+            i += 1
+        else:
+            break
+
+    line2 = ""
+
+    while i < len(words):
+        test = (line2 + " " + words[i]).strip()
+        if font.size(test)[0] <= max_width:
+            line2 = test
+            i += 1
+        else:
+            break
+
+    if i < len(words):
+        while font.size(line2 + "...")[0] > max_width and len(line2) > 0:
+            line2 = line2[:-1].rstrip()
+        line2 += "..."
+    return line1, line2
+
+
+# ---------- NEW FUNCTIONS ----------
+def new_wrap_to_three_lines(text, font, max_width):
+    return tuple(text_layout.wrap(text, font, max_width, 3))
+
+
+def new_wrap_answer_to_two_lines(text, font, max_width):
+    return tuple(text_layout.wrap(text, font, max_width, 2, sep=" "))
+
+
+class CountingFont:
+    # Wraps a font and counts how often size() is called.
+    def __init__(self, font):
+        self.font = font
+        self.calls = 0
+
+    def size(self, text):
+        self.calls += 1
+        return self.font.size(text)
+
+
+def run(name, wrap, texts, font, max_width, repeat):
+    counting = CountingFont(font)
+    # fresh word cache, so the first round pays for measuring words
+    text_layout._word_widths.clear()
+
+    start = time.perf_counter()
+    results = None
+    for _ in range(repeat):
+        results = [wrap(t, counting, max_width) for t in texts]
+    elapsed = time.perf_counter() - start
+
+    print(f"  {name:<8} {elapsed * 1000:9.2f} ms   {counting.calls / repeat:9.0f} font.size() calls per round")
+    return results
+
+
+def main():
+    pygame.init()
+
+    font_big = pygame.font.Font(None, 28)
+    font_small = pygame.font.Font(None, 22)
+
+    questions = []
+    answers = []
+    for d in Departments:
+        for q, a, _ in d["questions"]:
+            questions.append(q)
+            answers.extend(a)
+
+    # Long texts, like a bigger question bank would have.
+    long_questions = [" ".join([q] * 6) for q in questions]
+    long_answers = [" ".join([a] * 6) for a in answers]
+
+    cases = [
+        ("questions (3 lines)", legacy_wrap_to_three_lines, new_wrap_to_three_lines,
+         questions, font_big, 1150),
+        ("answers (2 lines)", legacy_wrap_answer_to_two_lines, new_wrap_answer_to_two_lines,
+         answers, font_small, 1000),
+        ("long questions", legacy_wrap_to_three_lines, new_wrap_to_three_lines,
+         long_questions, font_big, 1150),
+        ("long answers", legacy_wrap_answer_to_two_lines, new_wrap_answer_to_two_lines,
+         long_answers, font_small, 1000),
+    ]
+
+    for title, old, new, texts, font, max_width in cases:
+        print(f"{title}: {len(texts)} texts")
+        expected = run("old", old, texts, font, max_width, repeat=20)
+        got = run("new", new, texts, font, max_width, repeat=20)
+
+        if [tuple(x) for x in expected] != [tuple(x) for x in got]:
+            raise SystemExit(f"  MISMATCH in {title}")
+        print("  same output: yes")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
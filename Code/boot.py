@@ -0,0 +1,104 @@
+import asyncio
+import time
+
+import pygame
+
+import fonts
+import tracing
+
+
+# =====================================================
+#                  BOOT (LOADING) SCREEN
+# =====================================================
+# Between pygame.init() and the first menu frame, main.run() loads
+# all images, fonts, the music and the sound effects. Before, the
+# window stayed black the whole time (and the browser tab looked frozen).
+#
+# The BootScreen draws a progress bar right after set_mode() and moves
+# it after every loading step:
+#
+#     boot = BootScreen(window, started, steps)
+#     for path in assets.preload_steps(threads):
+#         await boot.advance(path)
+#     ...
+#     await boot.advance("sounds")
+#     ...
+#     boot.interactive()      (after the first menu frame)
+#
+# advance() also lets the system handle window events and gives the
+# browser a turn (await asyncio.sleep(0)), like the pacer does.
+#
+# Two startup times are measured (since "started", i.e. run() began)
+# and written to the log (printed, like the other reports of main.py):
+#     first frame  -> the boot screen is visible (time to first frame)
+#     interactive  -> the first menu frame is shown and clicks work
+#                     (time to interactive)
+
+
+class BootScreen:
+
+    def __init__(self, window, started, steps):
+        # window  -> the game window
+        # started -> time.perf_counter() when run() started
+        # steps   -> how many advance() calls until the menu
+        self.window = window
+        self.started = started
+        self.steps = max(steps, 1)
+        self.done = 0
+
+        self.font = fonts.font(None, 30)
+        # (pygame's built-in font: no system font search before the first frame)
+
+        width, height = window.get_size()
+        self.bar = pygame.Rect(0, 0, width // 2, 24)
+        self.bar.center = (width // 2, height // 2)
+
+        self.first_frame = None
+        self.ready = None
+        # Seconds since "started" (None = not yet)
+
+        self.draw("Loading")
+
+    def draw(self, label):
+        # Draws the whole boot screen and shows it.
+        window = self.window
+        window.fill((0, 0, 0))
+
+        title = self.font.render("KikoGame", True, "white")
+        window.blit(title, title.get_rect(midbottom=(self.bar.centerx, self.bar.top - 20)))
+
+        # Outline + filled part of the bar
+        pygame.draw.rect(window, "white", self.bar, 2)
+        filled = self.bar.inflate(-8, -8)
+        filled.width = round(filled.width * min(self.done / self.steps, 1.0))
+        if filled.width > 0:
+            pygame.draw.rect(window, "white", filled)
+
+        text = self.font.render(label, True, (150, 150, 150))
+        window.blit(text, text.get_rect(midtop=(self.bar.centerx, self.bar.bottom + 14)))
+
+        pygame.display.flip()
+
+        if self.first_frame is None:
+            self.first_frame = time.perf_counter() - self.started
+            tracing.instant("first frame", "boot")
+
+    async def advance(self, label):
+        # One loading step ("label") is finished -> move the bar.
+        self.done += 1
+        self.draw(label)
+
+        pygame.event.pump()
+        # The window keeps reacting (moving, "not responding" check).
+        # The events stay in the queue for the main loop (e.g. QUIT).
+
+        await asyncio.sleep(0)
+
+    def interactive(self):
+        # Called once the first menu frame is on the screen.
+        if self.ready is not None:
+            return
+        self.ready = time.perf_counter() - self.started
+        tracing.instant("interactive", "boot")
+        print(f"boot: first frame {self.first_frame * 1000:.0f} ms, "
+              f"interactive {self.ready * 1000:.0f} ms")
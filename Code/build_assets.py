@@ -0,0 +1,165 @@
+import argparse
+import json
+import os
+import shutil
+import struct
+import time
+
+# No window needed: must be set BEFORE pygame is imported.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+import assets
+import atlas
+from start_screen import RULE_IMAGES
+from confi import WIDTH, HEIGHT, BAKED_DIR, BUNDLE_FILE
+
+
+# =====================================================
+#      OFFLINE ASSET BUILD: PRE-SCALED IMAGES
+# =====================================================
+# The game scales most pictures down at every start (rocket frames
+# to 230x150, departments to 220x220, the logo to 950x300, rules
+# slides to the window size, ...). This script does that ONCE,
+# before packaging, and writes the finished images to BAKED_DIR.
+# assets.image() and the rules slides then load these small files.
+#
+# The manifest = every image the Code modules use, with the settings
+# they ask for: (source, size, alpha, smooth)
+# - assets.PRELOAD (all sprite, HUD and menu images)
+# - the rules slides (start_screen.RULE_IMAGES, window size, smooth)
+#
+# Opaque images (alpha=False, e.g. the background) are saved without
+# an alpha channel. The pixels are exactly what the game would
+# compute at runtime (the same assets.load_scaled()).
+#
+# Images are not cropped to their visible pixels: the image size is
+# the sprite's rect, and the hitboxes are made from the rect.
+#
+# It also packs the images into one bundle file (BUNDLE_FILE, raw pixels,
+# memory-mapped by the game, see assets.Bundle). Raw pixels are much
+# bigger than PNG, so the rules slides (54 MB raw) stay baked PNGs,
+# unless --bundle-slides is given.
+#
+# Run from the Code folder:
+#     python build_assets.py            (writes build/assets + the bundle)
+#     python build_assets.py --clean    (removes the folder first)
+
+
+def manifest():
+    # (source, size, alpha, smooth) of every image the game loads.
+    entries = list(assets.PRELOAD)
+    for path in RULE_IMAGES:
+        entries.append((path, (WIDTH, HEIGHT), True, True))
+    return entries
+
+
+def bake(entry, out):
+    # Scales one image and saves it. Returns its manifest entry.
+    path, size, alpha, smooth = entry
+    name = assets.baked_name(path, size, alpha, smooth)
+    target = os.path.join(out, name)
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+
+    surface = assets.load_scaled(path, size, alpha, smooth)
+    pygame.image.save(surface, target)
+
+    return {
+        "source": path,
+        "size": list(size) if size else None,
+        "alpha": alpha,
+        "smooth": smooth,
+        "file": name,
+        "source_mtime": os.path.getmtime(atlas.source(path)),
+    }
+
+
+def write_bundle(entries, path):
+    # Packs the images into one file (format: see assets.py, ASSET BUNDLE).
+    # Returns the size of the file in bytes.
+    index = []
+    payloads = []
+    offset = 0
+
+    for source, size, alpha, smooth in entries:
+        surface = assets.load_scaled(source, size, alpha, smooth)
+        pixels = pygame.image.tobytes(surface, assets.BUNDLE_FORMAT)
+        width, height = surface.get_size()
+        index.append({
+            "source": source,
+            "size": list(size) if size else None,
+            "alpha": alpha,
+            "smooth": smooth,
+            "offset": offset,
+            "width": width,
+            "height": height,
+            "source_mtime": os.path.getmtime(atlas.source(source)),
+        })
+        padding = -len(pixels) % assets.BUNDLE_ALIGN
+        payloads.append(pixels + bytes(padding))
+        offset += len(pixels) + padding
+
+    data = json.dumps({"version": 1, "format": assets.BUNDLE_FORMAT, "images": index}).encode()
+    padding = -(12 + len(data)) % assets.BUNDLE_ALIGN
+    # (the first image starts at a multiple of BUNDLE_ALIGN, too)
+
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(assets.BUNDLE_MAGIC)
+        f.write(struct.pack("<I", len(data)))
+        f.write(data + bytes(padding))
+        for payload in payloads:
+            f.write(payload)
+
+    return os.path.getsize(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write pre-scaled images for the game.")
+    parser.add_argument("--out", default=BAKED_DIR, help=f"output folder (default {BAKED_DIR})")
+    parser.add_argument("--clean", action="store_true", help="delete the output folder first")
+    parser.add_argument("--bundle", default=BUNDLE_FILE,
+                        help=f"bundle file (default {BUNDLE_FILE}, '' = no bundle)")
+    parser.add_argument("--bundle-slides", action="store_true",
+                        help="put the rules slides into the bundle too (54 MB more)")
+    args = parser.parse_args()
+
+    if args.clean and os.path.isdir(args.out):
+        shutil.rmtree(args.out)
+
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    # convert()/convert_alpha() need a (dummy) window
+
+    start = time.perf_counter()
+    images = []
+    sources = set()
+    # (all frames of a sprite sheet come from the same file)
+    baked_bytes = 0
+
+    for entry in manifest():
+        e = bake(entry, args.out)
+        images.append(e)
+        sources.add(atlas.source(e["source"]))
+        baked_bytes += os.path.getsize(os.path.join(args.out, e["file"]))
+    source_bytes = sum(os.path.getsize(path) for path in sources)
+
+    with open(os.path.join(args.out, assets.MANIFEST), "w") as f:
+        json.dump({"version": 1, "images": images}, f, indent=1)
+
+    print(f"{len(images)} images baked into {args.out} in {time.perf_counter() - start:.1f} s")
+    print(f"originals: {source_bytes / 1e6:.1f} MB, baked: {baked_bytes / 1e6:.1f} MB")
+
+    if args.bundle:
+        entries = manifest() if args.bundle_slides else list(assets.PRELOAD)
+        size = write_bundle(entries, args.bundle)
+        print(f"bundle: {len(entries)} images, {size / 1e6:.1f} MB -> {args.bundle}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
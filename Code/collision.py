@@ -0,0 +1,86 @@
+import pygame
+
+import assets
+
+
+# =====================================================
+#                  COLLISION DETECTION
+# =====================================================
+# Only the rocket can hit something: asteroids, keys, the planet.
+# Checking the rocket against every object in a Python loop is fine for
+# 3 asteroids, but it gets slow in the "asteroid storm" mode with
+# hundreds of them.
+#
+# Every sprite moves its OWN hitbox rectangle in place
+# (hitbox.center = rect.center), so a list of these Rect objects stays
+# correct while things move. A HitboxGroup keeps that list next to its
+# sprites and only changes it when sprites are added or removed.
+#
+# Rect.collidelistall() then tests the rocket against the whole list
+# inside pygame's C code, without a Python loop over the objects.
+# Always with the hitbox rectangles (never the full image rect).
+#
+# (We tried a sort-and-sweep on x first: sorting all objects in Python
+# every step cost more than it saved, see bench_collision.py.)
+#
+# PIXEL-PERFECT MODE (pixel=True, confi.PIXEL_COLLISION)
+# Hitboxes are rectangles, the stones and the rocket are not.
+# In this mode:
+# 1) cheap test: the full image rectangles touch (collidelistall again)
+# 2) exact test, only for those: do non-transparent pixels overlap?
+#    (mask.overlap). The masks come from assets.mask(): one per image,
+#    built once, shared by all sprites with that image.
+
+# rect_hits  -> pairs whose image rectangles touched (pixel mode)
+# mask_hits  -> of these, pairs whose pixels really overlapped
+stats = {"rect_hits": 0, "mask_hits": 0}
+
+
+def pixels_overlap(a, b):
+    # True if the visible pixels of sprite a and sprite b overlap.
+    offset = (b.rect.x - a.rect.x, b.rect.y - a.rect.y)
+    return assets.mask(a.image).overlap(assets.mask(b.image), offset) is not None
+
+
+class HitboxGroup(pygame.sprite.Group):
+    # A sprite group that can quickly tell which of its sprites
+    # touch another sprite. All sprites in it need a .hitbox (and a .rect
+    # for pixel checks; without one the hitbox is used), which they move
+    # in place (never replace them with new Rects).
+
+    def __init__(self, *sprites):
+        # The sprites and their hitboxes, in group order.
+        # Kept up to date when sprites are added or removed.
+        self._sprites = []
+        self._boxes = []
+        self._rects = []
+
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self._sprites.append(sprite)
+        self._boxes.append(sprite.hitbox)
+        self._rects.append(getattr(sprite, "rect", sprite.hitbox))
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        i = self._sprites.index(sprite)
+        del self._sprites[i]
+        del self._boxes[i]
+        del self._rects[i]
+
+    def collide(self, sprite, pixel=False):
+        # Sprites of this group whose hitbox touches sprite.hitbox
+        # (in group order, like a loop over the group would find them).
+        # pixel=True -> sprites whose visible pixels touch sprite's pixels.
+        sprites = self._sprites
+
+        if not pixel:
+            return [sprites[i] for i in sprite.hitbox.collidelistall(self._boxes)]
+
+        near = sprite.rect.collidelistall(self._rects)
+        stats["rect_hits"] += len(near)
+        hits = [sprites[i] for i in near if pixels_overlap(sprite, sprites[i])]
+        stats["mask_hits"] += len(hits)
+        return hits
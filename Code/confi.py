@@ -1,3 +1,70 @@
 WIDTH = 1200
 HEIGHT = 700
-FPS = 60
\ No newline at end of file
+FPS = 60
+
+# Only redraw/update changed areas on still screens
+# (rules, pause screen). False = always flip the whole window.
+DIRTY_RECTS = True
+
+# Simulation steps per second. All speeds are "pixels per step",
+# so the game runs at the same speed even if FPS drops.
+SIM_RATE = 60
+
+# Most simulation steps per drawn frame (a very slow computer
+# slows the game down instead of freezing it).
+MAX_CATCH_UP_STEPS = 5
+
+# Write all player input to a log file in RECORD_DIR
+# (replay a session exactly with: python replay.py <file>).
+# One file per session; only the newest RECORD_KEEP files are kept.
+# Flushed to the disk every RECORD_FLUSH_FRAMES frames (crash-safe up to there).
+RECORD_INPUT = False
+RECORD_DIR = "recordings"
+RECORD_KEEP = 20
+RECORD_FLUSH_FRAMES = 60
+
+# Most killed asteroids/keys/departments kept for reuse (per kind).
+POOL_CAP = 32
+
+# "Asteroid storm" stress mode: STORM_ASTEROIDS asteroids at the same
+# time instead of 3 (for testing collisions/performance, e.g. headless.py --storm).
+ASTEROID_STORM = False
+STORM_ASTEROIDS = 300
+
+# Pixel-perfect collisions: after the rectangles touch, check if
+# non-transparent pixels of the two images overlap (masks).
+# False = only the (smaller) hitbox rectangles are compared.
+PIXEL_COLLISION = False
+
+# Keep asteroids and keys in NumPy arrays instead of sprite objects
+# (one vectorized update/collision/draw for all, see hazards.py).
+# Only used if NumPy is installed; the sprites are the default.
+NUMPY_HAZARDS = False
+
+# Frame profiler (F3 switches it on/off while playing, see profiler.py).
+# PROFILER = True -> measure from the start.
+# The last PROFILE_FRAMES frames are kept and written to PROFILE_CSV on exit.
+PROFILER = False
+PROFILE_FRAMES = 3600
+PROFILE_CSV = "profile.csv"
+
+# Timeline trace of frame phases, image/sound loads, quiz and timers
+# (Chrome trace format, open TRACE_FILE in chrome://tracing or ui.perfetto.dev).
+TRACE = False
+TRACE_FILE = "trace.json"
+
+# Most memory (MB) for decoded rules slides. One full-screen slide
+# needs WIDTH * HEIGHT * 4 bytes (~3.4 MB), see slides.py.
+RULES_MEMORY_MB = 14
+
+# Images scaled in advance by build_assets.py. Used automatically
+# when this folder exists (else the originals are scaled at start).
+BAKED_DIR = "build/assets"
+
+# All baked images in one memory-mapped file (raw pixels, no PNG decoding),
+# written by build_assets.py. Loose files are used when it is missing.
+BUNDLE_FILE = "build/assets.kikopak"
+
+# Worker threads that decode the preloaded images behind the boot
+# screen (see boot.py). 0 = decode one after another in the main thread.
+BOOT_THREADS = 4
@@ -0,0 +1,117 @@
+import pygame
+
+
+# =====================================================
+#                  DIRTY-RECTANGLE SCREEN UPDATES
+# =====================================================
+# pygame.display.flip() copies the WHOLE 1200x700 window to the screen.
+# While the background scrolls that is needed, because every pixel moves.
+#
+# But on "still" screens (rules slides, pause screen)
+# almost nothing changes between two frames. There we can:
+# - skip drawing completely when nothing changed
+# - redraw only the changed area (using a clip rectangle)
+#   and send only that area to the screen with display.update(rect)
+#
+# What counts as "changed"?
+# - a click or key press (the screen may switch page/state)
+# - the window was uncovered (the OS lost our picture)
+# - a tracked object moved (track(), e.g. something animating on a still screen)
+
+# Events after which a still screen is fully redrawn.
+REDRAW_EVENTS = (
+    pygame.MOUSEBUTTONDOWN,
+    pygame.KEYDOWN,
+    pygame.VIDEOEXPOSE,
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWRESTORED,
+)
+
+
+class DirtyScreen:
+
+    def __init__(self, enabled=True):
+        # enabled = False -> always draw everything and flip (old behavior)
+        self.enabled = enabled
+
+        # full = True -> next frame must be completely redrawn
+        self.full = True
+
+        # Changed areas collected for the next frame.
+        self.rects = []
+
+        # Rectangles given to track() last frame.
+        self.tracked = []
+
+        # Was the background scrolling last frame?
+        self.was_scrolling = None
+
+        # changed = False -> the picture is exactly the same as last frame
+        # (the frame pacer uses this to sleep instead of running at 60 FPS)
+        self.changed = True
+
+        # How this frame is presented: "flip", "update" or "skip"
+        self.mode = "flip"
+        self.area = None
+
+        # How many frames were presented in each way.
+        self.stats = {"flip": 0, "update": 0, "skip": 0}
+
+    def invalidate(self):
+        # Force a full redraw on the next frame.
+        self.full = True
+
+    def check_events(self, events):
+        # Any click/key/expose event -> full redraw.
+        for event in events:
+            if event.type in REDRAW_EVENTS:
+                self.full = True
+                return
+
+    def track(self, rects):
+        # Tell the screen where moving objects are THIS frame.
+        # If something moved (or appeared/disappeared), the old and the new
+        # places both need to be redrawn.
+        rects = [pygame.Rect(r) for r in rects]
+        if rects != self.tracked:
+            self.rects.extend(self.tracked)
+            self.rects.extend(rects)
+            self.tracked = rects
+
+    def begin(self, window, scrolling):
+        # Decides how to draw this frame.
+        # Returns False when nothing has to be drawn at all.
+
+        if scrolling != self.was_scrolling:
+            # Switching between moving and still -> draw everything once.
+            self.full = True
+            self.was_scrolling = scrolling
+
+        self.changed = scrolling or self.full or bool(self.rects)
+
+        if not self.enabled or scrolling or self.full:
+            self.mode = "flip"
+            return True
+
+        if self.rects:
+            # Only redraw inside the changed area.
+            self.area = self.rects[0].unionall(self.rects[1:])
+            window.set_clip(self.area)
+            self.mode = "update"
+            return True
+
+        self.mode = "skip"
+        return False
+
+    def present(self, window):
+        # Shows the frame on the screen (the old pygame.display.flip()).
+
+        if self.mode == "flip":
+            pygame.display.flip()
+        elif self.mode == "update":
+            window.set_clip(None)
+            pygame.display.update(self.area)
+
+        self.stats[self.mode] += 1
+        self.full = False
+        self.rects.clear()
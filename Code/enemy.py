@@ -1,9 +1,11 @@
 import pygame
 import confi
+import assets
+from pool import PooledSprite
 
-from random import randint
-# Import randint from the random module.
-# randint(a, b) gives a RANDOM whole number between a and b (including both).
+from rng import rng
+# Import the game's random generator (see rng.py).
+# rng.randint(a, b) gives a RANDOM whole number between a and b (including both).
 
 
 # Komets is an enemy object (asteroid).
@@ -11,7 +13,16 @@ from random import randint
 # - it can live inside a pygame.sprite.Group
 # - it can update itself automatically
 # - it can remove itself from the game
-class Komets(pygame.sprite.Sprite):
+#
+# Comets are pooled (see pool.py): a killed comet is reused for the next one.
+class Komets(PooledSprite):
+
+    # A list of possible asteroid images.
+    # Each comet will randomly choose one of these.
+    asteroids = [
+        'PICS/Enemy/Stone1.png',
+        'PICS/Enemy/Stone2.png'
+    ]
 
     def __init__(self, speed):
         # __init__ is called when a new comet is created.
@@ -21,28 +32,28 @@ class Komets(pygame.sprite.Sprite):
         # This is REQUIRED so pygame knows this object is a real sprite.
         super().__init__()
 
-        # A list of possible asteroid images.
-        # Each comet will randomly choose one of these.
-        self.asteroids = [
-            'PICS/Enemy/Stone1.png',
-            'PICS/Enemy/Stone2.png'
-        ]
+        # The rectangles are created once and reused when the comet is reused.
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.hitbox = pygame.Rect(0, 0, 0, 0)
+
+        self.reset(speed)
+
+    def reset(self, speed):
+        # Puts the comet back to the start (new or reused from the pool).
 
         # ---- IMAGE SETUP ----
-        # randint(0, 1) randomly chooses 0 or 1.
-        # self.stones[...] then selects one of the two image paths.
-        # pygame.image.load(...) loads the image file.
-        # convert_alpha() keeps transparency and makes drawing faster.
-        # scale(...) resizes the image to a fixed size.
-        self.image = pygame.transform.scale(
-            pygame.image.load(self.asteroids[randint(0, 1)]).convert_alpha(),(106, 88))
+        # rng.randint(0, 1) randomly chooses 0 or 1.
+        # self.asteroids[...] then selects one of the two image paths.
+        # assets.image(...) gives us the loaded, converted and scaled picture.
+        # It is loaded from disk only once and then shared by all comets.
+        self.image = assets.image(self.asteroids[rng.randint(0, 1)], (106, 88))
 
         # ---- RECTANGLE (POSITION & SIZE) ----
-        # Create a rectangle around the image.
+        # A rectangle around the image.
         # This rectangle controls position and movement.
-        self.rect = self.image.get_rect()
+        self.rect.size = self.image.get_size()
         self.rect.x = confi.WIDTH
-        self.rect.y = randint(0,620)
+        self.rect.y = rng.randint(0,620)
 
         # ---- MOVEMENT SPEED ----
         # Store how fast the comet moves to the left.
@@ -54,10 +65,11 @@ class Komets(pygame.sprite.Sprite):
         # - width becomes smaller by 15 pixels
         # - height becomes smaller by 65 pixels
         # This makes collisions feel fairer for the player.
-        self.hitbox = self.rect.inflate(-15, -65)
+        self.hitbox.update(self.rect)
+        self.hitbox.inflate_ip(-15, -65)
 
     def update(self):
-        # update() is called EVERY FRAME while the comet exists.
+        # update() is called once per SIMULATION STEP while the comet exists.
         # This controls movement, collision position, and removal.
 
         # Move the comet to the LEFT by "speed" pixels.
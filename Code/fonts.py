@@ -0,0 +1,93 @@
+from collections import OrderedDict
+
+import pygame
+# We need pygame.font to create fonts and render text.
+
+
+# =====================================================
+#                  FONT REGISTRY
+# =====================================================
+# pygame.font.SysFont("Optima", 50) searches the system font folders
+# EVERY time it is called. Doing that every frame is very slow.
+#
+# font(family, size) creates each font only once and then
+# always returns the same object.
+#
+# family=None means pygame's built-in default font
+# (the "PORTED" fonts used for the browser build).
+
+# (family, size) -> pygame.font.Font
+_fonts = {}
+
+
+def font(family, size):
+    key = (family, size)
+
+    f = _fonts.get(key)
+    if f is None:
+        if family is None:
+            f = pygame.font.Font(None, size)
+        else:
+            f = pygame.font.SysFont(family, size)
+        _fonts[key] = f
+
+    return f
+
+
+# =====================================================
+#                  RENDERED TEXT CACHE
+# =====================================================
+# font.render(...) creates a brand new surface every call.
+# Most of our texts ("Start", "Pause!", the department counter, ...)
+# stay the same for many frames, so we keep the rendered surfaces.
+#
+# The cache is an LRU ("least recently used"):
+# when it is full, the text that was not used for the longest time
+# is thrown away. This keeps memory bounded even if many different
+# texts (e.g. quiz questions) are rendered over time.
+
+# Maximum number of rendered texts we keep.
+TEXT_CACHE_SIZE = 256
+
+# (text, font, color, antialias) -> pygame.Surface
+_texts = OrderedDict()
+
+# hits   = text was already rendered
+# misses = text had to be rendered
+stats = {"hits": 0, "misses": 0}
+
+
+def render(text, f, color, antialias=True):
+    # Same as f.render(text, antialias, color), but cached.
+    #
+    # IMPORTANT:
+    # The surface is shared. Only blit it, never draw on it.
+
+    key = (text, f, color, antialias)
+
+    surface = _texts.get(key)
+    if surface is not None:
+        stats["hits"] += 1
+        # Mark as "recently used".
+        _texts.move_to_end(key)
+        return surface
+
+    stats["misses"] += 1
+    surface = f.render(text, antialias, color)
+    _texts[key] = surface
+
+    # Too many texts -> forget the oldest one.
+    if len(_texts) > TEXT_CACHE_SIZE:
+        _texts.popitem(last=False)
+
+    return surface
+
+
+def cache_info():
+    # Small summary for debugging.
+    return {
+        "fonts": len(_fonts),
+        "texts": len(_texts),
+        "hits": stats["hits"],
+        "misses": stats["misses"],
+    }
@@ -0,0 +1,81 @@
+import asyncio
+import sys
+
+import pygame
+
+
+# =====================================================
+#                  FRAME PACER
+# =====================================================
+# clock.tick(60) runs the loop 60 times per second, even when the
+# screen does not change at all (rules slides, pause screen).
+# That wastes CPU on the kiosk.
+#
+# The pacer chooses how to wait at the end of each frame:
+# - something moves      -> clock.tick(60), full frame rate
+# - nothing moves        -> sleep until the next input event
+#                           (pygame.event.wait with a timeout)
+#
+# The browser build (pygbag) must never block, because the page
+# would freeze. There we only lower the frame rate instead.
+#
+# In every case the frame ends with "await asyncio.sleep(0)",
+# so the cooperative async loop keeps working.
+
+BROWSER = sys.platform == "emscripten"
+
+
+class FramePacer:
+
+    def __init__(self, fps=60, idle_timeout_ms=1000, idle_fps=10):
+        # fps             -> frame rate while something animates
+        # idle_timeout_ms -> longest sleep while waiting for input (desktop)
+        # idle_fps        -> frame rate on still screens in the browser
+        self.fps = fps
+        self.idle_timeout_ms = idle_timeout_ms
+        self.idle_fps = idle_fps
+
+        # An event that woke us up from waiting.
+        # It is handed out with the next collect_events().
+        self.pending = []
+
+        # Milliseconds the last frame took, for the simulation (timestep.py).
+        # After an idle wait this is 0: nothing moved while we slept.
+        self.frame_ms = 0
+
+        # How many frames ended "active" / "idle".
+        self.stats = {"active": 0, "idle": 0}
+
+    def collect_events(self):
+        # Use this instead of pygame.event.get() in the main loop,
+        # so the event that ended an idle wait is not lost.
+        events = self.pending + pygame.event.get()
+        self.pending = []
+        return events
+
+    async def wait(self, clock, animating):
+        # Ends the frame.
+        # animating = True  -> something moved, keep the full frame rate
+        # animating = False -> the picture is still, wait for input
+
+        if animating:
+            self.stats["active"] += 1
+            self.frame_ms = clock.tick(self.fps)
+
+        elif BROWSER:
+            self.stats["idle"] += 1
+            clock.tick(self.idle_fps)
+            self.frame_ms = 0
+
+        else:
+            self.stats["idle"] += 1
+            event = pygame.event.wait(self.idle_timeout_ms)
+            if event.type != pygame.NOEVENT:
+                self.pending.append(event)
+
+            # Restart the clock measurement, so the long wait is not
+            # counted as one very slow frame.
+            clock.tick()
+            self.frame_ms = 0
+
+        await asyncio.sleep(0)
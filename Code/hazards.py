@@ -0,0 +1,227 @@
+import pygame
+
+import collision
+
+# NumPy is optional: without it the game uses normal sprite groups.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# =====================================================
+#      HAZARDS IN ARRAYS (OPTIONAL, NEEDS NUMPY)
+# =====================================================
+# Every asteroid and key is a Python object with its own update(),
+# called one by one by Group.update(). That is fine for 3 asteroids,
+# but the cost grows with every object (asteroid storm mode).
+#
+# A HazardArray keeps all objects of one kind in NumPy arrays instead
+# ("structure of arrays": one array per value, one row per object):
+#     x, y, w, h        -> image rectangle
+#     bx, by, bw, bh    -> hitbox
+#     speed             -> pixels per step to the left
+#     px, py            -> position before the last step (interpolation)
+#     img               -> number of the image (in self.images)
+#     alive             -> False = killed, removed in the next update()
+#
+# - update():  all objects move in ONE array operation, the ones that
+#              left the screen are removed with a mask
+# - collide(): the rocket is tested against all hitboxes at once
+# - draw():    one window.blits() call for everything
+#
+# It behaves exactly like the sprite group (same positions, same order,
+# same hits), so replays recorded with sprites also play with arrays.
+# New objects are still made by the pooled Komets/Key classes
+# (same random numbers in the same order): add() copies the sprite's
+# values into the arrays and gives the sprite back to its pool.
+#
+# The game uses it when confi.NUMPY_HAZARDS is True and NumPy is
+# installed (headless.py --numpy). The sprite groups stay the default.
+
+
+def available():
+    # True if NumPy could be imported.
+    return np is not None
+
+
+class Hazard:
+    # A short-lived view of one row, for code that wants sprite-like
+    # objects (autopilot, checksums, collision results).
+    # Only valid until the next update() of its HazardArray.
+    __slots__ = ("store", "row", "rect", "hitbox", "image", "prev_pos")
+
+    def __init__(self, store, row, rect, hitbox, image, prev_pos):
+        self.store = store
+        self.row = row
+        self.rect = rect
+        self.hitbox = hitbox
+        self.image = image
+        self.prev_pos = prev_pos
+
+    def kill(self):
+        # Like Sprite.kill(): the object is gone from now on.
+        self.store.alive[self.row] = False
+
+
+class HazardArray:
+    # Stands in for a HitboxGroup of asteroids or keys:
+    # add, update, len, iterate, collide, draw.
+
+    FIELDS = ("x", "y", "w", "h", "bx", "by", "bw", "bh", "speed", "px", "py", "img")
+
+    def __init__(self, capacity=64):
+        self.n = 0
+        # Rows in use (killed rows included until the next update)
+
+        for name in self.FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=np.int32))
+        self.alive = np.zeros(capacity, dtype=bool)
+
+        self.images = []
+        self._image_numbers = {}
+        # image surface -> its number in self.images
+
+    # ---------- ADDING / REMOVING ----------
+    def _grow(self):
+        # Doubles the space of all arrays.
+        for name in self.FIELDS + ("alive",):
+            old = getattr(self, name)
+            new = np.zeros(len(old) * 2, dtype=old.dtype)
+            new[:self.n] = old[:self.n]
+            setattr(self, name, new)
+
+    def _image_number(self, image):
+        number = self._image_numbers.get(image)
+        if number is None:
+            number = len(self.images)
+            self.images.append(image)
+            self._image_numbers[image] = number
+        return number
+
+    def add(self, sprite):
+        # Takes over a Komets or Key (fresh from its pool).
+        if self.n == len(self.x):
+            self._grow()
+
+        i = self.n
+        self.x[i], self.y[i], self.w[i], self.h[i] = sprite.rect
+        self.bx[i], self.by[i], self.bw[i], self.bh[i] = sprite.hitbox
+        self.px[i], self.py[i] = sprite.rect.topleft
+        self.speed[i] = getattr(sprite, "speed", 3)
+        # (keys have no speed attribute, they always move 3 pixels)
+        self.img[i] = self._image_number(sprite.image)
+        self.alive[i] = True
+        self.n += 1
+
+        sprite.kill()
+        # The values are copied, the sprite goes back to its pool.
+
+    def _compact(self, keep):
+        # Keeps only the rows where "keep" is True (order stays the same).
+        count = int(keep.sum())
+        if count == self.n:
+            return
+        keep = keep.copy()
+        # "keep" may be a view of one of our own arrays (e.g. alive),
+        # which the loop below overwrites -> take a copy first.
+        for name in self.FIELDS + ("alive",):
+            array = getattr(self, name)
+            array[:count] = array[:self.n][keep]
+        self.n = count
+
+    def empty(self):
+        self.n = 0
+
+    # ---------- GROUP-LIKE ----------
+    def __len__(self):
+        return int(self.alive[:self.n].sum())
+
+    def __iter__(self):
+        return iter(self.sprites())
+
+    def sprites(self):
+        # Sprite-like views of all living objects, in order.
+        return self._views(np.flatnonzero(self.alive[:self.n]))
+
+    def _views(self, rows):
+        # Hazard views of these rows (the arrays are read all at once,
+        # not value by value).
+        if not len(rows):
+            return []
+        x, y, w, h, bx, by, bw, bh, px, py, img = (
+            getattr(self, name)[rows].tolist() for name in self.FIELDS if name != "speed"
+        )
+        Rect = pygame.Rect
+        images = self.images
+        return [
+            Hazard(self, row, Rect(x[i], y[i], w[i], h[i]), Rect(bx[i], by[i], bw[i], bh[i]),
+                   images[img[i]], (px[i], py[i]))
+            for i, row in enumerate(rows.tolist())
+        ]
+
+    # ---------- ONE STEP ----------
+    def update(self):
+        # Same as Komets.update() / Key.update() for every object:
+        # move left, center the hitbox, remove when off screen.
+        self._compact(self.alive[:self.n])
+        n = self.n
+        x, w = self.x[:n], self.w[:n]
+
+        x -= self.speed[:n]
+
+        # hitbox.center = rect.center (pygame rounds down, like // here)
+        self.bx[:n] = x + w // 2 - self.bw[:n] // 2
+        self.by[:n] = self.y[:n] + self.h[:n] // 2 - self.bh[:n] // 2
+
+        self._compact(x + w >= 0)
+        # rect.right < 0 -> left the screen
+
+    def snapshot(self):
+        # Remember the current positions (see timestep.snapshot).
+        n = self.n
+        self.px[:n] = self.x[:n]
+        self.py[:n] = self.y[:n]
+
+    # ---------- COLLISIONS ----------
+    def collide(self, sprite, pixel=False):
+        # Like HitboxGroup.collide(): the objects that touch sprite,
+        # in order. The result are Hazard views (they can be killed).
+        n = self.n
+
+        if pixel:
+            # Image rectangles first, then the masks (few candidates)
+            box = sprite.rect
+            x, y, w, h = self.x[:n], self.y[:n], self.w[:n], self.h[:n]
+        else:
+            box = sprite.hitbox
+            x, y, w, h = self.bx[:n], self.by[:n], self.bw[:n], self.bh[:n]
+
+        # Rect.colliderect() for all rows at once
+        touching = (
+            self.alive[:n]
+            & (x < box.right) & (box.left < x + w)
+            & (y < box.bottom) & (box.top < y + h)
+            & (w > 0) & (h > 0)
+        )
+        hits = self._views(np.flatnonzero(touching))
+
+        if pixel:
+            collision.stats["rect_hits"] += len(hits)
+            hits = [hazard for hazard in hits if collision.pixels_overlap(sprite, hazard)]
+            collision.stats["mask_hits"] += len(hits)
+
+        return hits
+
+    # ---------- DRAWING ----------
+    def draw(self, window, alpha=1.0):
+        # All objects with one blits() call, between their previous
+        # and current position (see timestep.draw_pos).
+        rows = np.flatnonzero(self.alive[:self.n])
+        px, py = self.px[rows], self.py[rows]
+        xs = np.rint(px + (self.x[rows] - px) * alpha).astype(int).tolist()
+        ys = np.rint(py + (self.y[rows] - py) * alpha).astype(int).tolist()
+
+        images = self.images
+        window.blits([(images[i], pos) for i, pos in zip(self.img[rows].tolist(), zip(xs, ys))],
+                     doreturn=False)
@@ -0,0 +1,265 @@
+import argparse
+import os
+import random
+import time
+from collections import defaultdict
+
+# No window and no sound: must be set BEFORE pygame is imported.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+import assets
+import fonts
+import Events
+import background
+import hazards
+from rng import rng
+from world import World, STEP_MS
+from Test import Quiz
+from confi import WIDTH, HEIGHT, SIM_RATE, STORM_ASTEROIDS, NUMPY_HAZARDS
+
+
+# =====================================================
+#      HEADLESS RUNNER: PLAY MANY SESSIONS FAST
+# =====================================================
+# Plays complete game sessions without a screen, without sound and
+# without waiting for the clock, to tune spawn rates and health balance.
+#
+# - the same World as main.py (see world.py)
+# - every session gets its own seed -> same seed, same session
+# - the game clock is simulated: one world.step() = 1 / SIM_RATE seconds,
+#   so a 3 minute session takes only as long as the CPU needs
+# - a simple autopilot plays instead of a human
+#
+# Run from the Code folder:
+#     python headless.py --sessions 100 --seed 1
+#     python headless.py --storm          (hundreds of asteroids)
+#     python headless.py --storm --numpy  (the same with hazards.py)
+
+
+# ---------- AUTOPILOT ----------
+class Autopilot:
+    # A simple bot that plays like a careful beginner:
+    # - dodges asteroids that come towards the rocket
+    # - flies to a key when it lost health
+    # - clicks departments and answers the quiz
+    # - flies into the planet at the end
+
+    def __init__(self, world, seed, accuracy=0.7, think_steps=30):
+        # accuracy    -> chance to click the correct quiz answer
+        # think_steps -> steps to wait before each click (reading time)
+        self.world = world
+        self.random = random.Random(seed)
+        # Own random generator, so the bot does not change the game's rng.
+        self.accuracy = accuracy
+        self.think_steps = think_steps
+        self.wait = think_steps
+
+    def click(self, pos):
+        # A left click, like pygame would send it.
+        return pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos)
+
+    def events(self):
+        # Mouse clicks of this step.
+        world = self.world
+        quiz = world.quiz
+
+        if self.wait > 0:
+            self.wait -= 1
+            return []
+
+        if quiz.quiz_active:
+            self.wait = self.think_steps
+
+            if quiz.question_index >= len(quiz.list_of_questions):
+                return [self.click(quiz.continue_rect.center)]
+
+            _, answers, correct = quiz.list_of_questions[quiz.question_index]
+            choice = correct
+            if self.random.random() > self.accuracy:
+                choice = self.random.choice(
+                    [i for i in range(len(answers)) if i != correct] or [correct]
+                )
+            return [self.click(quiz.current_layout().answer_rects[choice].center)]
+
+        if not world.scores.to_planet:
+            for dept in world.departments:
+                # Only departments that stopped and wait for a click
+                if not dept.fly_out and dept.rect.x == dept.stop_x:
+                    self.wait = self.think_steps
+                    return [self.click(dept.rect.center)]
+
+        return []
+
+    def keys(self):
+        # Arrow keys held down in this step.
+        world = self.world
+        rocket = world.rocket
+        pressed = defaultdict(bool)
+
+        target = self.target()
+        threat = self.threat()
+
+        if threat is not None:
+            # Move away from the asteroid (up or down, where there is room)
+            if threat.hitbox.centery > rocket.hitbox.centery and rocket.rect.y > 45:
+                pressed[pygame.K_UP] = True
+            elif rocket.rect.y < 560:
+                pressed[pygame.K_DOWN] = True
+            else:
+                pressed[pygame.K_UP] = True
+            return pressed
+
+        tx, ty = target
+        x, y = rocket.hitbox.center
+        if tx > x + 5:
+            pressed[pygame.K_RIGHT] = True
+        elif tx < x - 5:
+            pressed[pygame.K_LEFT] = True
+        if ty > y + 5:
+            pressed[pygame.K_DOWN] = True
+        elif ty < y - 5:
+            pressed[pygame.K_UP] = True
+        return pressed
+
+    def threat(self):
+        # The nearest asteroid that will hit the rocket soon.
+        rocket = self.world.rocket.hitbox
+        danger = rocket.inflate(20, 40)
+        nearest = None
+
+        for comet in self.world.asteroids:
+            box = comet.hitbox
+            if box.right < rocket.left or box.left > rocket.right + 300:
+                continue
+            if box.bottom < danger.top or box.top > danger.bottom:
+                continue
+            if nearest is None or box.left < nearest.hitbox.left:
+                nearest = comet
+
+        return nearest
+
+    def target(self):
+        # Where the rocket wants to be.
+        world = self.world
+
+        for p in world.planets:
+            return p.hitbox.center
+
+        if world.rocket.health < 3:
+            for key in world.keys:
+                if key.rect.centerx > world.rocket.hitbox.left:
+                    return key.rect.center
+
+        return (300, 400)
+
+
+# ---------- SETUP ----------
+def make_world(numpy_hazards=NUMPY_HAZARDS):
+    # Only what the game needs: a (dummy) window for convert() and fonts.
+    # (replay.py uses this too)
+    # numpy_hazards -> asteroids and keys in NumPy arrays (see hazards.py)
+    pygame.display.init()
+    pygame.font.init()
+    window = pygame.display.set_mode((WIDTH, HEIGHT))
+    assets.preload()
+
+    quiz = Quiz(fonts.font(None, 28), fonts.font(None, 26), fonts.font(None, 22))
+    return World(window, background.Background(), quiz, numpy_hazards)
+
+
+# ---------- ONE SESSION ----------
+def play_session(world, seed, max_steps):
+    rng.seed(seed)
+    world.start_new_session()
+    bot = Autopilot(world, seed)
+
+    result = "timeout"
+    while world.stats["steps"] < max_steps:
+        status = world.handle_events(bot.events())
+        if status == "quit":
+            break
+
+        world.step(bot.keys())
+
+        if not world.scores.game:
+            result = "won" if world.scores.reached_planet else "lost"
+            break
+
+    return {
+        "seed": seed,
+        "result": result,
+        "sim_seconds": world.stats["steps"] * STEP_MS / 1000,
+        "steps": world.stats["steps"],
+        "hits": world.stats["hits"],
+        "heals": world.stats["heals"],
+        "departments": len(world.scores.completed_departments),
+        "score": world.scores.total_correct_answers,
+        "health": world.rocket.health,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play game sessions without a screen.")
+    parser.add_argument("--sessions", type=int, default=10, help="number of sessions")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first session")
+    parser.add_argument("--max-minutes", type=float, default=10,
+                        help="game minutes before a session counts as timeout")
+    parser.add_argument("--storm", action="store_true",
+                        help=f"asteroid storm: {STORM_ASTEROIDS} asteroids at once")
+    parser.add_argument("--pixel", action="store_true",
+                        help="pixel-perfect collisions (masks)")
+    parser.add_argument("--numpy", action="store_true",
+                        help="asteroids and keys in NumPy arrays (hazards.py)")
+    args = parser.parse_args()
+
+    if args.numpy and not hazards.available():
+        raise SystemExit("--numpy needs NumPy (pip install numpy)")
+
+    if args.pixel:
+        Events.Pixel_collision = True
+
+    if args.storm:
+        Events.Max_asteroids = STORM_ASTEROIDS
+        Events.comet_pool.cap = max(Events.comet_pool.cap, STORM_ASTEROIDS)
+
+    world = make_world(args.numpy or NUMPY_HAZARDS)
+
+    max_steps = int(args.max_minutes * 60 * SIM_RATE)
+    results = []
+
+    print(f"{'seed':>6} {'result':>8} {'sim s':>8} {'steps':>7} {'hits':>5} "
+          f"{'heals':>5} {'depts':>5} {'score':>5} {'health':>6}")
+
+    start = time.perf_counter()
+    for n in range(args.sessions):
+        r = play_session(world, args.seed + n, max_steps)
+        results.append(r)
+        print(f"{r['seed']:>6} {r['result']:>8} {r['sim_seconds']:>8.1f} {r['steps']:>7} "
+              f"{r['hits']:>5} {r['heals']:>5} {r['departments']:>5} {r['score']:>5} {r['health']:>6}")
+    elapsed = time.perf_counter() - start
+
+    # ---------- SUMMARY ----------
+    total_steps = sum(r["steps"] for r in results)
+    count = max(len(results), 1)
+    print()
+    for result in ("won", "lost", "timeout"):
+        print(f"{result:>8}: {sum(r['result'] == result for r in results)}")
+    print(f"avg game time: {sum(r['sim_seconds'] for r in results) / count:.1f} s, "
+          f"avg hits: {sum(r['hits'] for r in results) / count:.1f}, "
+          f"avg heals: {sum(r['heals'] for r in results) / count:.1f}")
+    print(f"wall time: {elapsed:.2f} s, {total_steps / max(elapsed, 1e-9):.0f} steps/s "
+          f"({total_steps / SIM_RATE / max(elapsed, 1e-9):.0f}x real time)")
+    for name, p in (("asteroids", Events.comet_pool), ("keys", Events.key_pool),
+                    ("departments", Events.department_pool)):
+        info = p.info()
+        print(f"pool {name}: {info['new']} new, {info['reused']} reused "
+              f"({info['reuse_rate']:.0%}), {info['free']} free")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
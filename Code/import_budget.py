@@ -0,0 +1,116 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+
+# =====================================================
+#      STARTUP BUDGET: IMPORT TIME OF main.py
+# =====================================================
+# Before the boot screen can show anything, Python has to import
+# main.py and everything it imports. This script measures that in a
+# new Python process each time ("python -X importtime -c 'import main'"),
+# the same way the game starts:
+#
+# - own:   our modules (the .py files in this folder), their own time
+# - total: "import main" with everything (pygame, numpy, asyncio, ...)
+#
+# It fails (exit code 1) when
+# - "own" takes longer than --budget milliseconds (median of the runs), or
+# - a game module that main.py should only load after "Start"
+#   (see main.load_game) is imported at startup again.
+#
+# --no-cache also ignores the __pycache__ .pyc files (every module is
+# compiled again, like the very first start after unpacking).
+#
+# Run from the Code folder:
+#     python import_budget.py
+#     python import_budget.py --runs 10 --budget 30 --no-cache
+
+BUDGET_MS = 40.0
+# Default limit for our own modules (median)
+
+LAZY = ("world", "Events", "Test", "enemy", "key", "planet", "Depart",
+        "scores", "spaceship", "hazards", "scheduler")
+# Game modules main.py must NOT import at startup
+
+
+def own_modules():
+    # Names of the modules in this folder.
+    folder = os.path.dirname(os.path.abspath(__file__))
+    return {name[:-3] for name in os.listdir(folder) if name.endswith(".py")}
+
+
+def measure(no_cache=False):
+    # One "import main" in a new process.
+    # Returns {module name: (self microseconds, cumulative microseconds)}.
+    env = dict(os.environ)
+    env["SDL_VIDEODRIVER"] = "dummy"
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+
+    with tempfile.TemporaryDirectory() as cache:
+        if no_cache:
+            env["PYTHONPYCACHEPREFIX"] = cache
+            # An empty folder for .pyc files -> everything is compiled again
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"],
+                                env=env, capture_output=True, text=True, check=True)
+
+    # Lines look like:  "import time:       322 |        322 |       departments_data"
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import time of main.py (startup budget).")
+    parser.add_argument("--runs", type=int, default=5, help="new processes to measure (default 5)")
+    parser.add_argument("--budget", type=float, default=BUDGET_MS,
+                        help=f"most milliseconds for our own modules (default {BUDGET_MS})")
+    parser.add_argument("--no-cache", action="store_true", help="ignore the .pyc files")
+    args = parser.parse_args()
+
+    ours = own_modules()
+    own_ms = []
+    total_ms = []
+    per_module = {}
+
+    for _ in range(args.runs):
+        times = measure(args.no_cache)
+        own_ms.append(sum(t[0] for name, t in times.items() if name in ours) / 1000)
+        total_ms.append(times["main"][1] / 1000)
+        for name, t in times.items():
+            if name in ours:
+                per_module.setdefault(name, []).append(t[0] / 1000)
+
+    own = statistics.median(own_ms)
+    total = statistics.median(total_ms)
+
+    print(f"import main ({args.runs} runs, median):")
+    print(f"  own modules: {own:7.1f} ms   (budget {args.budget:.1f} ms)")
+    print(f"  total:       {total:7.1f} ms   (with pygame, asyncio, ...)")
+    print("  slowest own modules:")
+    slowest = sorted(per_module.items(), key=lambda item: -statistics.median(item[1]))
+    for name, values in slowest[:8]:
+        print(f"    {name:<16} {statistics.median(values):6.2f} ms")
+
+    failed = False
+    eager = sorted(name for name in LAZY if name in per_module)
+    if eager:
+        print(f"FAIL: imported at startup, should wait for 'Start': {', '.join(eager)}")
+        failed = True
+    if own > args.budget:
+        print(f"FAIL: own modules take {own:.1f} ms, budget is {args.budget:.1f} ms")
+        failed = True
+    if not failed:
+        print("OK")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
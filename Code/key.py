@@ -7,9 +7,11 @@ import pygame
 # - drawing on the screen
 
 import confi
+import assets
+from pool import PooledSprite
 
-from random import randint
-# Import randint so we can place the key at a random height.
+from rng import rng
+# Import the game's random generator so we can place the key at a random height.
 
 
 # Key is a Sprite.
@@ -19,7 +21,8 @@ from random import randint
 # - it can remove itself from the game
 #
 # In the game, the Key represents a HEALTH pickup.
-class Key(pygame.sprite.Sprite):
+# Keys are pooled (see pool.py): a collected key is reused for the next one.
+class Key(PooledSprite):
 
     def __init__(self):
         # __init__ is called when a new Key is created.
@@ -29,15 +32,22 @@ class Key(pygame.sprite.Sprite):
         # This is REQUIRED so pygame treats this object as a real sprite.
         super().__init__()
 
+        # The rectangles are created once and reused when the key is reused.
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.hitbox = pygame.Rect(0, 0, 0, 0)
+
+        self.reset()
+
+    def reset(self):
+        # Puts the key back to the start (new or reused from the pool).
+
         # ---- IMAGE ----
-        # Load the key image from file.
-        # scale(...) resizes the image to 106x88 pixels.
-        # (Transparency is already fine here, so convert_alpha is optional.)
-        self.image = pygame.transform.scale(
-            pygame.image.load("PICS/Stats/key.png").convert_alpha(),(106, 88))
+        # Get the key image (106x88 pixels) from the shared asset cache.
+        # All keys use the same surface, so nothing is loaded from disk here.
+        self.image = assets.image("PICS/Stats/key.png", (106, 88))
 
         # ---- RECTANGLE (POSITION & SIZE) ----
-        # Create a rectangle around the image.
+        # A rectangle around the image.
         #
         # center=(x, y) places the CENTER of the key at:
         # - x = bg.WIDTH  -> start just at the right edge of the screen
@@ -46,16 +56,18 @@ class Key(pygame.sprite.Sprite):
         # This makes the key:
         # - fly in from the right
         # - appear at different vertical positions
-        self.rect = self.image.get_rect(center=(confi.WIDTH, randint(118, 620)))
+        self.rect.size = self.image.get_size()
+        self.rect.center = (confi.WIDTH, rng.randint(118, 620))
 
         # ---- HITBOX ----
-        # Create a smaller collision box for the key.
+        # A smaller collision box for the key.
         # inflate(-20, -20) makes the hitbox smaller than the image.
         # This makes collecting the key feel fair and pleasant.
-        self.hitbox = self.rect.inflate(-20, -20)
+        self.hitbox.update(self.rect)
+        self.hitbox.inflate_ip(-20, -20)
 
     def update(self):
-        # update() is called every frame while the key exists.
+        # update() is called once per simulation step while the key exists.
         # It controls movement, collision position, and removal.
 
         # Move the key to the LEFT by 3 pixels.
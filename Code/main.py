@@ -1,17 +1,75 @@
 import asyncio
+import os
+import time
 import pygame
 import background
-import Events
-from spaceship import Spaceship               #  rocket
-from Test import Quiz                 # Quiz overlay
-from sound import music
-from scores import Scores             # Health / progress / win-lose logic + restart button
-from start_screen import StartScreen, RulesScreen  # Menu screens
-from departments_data import Departments           # To know how many departments exist
-from confi import WIDTH, HEIGHT
+import assets
+import fonts
+from sound import music, load_sounds
+from start_screen import StartScreen, RulesScreen, PauseScreen  # Menu screens
+from dirty_screen import DirtyScreen    # Partial screen updates on still screens
+from frame_pacer import FramePacer      # Full frame rate only while something moves
+import timestep                         # Fixed-rate updates + smooth drawing
+from recording import Recorder          # Input log for exact replays (replay.py)
+from profiler import FrameProfiler, ProfilerOverlay  # Where the frame time goes (F3)
+import tracing                          # Timeline of slow frames (chrome://tracing)
+from boot import BootScreen             # Progress bar while loading
+from rng import rng
+from confi import WIDTH, HEIGHT, FPS, SIM_RATE, MAX_CATCH_UP_STEPS, DIRTY_RECTS
+from confi import RECORD_INPUT, RECORD_DIR, RECORD_KEEP, RECORD_FLUSH_FRAMES
+from confi import PROFILER, PROFILE_FRAMES, PROFILE_CSV
+from confi import TRACE, TRACE_FILE, BOOT_THREADS
+
+# =====================================================
+#            GAME WORLD (LOADED ON "START")
+# =====================================================
+# The menu, rules and boot screen do not need the game modules
+# (Events, world, sprites, scores, quiz, ...). They are imported and
+# created when "Start" is clicked the first time, so the menu is
+# there sooner (python import_budget.py shows the import times).
+
+def load_game(window, background, profiler):
+    with tracing.span("load game", "boot"):
+        from world import World       # Rocket, scores, sprites, quiz: the running game
+        from Test import Quiz         # Quiz overlay
+
+        # QUIZ SETUP (FONTS + QUIZ OBJECT)
+
+        #font_big = pygame.font.SysFont("Optima", 28)
+        # Used for question titles and results header.
+
+        #font_medium = pygame.font.SysFont("Optima", 26)
+        # Used for question titles and results header.
+
+        #font_small = pygame.font.SysFont("Optima", 22)
+        # Used for answers and smaller text.
+        # PORTED FONTS
+        # (None = pygame's built-in font, taken from the shared font registry)
+        font_big = fonts.font(None, 28)
+        font_medium = fonts.font(None, 26)
+        font_small = fonts.font(None, 22)
+
+        test_screen = Quiz(font_big, font_medium, font_small)
+        # Quiz overlay object.
+
+        world = World(window, background, test_screen)
+        # The game itself: rocket, scores, asteroids, departments, keys, planet.
+        # See world.py.
+
+        world.profiler = profiler
+        # The world measures its update/collision time in the main profiler.
+    return world
+
 
 async def run():
 
+    started = time.perf_counter()
+    # Startup times (first frame, interactive) are measured from here.
+
+    if TRACE:
+        tracing.start(TRACE_FILE)
+        # From here on, loads, frame phases, quiz and timers are traced.
+
     pygame.init()
 
     pygame.display.set_caption("KikoGame")
@@ -23,6 +81,19 @@ async def run():
     icon = pygame.image.load("PICS/New Hero, Rocket/last planet.png")
     pygame.display.set_icon(icon)
 
+    # BOOT SCREEN
+    # A progress bar at once, instead of a black window while loading.
+    # Steps: every preloaded image, menus, music, sounds.
+    # (the label under the bar names the step that just finished)
+    boot = BootScreen(window, started, steps=assets.preload_count() + 3)
+
+    # PRELOAD IMAGES
+    # Decode and scale every sprite image once, now that the window exists.
+    # After this, spawning asteroids/keys/departments never touches the disk.
+    # (decoded in BOOT_THREADS worker threads, converted here, see assets.py)
+    for path in assets.preload_steps(BOOT_THREADS):
+        await boot.advance(path)
+
     #CLOCK (FPS CONTROL)
     clock = pygame.time.Clock()
     # Clock helps  limit the game to a constant FPS (frames per second)
@@ -33,21 +104,6 @@ async def run():
     cosmos_picture_background = background.Background()
     # Background object that scrolls the space image
 
-    rocket = Spaceship(window)
-    # The rocket/player object.
-    #  pass "window" because Spaceship draws itself onto this window in rocket.update().
-
-    scores = Scores(window)
-    # Handles health display, visited department counter,
-    # win text, lose text, and restart button
-
-    #CREATE SPRITE GROUPS
-
-    asteroids = pygame.sprite.Group()       # Asteroids
-    departments = pygame.sprite.Group()       # Departments
-    keys = pygame.sprite.Group()    # Healing keys
-    AIity = pygame.sprite.Group()       # Final planet
-
     # MENU SCREENS
 
     start_screen = StartScreen()
@@ -56,6 +112,27 @@ async def run():
     rules_screen = RulesScreen()
     # The screen that shows rule images (slides)
 
+    pause_screen = PauseScreen()
+    # Overlay shown on top of the frozen game while paused
+
+    await boot.advance("menus")
+
+    screen = DirtyScreen(enabled=DIRTY_RECTS)
+    # Decides each frame if we flip the whole window,
+    # update only the changed area, or skip drawing (nothing changed).
+
+    pacer = FramePacer(fps=FPS)
+    # Runs at full FPS while something moves,
+    # and waits for input while the screen is still.
+
+    sim = timestep.FixedTimestep(rate=SIM_RATE, max_steps=MAX_CATCH_UP_STEPS)
+    # Updates the world SIM_RATE times per second, independent of the FPS.
+
+    recorder = Recorder(RECORD_DIR, enabled=RECORD_INPUT, keep=RECORD_KEEP,
+                        flush_frames=RECORD_FLUSH_FRAMES)
+    # Writes every input of the game world to a log file,
+    # so a session reported from a kiosk can be replayed exactly.
+
 
     #STATE MACHINE, logic of the change between inputs
     state = "menu"
@@ -63,144 +140,50 @@ async def run():
     # "menu"  -> show start buttons
     # "rules" -> show rules slides
     # "game"  -> actual gameplay
+    # "pause" -> gameplay frozen, waiting for SPACE
 
     rules_completed = False
     # Start button should be disabled until user finished rules slides.
     # When rules are done,  set rules_completed = True.
 
-    # QUIZ SETUP (FONTS + QUIZ OBJECT)
+    world = None
+    # The game itself: rocket, scores, asteroids, departments, keys, planet.
+    # Made by load_game() when "Start" is clicked the first time.
 
-    #font_big = pygame.font.SysFont("Optima", 28)
-    # Used for question titles and results header.
+    profiler = FrameProfiler(enabled=PROFILER, frames=PROFILE_FRAMES)
+    # Time of every part of a frame (F3 shows the table, see profiler.py).
+    overlay = ProfilerOverlay(profiler)
 
-    #font_medium = pygame.font.SysFont("Optima", 26)
-    # Used for question titles and results header.
-
-    #font_small = pygame.font.SysFont("Optima", 22)
-    # Used for answers and smaller text.
-    # PORTED FONTS
-    font_big = pygame.font.Font(None, 28)
-    font_medium = pygame.font.Font(None, 26)
-    font_small = pygame.font.Font(None, 22)
+    #! Test
+    music()
 
+    await boot.advance("music")
 
+    load_sounds()
+    # Decode all sound effects once, before the first collision can happen.
 
-    test_screen = Quiz(font_big, font_medium, font_small)
-    # Quiz overlay object.
+    await boot.advance("sounds")
 
-    active_house = None
-    # Stores the department sprite the player clicked.
-    # after quiz finishes we must remove THIS department.
-    #! Test
-    music()
     # keep track of whether music is currently paused or not.
     # This prevents calling pause/unpause repeatedly each frame.
     music_paused_for_quiz = False
 
-    # RESET GAME WORLD OBJECTS
-    def reset_world():
-        # This clears all moving objects and resets hero to start position.
-
-        asteroids.empty()
-        # Remove all asteroids from the game.
-
-        departments.empty()
-        # Remove all departments from the game.
-
-        keys.empty()
-        # Remove all keys from the game.
-
-        AIity.empty()
-        # Remove planet from the game.
-
-        rocket.health = 3
-        # Reset hero health to full.
-
-        rocket.rect.center = (600, 400)
-        # Move hero to the starting position
-
-        rocket.hitbox.center = rocket.rect.center
-        # Keep the hitbox aligned with the hero rectangle
-
-        test_screen.close_quiz()
-        # If quiz was open, close it
-
-    #START = NEW SESSION (RESET EVERYTHING)
-    def start_game_new_session():
-        nonlocal active_house
-        # nonlocal means: we want to modify the variable active_house from the outer run() function.
-
-        reset_world()
-        # Clear all objects and reset hero.
-
-        scores.game = True
-        # Game is running again.
-
-        scores.game_over = False
-        # Not in "game over" state.
-
-        scores.to_planet = False
-        # Not in planet phase yet.
-
-        scores.reached_planet = False
-        # Not reached planet yet.
-
-        # NEW session means: reset progress completely.
-        scores.completed_departments = set()
-        # Remove all remembered completed departments.
-
-        scores.total_correct_answers = 0
-        # Reset total score across departments.
-
-        active_house = None
-        # No department currently active.
-
-        Events.init_events()
-        # Starts timers:
-        # - first department appears after 10 seconds
-        # - keys appear every 10 seconds
-
-
-    # RESTART = CONTINUE PROGRESS (KEEP COMPLETED DEPARTMENTS)
-
-    def restart_run_keep_departments():
-        nonlocal active_house
-
-        reset_world()
-        # Clear asteroids, keys, planet, etc. and reset hero.
-
-        scores.game = True
-        # Game runs again.
-
-        scores.game_over = False
-        # Not game over anymore.
-
-        scores.reached_planet = False
-        # Planet not reached yet.
-
-        # Restart keeps progress, so departments already completed are NOT repeated.
-        scores.to_planet = (len(scores.completed_departments) >= len(Departments))
-        # If all departments are already completed,  go directly into planet phase.
-
-        active_house = None
-        # Reset current department pointer.
-
-        Events.init_events()
-        # Restart timers again.
-
-        # If we are already in planet phase:
-        # - stop the department timer
-        # - schedule the planet spawn
-        if scores.to_planet:
-            pygame.time.set_timer(Events.Department_fly_in, 0)  # stop department spawning
-            pygame.time.set_timer(Events.AIity_fly_in, 0)      # clear possible old planet timer
-            Events.schedule_planet_spawn()                     # spawn planet after delay
-
     # MAIN GAME LOOP (RUNS FOREVER)
     running = True
+    frame = 0
     while running:
-        events = pygame.event.get()
+        events = pacer.collect_events()
         # Get all events
+        # (including the one that woke the pacer up from an idle wait)
+        profiler.lap("events")
+
+        frame += 1
+        recorder.frame(frame, pacer.frame_ms,
+                       playing=state in ("game", "pause") and world.scores.game)
+        # (frames are only logged while a session is played)
+
+        resumed = False
+        # True when the pause ended in this frame
 
         # A) MENU / RULES INPUT
         for event in events:
@@ -208,6 +191,9 @@ async def run():
             if event.type == pygame.QUIT:
                 running = False
 
+            # F3 -> profiler and its table on/off
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                profiler.toggle()
 
 
             # MENU STATE INPUT
@@ -223,8 +209,15 @@ async def run():
                         state = "rules"
 
                     elif action == "start":
+                        if world is None:
+                            world = load_game(window, cosmos_picture_background, profiler)
+
                         # Start is only possible after rules_completed == True.
-                        start_game_new_session()
+                        seed = int.from_bytes(os.urandom(4), "little")
+                        rng.seed(seed)
+                        recorder.new_session(seed)
+                        # A new random seed for every session (kept in the log)
+                        world.start_new_session()
                         state = "game"
 
 
@@ -241,16 +234,27 @@ async def run():
                         # Return to menu
                         state = "menu"
 
+            # PAUSE STATE INPUT
+            elif state == "pause":
+                # SPACE continues the game
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+                    state = "game"
+                    resumed = True
+                    world.resume_after_pause()
+                    recorder.resume()
+                    sim.reset()
+                    # Forget the time spent in pause,
+                    # so the world does not jump forward.
+
         # B) GAME EVENTS (ONLY IF STATE == "game")
-        if state == "game":
-            #  Events.py process gameplay events:
-            # - spawn departments/keys
+        # (not in the frame the pause ended: that SPACE press would pause again)
+        if state == "game" and not resumed:
+            #  World / Events.py process gameplay events:
             # - pause
             # - quiz clicks
             # - restart click
-            status, active_house = Events.handle_events(
-                events, window, clock, departments, keys, scores, test_screen, active_house, AIity
-            )
+            recorder.events(events)
+            status = world.handle_events(events)
 
             # If Events tells us to quit, exit run()
             if status == "quit":
@@ -258,7 +262,14 @@ async def run():
 
             # If Events tells us restart clicked, restart but keep departments
             if status == "restart":
-                restart_run_keep_departments()
+                world.restart_keep_departments()
+
+            # If Events tells us SPACE was pressed, show the pause screen
+            # (Events already stopped the timers)
+            if status == "pause":
+                state = "pause"
+
+        profiler.lap("input")
 
         # C) MUSIC CONTROL DURING QUIZ
 
@@ -266,22 +277,63 @@ async def run():
         # So pause music when quiz becomes active,
         # and unpause it when quiz closes again.
 
-        if state == "game" and test_screen.quiz_active and not music_paused_for_quiz:
+        in_game = state in ("game", "pause")
+
+        if in_game and world.quiz.quiz_active and not music_paused_for_quiz:
             pygame.mixer.music.pause()
             # Pause the currently playing background music.
             music_paused_for_quiz = True
             # Remember that we paused it, so we don't pause again every frame.
 
-        if (state != "game" or not test_screen.quiz_active) and music_paused_for_quiz:
+        if (not in_game or not world.quiz.quiz_active) and music_paused_for_quiz:
             pygame.mixer.music.unpause()
             # Resume music when quiz is not active.
             music_paused_for_quiz = False
 
-        # D) DRAW EVERYTHING
-        if state == "menu":
-            # Draw moving background behind the menu for a nice effect
-            cosmos_picture_background.update()
-            cosmos_picture_background.render(window)
+        # D) STILL OR MOVING SCREEN?
+        # The background scrolls in the menu and in the game (also behind
+        # the open quiz and the end screen) -> the whole window is flipped.
+        # The rules slides and the pause screen stand still,
+        # so the screen only has to be redrawn when something changed.
+        scrolling = state in ("menu", "game")
+
+        # E) SIMULATION STEPS
+        # Move the world in fixed steps (SIM_RATE per second),
+        # however long the last frame took. See timestep.py.
+        steps = sim.advance(pacer.frame_ms / 1000)
+
+        for _ in range(steps):
+            # Remember where everything was (for smooth drawing).
+            cosmos_picture_background.snapshot()
+            if world is not None:
+                world.snapshot()
+
+            if state == "menu":
+                # Moving background behind the menu for a nice effect
+                cosmos_picture_background.update()
+
+            elif state == "game":
+                pressed = pygame.key.get_pressed()
+                world.step(pressed)
+                recorder.step(pressed, world)
+
+        profiler.lap("update")
+
+        alpha = sim.alpha
+        # How far we are between the last two steps (0..1).
+
+        screen.check_events(events)
+        # A click or key press may change the page -> redraw everything.
+
+        # F) DRAW EVERYTHING
+        # Nothing moves here, only drawing.
+        drawing = screen.begin(window, scrolling)
+        if not drawing:
+            # Nothing changed on a still screen -> keep the old picture.
+            pass
+
+        elif state == "menu":
+            cosmos_picture_background.render(window, alpha)
 
             # Draw menu buttons
             start_screen.draw(window, start_allowed=rules_completed)
@@ -290,69 +342,48 @@ async def run():
             # Show rules slides
             rules_screen.draw(window)
 
+        elif state == "pause":
+            # Frozen game with the pause overlay on top
+            world.draw_frozen()
+            pause_screen.draw(window)
+
         elif state == "game":
-            # Always draw background first
-            cosmos_picture_background.update()
-            cosmos_picture_background.render(window)
-
-            # Only move departments while the game is running
-            if scores.game:
-                departments.update()
-
-            # Drawing is OK even when game is over (it just shows where they are)
-            departments.draw(window)
-
-
-
-            # GAME is STILL RUNNING
-            if scores.game:
-                # If quiz is open, freeze gameplay (no asteroid damage)
-                if test_screen.quiz_active:
-                    # Only show UI and quiz
-                    scores.show_health(rocket)
-                    scores.visited_departments()
-                    test_screen.draw(window)
-
-                else:
-                    # Normal gameplay logic
-                    rocket.update()
-                    Events.make_comet(asteroids, window)
-                    Events.move_key(window, keys)
-                    Events.collide(rocket, asteroids, keys)
-
-                    # Planet phase objects
-                    AIity.update()
-                    AIity.draw(window)
-
-                    # Check if hero reached planet
-                    Events.collide_with_planet(rocket, AIity, scores)
-
-                    # UI and quiz (quiz not active now, but still safe)
-                    scores.show_health(rocket)
-                    scores.visited_departments()
-                    scores.finish(rocket)
-                    test_screen.draw(window)
-
-
-            # GAME OVER OR WIN SCREEN
-            else:
-                # Even when game ended, planet might still be visible
-                AIity.update()
-                AIity.draw(window)
-
-                # Draw score texts and restart button
-                scores.show_health(rocket)
-                scores.visited_departments()
-                scores.finish(rocket)
-                scores.draw_restart_button()
-
-        # E) FINAL DISPLAY UPDATE + FPS LIMIT
-        pygame.display.flip()
-        # Show everything we drew this frame.
-
-        clock.tick(60)
-        # Limit the loop to ~60 frames per second.
-        await asyncio.sleep(0)
+            # Game world, UI, quiz, end screen (see world.py)
+            world.draw(alpha)
+
+        if profiler.enabled:
+            # The profiler table on top (a new one twice a second,
+            # the screen must then be redrawn to show it)
+            if overlay.update():
+                screen.invalidate()
+            if drawing:
+                overlay.draw(window)
+
+        profiler.lap("draw")
+
+        # G) FINAL DISPLAY UPDATE + FPS LIMIT
+        screen.present(window)
+        # Show what we drew this frame:
+        # the whole window (flip) or only the changed area.
+        profiler.lap("present")
+
+        if frame == 1:
+            # The first menu frame is on the screen: startup is over.
+            boot.interactive()
+
+        await pacer.wait(clock, animating=screen.changed)
+        # Limit the loop to ~60 frames per second while something moves.
+        # On a still screen, sleep until the next click/key instead.
+        # (This also does "await asyncio.sleep(0)" for the browser build.)
+        profiler.lap("wait")
+        profiler.end_frame(world.counts() if world is not None else ())
+    recorder.close()
+    rows = profiler.export_csv(PROFILE_CSV)
+    if rows:
+        print(f"profiler: {rows} frames written to {PROFILE_CSV}")
+    if TRACE:
+        tracing.stop()
+        print(f"trace: {tracing.tracer.stats['events']} events written to {TRACE_FILE}")
     pygame.quit()
 
 
@@ -1,7 +1,8 @@
 import pygame
 # Import pygame.
 # We need this for images, sprites, rectangles, and drawing on the screen.
-import main
+import confi
+import assets
 
 
 
@@ -17,21 +18,16 @@ class Planet(pygame.sprite.Sprite):
         super().__init__()
 
         # ---- PLANET IMAGE ----
-        # Load the planet image from file.
-        # convert_alpha() keeps transparency and optimizes drawing.
-        # scale() resizes the planet to 360x360 pixels.
-        self.image = pygame.transform.scale(
-            pygame.image.load("PICS/New Hero, Rocket/last planet.png").convert_alpha(),
-            (360, 360)
-        )
+        # Get the planet image (360x360 pixels) from the shared asset cache.
+        self.image = assets.image("PICS/New Hero, Rocket/last planet.png", (360, 360))
 
         # ---- RECTANGLE (POSITION & SIZE) ----
         # Create a rectangle with the same size as the image.
         self.rect = self.image.get_rect()
 
         # Start the planet outside the screen on the right side.
-        # bg.WIDTH is the width of the game window.
-        self.rect.x = main.WIDTH
+        # confi.WIDTH is the width of the game window.
+        self.rect.x = confi.WIDTH
 
         # Place the planet vertically near the center of the screen.
         # bg.HEIGHT // 2 is the vertical center.
@@ -53,7 +49,7 @@ class Planet(pygame.sprite.Sprite):
         self.hitbox = self.rect.inflate(-70, -70)
 
     def update(self):
-        # update() is called every frame when the planet is in a sprite group.
+        # update() is called once per simulation step when the planet is in a sprite group.
         # It controls the planet's movement and hitbox updates.
 
         # If the planet has not yet reached its stop position:
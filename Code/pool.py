@@ -0,0 +1,93 @@
+import pygame
+
+
+# =====================================================
+#                  SPRITE POOLS
+# =====================================================
+# Asteroids, keys and departments come and go all the time.
+# Creating a new sprite every time means a new Sprite object, new Rects,
+# new dictionaries... and every killed sprite is garbage that Python's
+# garbage collector has to clean up later (small pauses in long sessions).
+#
+# A pool keeps killed sprites and gives them out again:
+# - pool.acquire(...)  -> a sprite, reused if one is free, else a new one
+#                         (the arguments are the same as for the class)
+# - sprite.kill()      -> the sprite goes back into its pool
+#
+# Pooled classes inherit from PooledSprite and have a reset(...) method
+# with the same arguments as __init__, which puts them back into the
+# "just created" state.
+#
+# The pool keeps at most "cap" free sprites; more are left to the
+# garbage collector.
+
+
+class PooledSprite(pygame.sprite.Sprite):
+
+    pool = None
+    # The pool this sprite belongs to (None = not pooled)
+
+    in_pool = False
+    # True while the sprite waits in the pool
+
+    def kill(self):
+        # Remove from all groups (normal kill) and go back to the pool.
+        super().kill()
+        if self.pool is not None:
+            self.pool.release(self)
+
+
+class Pool:
+
+    def __init__(self, cls, cap=32):
+        # cls -> sprite class (a PooledSprite with reset())
+        # cap -> most free sprites kept
+        self.cls = cls
+        self.cap = cap
+        self.free = []
+
+        # new      -> sprites created
+        # reused   -> sprites taken from the pool
+        # released -> sprites given back
+        # dropped  -> given back while the pool was full
+        self.stats = {"new": 0, "reused": 0, "released": 0, "dropped": 0}
+
+    def acquire(self, *args, **kwargs):
+        if self.free:
+            sprite = self.free.pop()
+            sprite.in_pool = False
+            sprite.reset(*args, **kwargs)
+            sprite.prev_pos = sprite.rect.topleft
+            # Don't slide from where it was last time (see timestep.py)
+            self.stats["reused"] += 1
+            return sprite
+
+        sprite = self.cls(*args, **kwargs)
+        sprite.pool = self
+        self.stats["new"] += 1
+        return sprite
+
+    def release(self, sprite):
+        if sprite.in_pool:
+            # Killed twice -> already back
+            return
+
+        if len(self.free) >= self.cap:
+            self.stats["dropped"] += 1
+            return
+
+        sprite.in_pool = True
+        self.free.append(sprite)
+        self.stats["released"] += 1
+
+    def info(self):
+        # Statistics + how many of all acquired sprites were reused.
+        total = self.stats["new"] + self.stats["reused"]
+        return dict(self.stats, free=len(self.free),
+                    reuse_rate=self.stats["reused"] / total if total else 0.0)
+
+
+def empty(group):
+    # Like group.empty(), but pooled sprites go back to their pool.
+    for sprite in group.sprites():
+        sprite.kill()
@@ -0,0 +1,230 @@
+import csv
+import sys
+import time
+from array import array
+
+import pygame
+
+import fonts
+import tracing
+
+
+# =====================================================
+#                  FRAME PROFILER
+# =====================================================
+# At 60 FPS one frame may take 16.6 ms. Where does that time go?
+#
+# The main loop calls profiler.lap("phase") after each part of a frame.
+# The time since the last lap() is added to that phase:
+#     events    -> pygame.event.get() (pacer.collect_events)
+#     input     -> menu clicks + world.handle_events (Events.handle_events)
+#     update    -> simulation steps (without collisions)
+#     collision -> Events.collide (lap()s inside world.step)
+#     draw      -> drawing the frame (render queue, menus, overlay)
+#     present   -> display.flip() / display.update() (screen.present)
+#     wait      -> clock.tick / idle wait (pacer.wait)
+# end_frame() stores the frame in a ring buffer: the last "frames"
+# frames are kept, older ones are overwritten (fixed memory, no new
+# lists every frame).
+#
+# F3 switches the profiler and its overlay on/off in the game.
+# While it is off, lap() and end_frame() return at once
+# (one attribute check per call).
+#
+# On exit the recorded frames can be written to a CSV file
+# (one row per frame, milliseconds per phase + entity counts).
+#
+# While tracing is on (confi.TRACE, see tracing.py) every lap() is also
+# a bar in the trace timeline, even with the profiler switched off.
+
+PHASES = ("events", "input", "update", "collision", "draw", "present", "wait")
+
+# Counted things per frame (shown in the overlay, written to the CSV)
+COUNTS = ("asteroids", "keys", "departments", "planets", "blits")
+_NO_COUNTS = (0,) * len(COUNTS)
+# (frames without a game world, e.g. the menu)
+
+
+def percentile(sorted_values, p):
+    # Nearest-rank percentile of an already sorted list (p = 0..100).
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+class FrameProfiler:
+
+    def __init__(self, enabled=False, frames=600):
+        # enabled -> measure from the start (else only after toggle())
+        # frames  -> size of the ring buffer (600 = 10 s at 60 FPS)
+        self.enabled = enabled
+        self.size = frames
+
+        # Ring buffer: one array per phase / count, "size" entries each.
+        # Milliseconds as doubles, counts as ints.
+        self.times = [array("d", bytes(8 * frames)) for _ in PHASES]
+        self.counts = [array("l", [0]) * frames for _ in COUNTS]
+
+        self.cursor = 0
+        # Where the next frame is written
+
+        self.recorded = 0
+        # Frames recorded in total (the buffer holds the last "size")
+
+        self._index = {name: i for i, name in enumerate(PHASES)}
+        self._current = [0.0] * len(PHASES)
+        # Milliseconds of the frame that is being measured
+
+        self._last = time.perf_counter()
+        self._frame_start = self._last
+
+    def toggle(self):
+        # Switches measuring on/off. Returns the new state.
+        self.enabled = not self.enabled
+        self._current = [0.0] * len(PHASES)
+        self._last = time.perf_counter()
+        return self.enabled
+
+    def lap(self, phase):
+        # Adds the time since the last lap() to "phase".
+        if not (self.enabled or tracing.tracer.enabled):
+            return
+        now = time.perf_counter()
+        if self.enabled:
+            self._current[self._index[phase]] += (now - self._last) * 1000
+        tracing.complete(phase, "frame", self._last, now)
+        self._last = now
+
+    def end_frame(self, counts=()):
+        # Stores the measured frame (and its counts) in the ring buffer.
+        if tracing.tracer.enabled:
+            # The whole frame as one bar, the phases below it
+            tracing.complete("frame", "frame", self._frame_start, self._last)
+            self._frame_start = self._last
+
+        if not self.enabled:
+            return
+
+        i = self.cursor
+        for phase, ms in enumerate(self._current):
+            self.times[phase][i] = ms
+            self._current[phase] = 0.0
+        for n, value in enumerate(counts or _NO_COUNTS):
+            self.counts[n][i] = value
+
+        self.cursor = (i + 1) % self.size
+        self.recorded += 1
+
+    # ---------- RESULTS ----------
+    def _order(self):
+        # Ring positions of the stored frames, oldest first.
+        if self.recorded < self.size:
+            return range(self.recorded)
+        return [(self.cursor + k) % self.size for k in range(self.size)]
+
+    def summary(self):
+        # phase -> (p50, p95, p99) in milliseconds over the stored frames.
+        # ("frame" = all phases together)
+        order = self._order()
+        result = {}
+        totals = [0.0] * len(order)
+
+        for phase, name in enumerate(PHASES):
+            values = [self.times[phase][i] for i in order]
+            for k, ms in enumerate(values):
+                totals[k] += ms
+            values.sort()
+            result[name] = tuple(percentile(values, p) for p in (50, 95, 99))
+
+        totals.sort()
+        result["frame"] = tuple(percentile(totals, p) for p in (50, 95, 99))
+        return result
+
+    def latest_counts(self):
+        # The counts of the last stored frame.
+        if not self.recorded:
+            return dict.fromkeys(COUNTS, 0)
+        i = (self.cursor - 1) % self.size
+        return {name: self.counts[n][i] for n, name in enumerate(COUNTS)}
+
+    def export_csv(self, path):
+        # Writes the stored frames to a CSV file. Returns the number of rows.
+        # (Not in the browser build: there is no file system to keep it.)
+        if not self.recorded or sys.platform == "emscripten":
+            return 0
+
+        order = self._order()
+        first = self.recorded - len(order)
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("frame",) + tuple(p + "_ms" for p in PHASES) + COUNTS)
+            for k, i in enumerate(order):
+                writer.writerow(
+                    [first + k]
+                    + [f"{self.times[phase][i]:.3f}" for phase in range(len(PHASES))]
+                    + [self.counts[n][i] for n in range(len(COUNTS))]
+                )
+        return len(order)
+
+
+# =====================================================
+#                  PROFILER OVERLAY
+# =====================================================
+# A small table below the health icons:
+#     phase   p50   p95   p99   (milliseconds)
+# and the entity counts of the last frame.
+# Rendering text every frame would cost more than what we measure,
+# so the table is only made again every "refresh" frames.
+
+class ProfilerOverlay:
+
+    def __init__(self, profiler, refresh=30):
+        self.profiler = profiler
+        self.refresh = refresh
+        self.font = fonts.font(None, 22)
+        self.image = None
+        self.frames = 0
+
+    def update(self):
+        # Makes a new table every "refresh" frames.
+        # Returns True when the table changed (the screen must be redrawn).
+        self.frames += 1
+        if self.image is not None and self.frames < self.refresh:
+            return False
+        self.frames = 0
+
+        summary = self.profiler.summary()
+        counts = self.profiler.latest_counts()
+
+        # One row per phase: name, then the numbers right-aligned in columns
+        rows = [("phase", "p50", "p95", "p99")]
+        for name in PHASES + ("frame",):
+            rows.append((name,) + tuple(f"{ms:.2f}" for ms in summary[name]))
+
+        font = self.font
+        line = font.get_linesize()
+        columns = (8, 130, 190, 250)
+        # x where each column ENDS (numbers) or starts (names)
+
+        count_text = font.render(
+            "  ".join(f"{name} {value}" for name, value in counts.items()), True, "white")
+        width = max(columns[-1] + 10, count_text.get_width() + 16)
+        height = line * (len(rows) + 1) + 12
+
+        self.image = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.image.fill((0, 0, 0, 170))
+
+        y = 6
+        for row in rows:
+            self.image.blit(font.render(row[0], True, "white"), (columns[0], y))
+            for text, right in zip(row[1:], columns[1:]):
+                cell = font.render(text, True, "white")
+                self.image.blit(cell, (right - cell.get_width(), y))
+            y += line
+        self.image.blit(count_text, (8, y))
+        return True
+
+    def draw(self, window):
+        if self.image is not None:
+            window.blit(self.image, (10, 100))
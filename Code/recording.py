@@ -0,0 +1,314 @@
+import gzip
+import os
+import struct
+import sys
+import time
+import zlib
+from collections import defaultdict
+
+import pygame
+
+from confi import SIM_RATE
+
+
+# =====================================================
+#                  INPUT RECORDING
+# =====================================================
+# Writes down everything the game world gets from outside while a
+# session is played, so the session can be played again exactly
+# (replay.py):
+# - the seed of each new session (all randomness comes from rng.py)
+# - the events handed to world.handle_events() (clicks, keys, quit)
+# - the arrow keys held down in each simulation step
+# - leaving the pause screen
+# - the frame number and how long each frame took (to find spikes)
+#
+# For checking, it also writes:
+# - the game-clock timers that fired (keys, departments, planet)
+# - once per game second, a checksum of the world state
+#
+# The log is binary and gzip-compressed: one record = one tag byte
+# + a few packed numbers. Steps with the same keys are merged into one
+# record, so one minute of play is only a few kilobytes.
+#
+# A kiosk runs for days, so:
+# - every session gets its own file, and only the newest "keep" files
+#   are kept (older ones are deleted)
+# - frames are only written while a session is being played
+#   (not in the menu, the rules or on the end screen)
+# - the file is flushed every "flush_frames" frames: after a crash or
+#   power cut the log can still be read up to the last flush
+
+MAGIC = b"KIKOREC"
+VERSION = 2
+
+# Record layouts (struct format, little endian) by tag
+FRAME = b"F"      # frame number, frame milliseconds
+SESSION = b"N"    # rng seed of a new session
+EVENTS = b"E"     # number of events handed to world.handle_events()
+CLICK = b"C"      #   mouse button, x, y
+KEY = b"K"        #   key code
+QUIT = b"Q"       #   window closed
+RESUME = b"U"     # pause screen closed
+STEPS = b"S"      # arrow key bits, number of steps
+TIMERS = b"T"     # number of timers that fired (followed by their names)
+DIGEST = b"H"     # checksum of the world state
+
+LAYOUT = {
+    FRAME: "<IH",
+    SESSION: "<I",
+    EVENTS: "<B",
+    CLICK: "<Bhh",
+    KEY: "<i",
+    QUIT: "",
+    RESUME: "",
+    STEPS: "<BH",
+    TIMERS: "<B",
+    DIGEST: "<I",
+}
+
+# Arrow keys used by Spaceship.update(), one bit each.
+ARROWS = (pygame.K_RIGHT, pygame.K_LEFT, pygame.K_UP, pygame.K_DOWN)
+
+# Events that world.handle_events() reacts to.
+RECORDED_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN)
+
+
+def key_bits(pressed):
+    # Keyboard state -> small number (bit n = ARROWS[n] held down)
+    bits = 0
+    for n, key in enumerate(ARROWS):
+        if pressed[key]:
+            bits |= 1 << n
+    return bits
+
+
+def pressed_keys(bits):
+    # Small number -> keyboard state that Spaceship.update() understands
+    pressed = defaultdict(bool)
+    for n, key in enumerate(ARROWS):
+        pressed[key] = bool(bits & (1 << n))
+    return pressed
+
+
+def digest(world):
+    # Checksum of everything that decides how the game goes on.
+    # Two runs with the same checksum are in the same state.
+    import Events
+    # (imported here: main.py loads the game modules only after "Start")
+    state = (
+        tuple(world.rocket.rect), world.rocket.health, world.rocket.index,
+        [tuple(s.rect) for s in world.asteroids],
+        [tuple(s.rect) for s in world.keys],
+        [(tuple(s.rect), s.fly_out) for s in world.departments],
+        [tuple(s.rect) for s in world.planets],
+        world.scores.game, world.scores.game_over, world.scores.to_planet,
+        world.scores.reached_planet, sorted(world.scores.completed_departments),
+        world.scores.total_correct_answers,
+        world.quiz.quiz_active,
+        world.quiz.question_index if world.quiz.quiz_active else None,
+        Events.timers.state(),
+    )
+    return zlib.crc32(repr(state).encode())
+
+
+class Recorder:
+
+    def __init__(self, folder, enabled=True, keep=20, flush_frames=60):
+        # folder       -> where the logs are written (one file per session)
+        # enabled      -> False = record nothing (and never touch the disk)
+        # keep         -> most log files kept in the folder
+        # flush_frames -> frames between two flushes to the disk
+        # The browser build has no useful disk, so it never records.
+        self.folder = folder
+        self.enabled = enabled and sys.platform != "emscripten"
+        self.keep = keep
+        self.flush_frames = flush_frames
+
+        self.file = None
+        self.path = None
+
+        self.unflushed = 0
+        # Frames since the last flush (only counted while something was written)
+        self.written = False
+        # Something was written since the last flush
+
+        # Steps are merged while the keys stay the same: [bits, count]
+        self.run = None
+
+    def _write(self, tag, *values):
+        self.file.write(tag + struct.pack(LAYOUT[tag], *values))
+        self.written = True
+
+    def _flush_steps(self):
+        if self.run:
+            self._write(STEPS, *self.run)
+            self.run = None
+
+    def new_session(self, seed):
+        # A new session starts with this rng seed -> a new log file.
+        if not self.enabled:
+            return
+
+        self.close()
+        os.makedirs(self.folder, exist_ok=True)
+        name = time.strftime("session-%Y%m%d-%H%M%S") + f"-{seed}.kikorec.gz"
+        self.path = os.path.join(self.folder, name)
+        self.file = gzip.open(self.path, "wb")
+        self.file.write(MAGIC + struct.pack("<BH", VERSION, SIM_RATE))
+        self._remove_old()
+
+        self._write(SESSION, seed)
+
+    def _remove_old(self):
+        # Deletes the oldest logs, so at most "keep" stay in the folder.
+        # (the names start with the date and time -> sorted = oldest first)
+        logs = sorted(name for name in os.listdir(self.folder) if name.endswith(".kikorec.gz"))
+        for name in logs[:max(0, len(logs) - self.keep)]:
+            try:
+                os.remove(os.path.join(self.folder, name))
+            except OSError:
+                pass
+
+    def frame(self, number, frame_ms, playing=True):
+        # Start of a drawn frame.
+        # playing -> a session is being played right now (only then the
+        #            frame is written; menu and end screen frames are not)
+        if self.file is None:
+            return
+        if playing:
+            self._flush_steps()
+            self._write(FRAME, number, min(int(frame_ms), 0xFFFF))
+
+        if self.written:
+            self.unflushed += 1
+            if self.unflushed >= self.flush_frames:
+                self.flush()
+
+    def flush(self):
+        # Writes everything so far to the disk (readable after a crash).
+        if self.file is None:
+            return
+        self._flush_steps()
+        self.file.flush()
+        # (gzip: a "sync flush", the data so far can be decompressed)
+        self.unflushed = 0
+        self.written = False
+
+    def events(self, events):
+        # Events handed to world.handle_events() in this frame.
+        if self.file is None:
+            return
+
+        events = [e for e in events if e.type in RECORDED_EVENTS][:255]
+        if not events:
+            return
+
+        self._flush_steps()
+        self._write(EVENTS, len(events))
+        for e in events:
+            if e.type == pygame.MOUSEBUTTONDOWN:
+                self._write(CLICK, e.button, *e.pos)
+            elif e.type == pygame.KEYDOWN:
+                self._write(KEY, e.key)
+            else:
+                self._write(QUIT)
+
+    def resume(self):
+        # The pause screen was closed (Events.resume_after_pause).
+        if self.file is None:
+            return
+        self._flush_steps()
+        self._write(RESUME)
+
+    def step(self, pressed, world):
+        # Called after each world.step(pressed).
+        if self.file is None:
+            return
+
+        bits = key_bits(pressed)
+        if self.run and self.run[0] == bits and self.run[1] < 0xFFFF:
+            self.run[1] += 1
+        else:
+            self._flush_steps()
+            self.run = [bits, 1]
+
+        if world.fired:
+            self._flush_steps()
+            self._write(TIMERS, len(world.fired))
+            for name in world.fired:
+                self.file.write(struct.pack("<H", name))
+
+        if world.stats["steps"] % SIM_RATE == 0 and world.scores.game:
+            # (not on the end screen: nothing to check there)
+            self._flush_steps()
+            self._write(DIGEST, digest(world))
+
+    def close(self):
+        if self.file is None:
+            return
+        self._flush_steps()
+        self.file.close()
+        self.file = None
+        self.unflushed = 0
+        self.written = False
+
+
+def read(path):
+    # Reads a log written by Recorder.
+    # Yields (tag, values) in the order they were written:
+    #   (EVENTS, [pygame events])  (TIMERS, [timer names])
+    #   all others: (tag, tuple of numbers)
+    # A log that was cut off (game crashed, power lost) is read
+    # up to the last complete record.
+    with gzip.open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not an input recording")
+
+        version, rate = struct.unpack("<BH", f.read(3))
+        if version != VERSION:
+            raise ValueError(f"{path}: unknown recording version {version}")
+        if rate != SIM_RATE:
+            raise ValueError(f"{path} was recorded with SIM_RATE {rate}, not {SIM_RATE}")
+
+        def unpack(tag):
+            fmt = LAYOUT[tag]
+            return struct.unpack(fmt, f.read(struct.calcsize(fmt)))
+
+        try:
+            while True:
+                tag = f.read(1)
+                if not tag:
+                    return
+
+                if tag == EVENTS:
+                    (count,) = unpack(EVENTS)
+                    events = []
+                    for _ in range(count):
+                        kind = f.read(1)
+                        if kind == CLICK:
+                            button, x, y = unpack(CLICK)
+                            events.append(pygame.event.Event(
+                                pygame.MOUSEBUTTONDOWN, button=button, pos=(x, y)))
+                        elif kind == KEY:
+                            (key,) = unpack(KEY)
+                            events.append(pygame.event.Event(pygame.KEYDOWN, key=key))
+                        elif kind == QUIT:
+                            events.append(pygame.event.Event(pygame.QUIT))
+                        else:
+                            raise ValueError(f"{path}: broken event record {kind!r}")
+                    yield tag, events
+
+                elif tag == TIMERS:
+                    (count,) = unpack(TIMERS)
+                    yield tag, list(struct.unpack(f"<{count}H", f.read(2 * count)))
+
+                elif tag in LAYOUT:
+                    yield tag, unpack(tag)
+
+                else:
+                    raise ValueError(f"{path}: broken record {tag!r}")
+
+        except (EOFError, struct.error):
+            # Cut off in the middle of a record
+            return
@@ -0,0 +1,111 @@
+# =====================================================
+#                  FRAME RENDER QUEUE
+# =====================================================
+# The game used to draw in many places, each with its own blit calls:
+# background, departments, rocket, asteroids, keys, planet,
+# health icons, progress, end texts, quiz overlay...
+#
+# Now they all hand their (surface, position) pairs to ONE queue,
+# together with a LAYER (what is drawn on top of what).
+# Once per frame, flush() sorts the pairs by layer and draws everything
+# with a single window.blits() call.
+#
+# So there is one place that knows how many blits and how many pixels
+# a frame costs (stats).
+#
+# Every layer has a small "target" object with the same blit()/blits()
+# methods as a Surface. The drawing code does not need to change:
+# it gets queue.layer(HUD) instead of the window and blits onto it.
+#
+#     queue = RenderQueue(window)
+#     background.render(queue.layer(BACKGROUND), alpha)
+#     scores.show_health(...)      (Scores got queue.layer(HUD))
+#     queue.flush()
+
+# Layers, from back to front.
+# Pairs in the same layer are drawn in the order they were added.
+BACKGROUND = 0
+DEPARTMENTS = 10
+ROCKET = 20
+HAZARDS = 30        # asteroids, keys
+PLANET = 40
+HUD = 50            # health, progress, end texts, restart button
+QUIZ = 60
+
+
+class LayerTarget:
+    # Looks like a Surface for blit()/blits(), but only collects the
+    # pairs for one layer of the queue.
+
+    def __init__(self, pairs):
+        self.pairs = pairs
+
+    def blit(self, surface, position):
+        self.pairs.append((surface, position))
+
+    def blits(self, pairs, doreturn=True):
+        # (doreturn is accepted like Surface.blits, nothing is returned:
+        #  the pairs are drawn later, in flush())
+        self.pairs.extend(pairs)
+
+
+class RenderQueue:
+
+    def __init__(self, window):
+        self.window = window
+
+        self._layers = {}
+        # layer number -> list of (surface, position) for this frame
+
+        self._targets = {}
+        # layer number -> its LayerTarget (made once, reused every frame)
+
+        # Last frame:  blits -> surfaces drawn
+        #              pixels -> pixels really drawn (after clipping)
+        # Totals over all frames in "total_..." and "frames".
+        self.stats = {"frames": 0, "blits": 0, "pixels": 0,
+                      "total_blits": 0, "total_pixels": 0}
+
+    def layer(self, number):
+        # A blit target for this layer.
+        target = self._targets.get(number)
+        if target is None:
+            pairs = self._layers.setdefault(number, [])
+            target = LayerTarget(pairs)
+            self._targets[number] = target
+        return target
+
+    def submit(self, surface, position, layer):
+        # Adds one (surface, position) pair to a layer.
+        self.layer(layer).blit(surface, position)
+
+    def flush(self):
+        # Draws everything collected this frame, back to front,
+        # with one blits() call, and empties the queue.
+        pairs = []
+        for number in sorted(self._layers):
+            layer = self._layers[number]
+            pairs.extend(layer)
+            layer.clear()
+            # (clear(), not a new list: the LayerTarget keeps this list)
+
+        drawn = self.window.blits(pairs)
+        # blits() returns the rectangle that was really changed for
+        # every pair (cut to the window and the clip rectangle).
+
+        pixels = sum(r.width * r.height for r in drawn)
+        stats = self.stats
+        stats["frames"] += 1
+        stats["blits"] = len(pairs)
+        stats["pixels"] = pixels
+        stats["total_blits"] += len(pairs)
+        stats["total_pixels"] += pixels
+
+    def info(self):
+        # Average blits and pixels per frame.
+        frames = max(self.stats["frames"], 1)
+        return {
+            "frames": self.stats["frames"],
+            "blits_per_frame": self.stats["total_blits"] / frames,
+            "pixels_per_frame": self.stats["total_pixels"] / frames,
+        }
@@ -0,0 +1,127 @@
+import argparse
+import time
+
+import pygame
+
+# Sets up the dummy video/audio drivers before pygame opens anything.
+from headless import make_world
+
+import recording
+from rng import rng
+from confi import SIM_RATE, NUMPY_HAZARDS
+
+
+# =====================================================
+#      REPLAY A RECORDED SESSION
+# =====================================================
+# Plays an input log (written by main.py, see recording.py) again,
+# without a screen and as fast as the CPU allows.
+#
+# The log is fed through the same code as in the real game:
+# world.handle_events() for clicks/keys, world.step() with the recorded
+# arrow keys. Because the rng seed is in the log too, the world ends up
+# in exactly the same state. This is checked on the way:
+# - the game-clock timers must fire in the same steps
+# - the world checksums (one per game second) must match
+#
+# It also lists the slowest frames of the recorded session,
+# and the replay speed can be compared between versions
+# (--repeat runs the log several times for steadier timings).
+#
+# Run from the Code folder:
+#     python replay.py recordings/session-....kikorec.gz
+
+
+class Desync(Exception):
+    # The replay does not match the recording anymore.
+    pass
+
+
+def replay(world, path):
+    # Plays one log. Returns statistics.
+    # Raises Desync when the world state differs from the recording.
+    stats = {"steps": 0, "frames": 0, "sessions": 0, "checks": 0, "spikes": []}
+
+    for tag, values in recording.read(path):
+
+        if tag == recording.FRAME:
+            number, frame_ms = values
+            stats["frames"] += 1
+            stats["spikes"].append((frame_ms, number))
+
+        elif tag == recording.SESSION:
+            rng.seed(values[0])
+            world.start_new_session()
+            stats["sessions"] += 1
+
+        elif tag == recording.EVENTS:
+            status = world.handle_events(values)
+            # "pause" needs nothing here: the steps simply stop until RESUME
+            if status == "restart":
+                world.restart_keep_departments()
+            elif status == "quit":
+                break
+
+        elif tag == recording.RESUME:
+            world.resume_after_pause()
+
+        elif tag == recording.STEPS:
+            bits, count = values
+            pressed = recording.pressed_keys(bits)
+            for _ in range(count):
+                world.step(pressed)
+            stats["steps"] += count
+
+        elif tag == recording.TIMERS:
+            if world.fired != values:
+                raise Desync(f"step {stats['steps']}: timers {world.fired}, recorded {values}")
+
+        elif tag == recording.DIGEST:
+            if recording.digest(world) != values[0]:
+                raise Desync(f"step {stats['steps']}: world state differs from the recording")
+            stats["checks"] += 1
+
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded game sessions without a screen.")
+    parser.add_argument("logs", nargs="+", help="recording files (.kikorec.gz)")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="play every log this many times (for timing)")
+    parser.add_argument("--spikes", type=int, default=5,
+                        help="how many of the slowest recorded frames to list")
+    parser.add_argument("--numpy", action="store_true",
+                        help="asteroids and keys in NumPy arrays (hazards.py)")
+    args = parser.parse_args()
+
+    world = make_world(args.numpy or NUMPY_HAZARDS)
+    failed = 0
+
+    for path in args.logs:
+        try:
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                stats = replay(world, path)
+            elapsed = (time.perf_counter() - start) / args.repeat
+        except Desync as e:
+            print(f"{path}: DESYNC at {e}")
+            failed += 1
+            continue
+
+        steps = stats["steps"]
+        print(f"{path}: OK ({stats['sessions']} sessions, {stats['frames']} frames, "
+              f"{steps} steps = {steps / SIM_RATE:.1f} s game time, {stats['checks']} checks)")
+        print(f"  replay: {elapsed * 1000:.1f} ms, {steps / max(elapsed, 1e-9):.0f} steps/s")
+
+        slowest = sorted(stats["spikes"], reverse=True)[:args.spikes]
+        if slowest:
+            print("  slowest recorded frames: "
+                  + ", ".join(f"#{number} {ms} ms" for ms, number in slowest))
+
+    pygame.quit()
+    raise SystemExit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
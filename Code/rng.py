@@ -0,0 +1,21 @@
+import random
+
+
+# =====================================================
+#                  GAME RANDOMNESS
+# =====================================================
+# All random decisions of the game (asteroid speed, picture and height,
+# key height) use this ONE random generator instead of the global
+# random module.
+#
+# Why?
+# If we give it the same seed, the game makes exactly the same
+# "random" decisions again. headless.py uses this to play
+# reproducible test sessions.
+#
+# Usage:
+#     from rng import rng
+#     rng.randint(4, 6)
+#
+# rng.seed(1234) starts a new, repeatable sequence.
+rng = random.Random()
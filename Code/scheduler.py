@@ -0,0 +1,151 @@
+import heapq
+import itertools
+
+
+# =====================================================
+#                  GAME-CLOCK SCHEDULER
+# =====================================================
+# Runs functions after a delay, counted in GAME time (milliseconds):
+# the clock only moves when advance() is called, once per simulation step.
+# So headless runs and replays (much faster than real time) get their
+# keys, departments and planet at exactly the same game moment.
+#
+# Why not pygame.time.set_timer?
+# - it counts real time, and its events go through the SDL event queue
+# - stopping it forgets how much time had already passed
+#   (after a quiz every timer started from zero again)
+#
+# Here:
+# - pause() stops the clock for all timers, resume() goes on
+#   with the time that was left
+# - every timer has a name; scheduling a name again replaces the old timer
+#   (like set_timer did for one event type)
+#
+# The timers are kept in a heap (sorted by due time), so the next timer
+# is always at heap[0]:
+# - schedule: O(log n)
+# - cancel:   O(1), the timer is only marked; marked timers are dropped
+#             when they reach the top, or all at once when they are
+#             more than half of the heap
+# - advance:  O(log n) per timer that fires
+
+
+class Timer:
+    __slots__ = ("due", "seq", "name", "callback", "interval", "cancelled")
+
+    def __init__(self, due, seq, name, callback, interval):
+        self.due = due              # game time (ms) when it fires
+        self.seq = seq              # tie-breaker: same due time -> first scheduled first
+        self.name = name
+        self.callback = callback
+        self.interval = interval    # 0 = fire once, else repeat every "interval" ms
+        self.cancelled = False
+
+    def __lt__(self, other):
+        return (self.due, self.seq) < (other.due, other.seq)
+
+
+class Scheduler:
+
+    def __init__(self):
+        self.now = 0.0
+        # Game time in milliseconds (only moves in advance()).
+
+        self.paused = False
+
+        self._heap = []
+        self._named = {}
+        # name -> its active Timer
+
+        self._seq = itertools.count()
+        self._cancelled = 0
+        # Marked (cancelled) timers still in the heap
+
+        self.stats = {"scheduled": 0, "fired": 0, "cancelled": 0}
+
+    def schedule(self, name, delay, callback, interval=0):
+        # Calls callback() after "delay" ms of game time.
+        # interval > 0 -> then again every "interval" ms, until cancelled.
+        self.cancel(name)
+
+        timer = Timer(self.now + delay, next(self._seq), name, callback, interval)
+        heapq.heappush(self._heap, timer)
+        self._named[name] = timer
+        self.stats["scheduled"] += 1
+        return timer
+
+    def cancel(self, name):
+        # Stops the timer with this name (nothing happens if there is none).
+        timer = self._named.pop(name, None)
+        if timer is None:
+            return
+
+        timer.cancelled = True
+        self._cancelled += 1
+        self.stats["cancelled"] += 1
+
+        if self._cancelled > len(self._heap) // 2:
+            # Mostly dead timers -> rebuild the heap without them
+            self._heap = [t for t in self._heap if not t.cancelled]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+
+    def remaining(self, name):
+        # Milliseconds until the timer fires (None = no such timer).
+        timer = self._named.get(name)
+        if timer is None:
+            return None
+        return timer.due - self.now
+
+    def pause(self):
+        # Stops the clock. All timers keep the time they have left.
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+    def clear(self):
+        # Removes all timers and starts the clock at 0 again (new session).
+        # (Same start -> same rounding -> replays fire in the same steps.)
+        self.now = 0.0
+        self._heap = []
+        self._named = {}
+        self._cancelled = 0
+        self.paused = False
+
+    def advance(self, millis):
+        # Moves the clock forward by "millis" and runs every timer that is due.
+        # Returns the names of the timers that fired, in order.
+        if self.paused:
+            return []
+
+        self.now += millis
+        fired = []
+
+        # (self._heap, not a local name: a callback may rebuild the heap)
+        while self._heap and self._heap[0].due <= self.now:
+            timer = heapq.heappop(self._heap)
+
+            if timer.cancelled:
+                self._cancelled -= 1
+                continue
+
+            if timer.interval:
+                timer.due += timer.interval
+                heapq.heappush(self._heap, timer)
+            else:
+                del self._named[timer.name]
+
+            fired.append(timer.name)
+            self.stats["fired"] += 1
+            timer.callback()
+
+        return fired
+
+    def state(self):
+        # (name, ms left, interval) of every active timer, sorted by name.
+        # Used for the replay checksum (see recording.py).
+        return sorted(
+            (name, round(t.due - self.now, 3), t.interval)
+            for name, t in self._named.items()
+        )
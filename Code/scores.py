@@ -1,5 +1,7 @@
 import pygame
 import confi
+import assets
+import fonts
 from departments_data import Departments
 
 
@@ -20,18 +22,14 @@ class Scores:
         # Load the health icon image (gear).
         # convert_alpha() keeps transparency and optimizes drawing.
         # smoothscale() resizes smoothly to look better (less pixelated).
-        self.image_hp = pygame.transform.smoothscale(
-            pygame.image.load("PICS/Stats/gear-cog-setting.png").convert_alpha(),
-            (70, 70)
-        )
+        self.image_hp = assets.image("PICS/Stats/gear-cog-setting.png", (70, 70), smooth=True)
 
         # Load the progress icon that is shown near the number of completed departments.
-        self.image_progress = pygame.transform.smoothscale(
-            pygame.image.load("PICS/Departaments/visited depa.png").convert_alpha(),
-            (132, 90)
-        )
+        self.image_progress = assets.image("PICS/Departaments/visited depa.png", (132, 90), smooth=True)
 
         # Store the window surface so we can draw everything on it.
+        # (In the game this is the HUD layer of the render queue,
+        #  see render_queue.py: it collects the blits for one frame.)
         self.window = window
 
         # -------------------------------
@@ -83,22 +81,22 @@ class Scores:
             80                       # height of the button
         )
 
+        self.restart_image = None
+        # The finished button image (made the first time it is drawn)
+
     def show_health(self, hero):
         # This function draws the health icons (gears) on the screen.
         # It does NOT change health. Health belongs to hero.health.
         # Scores only shows what hero currently has.
 
-        # Start drawing at x = 10 (near the left edge).
-        x = 10
-
-        # For each health point the hero has:
-        # If hero.health = 3 -> loop runs 3 times -> 3 gears drawn.
-        for _ in range(hero.health):
-            # Draw one gear icon at (x, 20)
-            self.window.blit(self.image_hp, (x, 20))
-
-            # Move x to the right so the next gear does not overlap.
-            x += 70
+        # One gear icon per health point, in a row:
+        # the first at x = 10 (near the left edge), then every 70 pixels
+        # to the right so they do not overlap.
+        # If hero.health = 3 -> 3 gears, all handed over in one blits() call.
+        self.window.blits(
+            [(self.image_hp, (10 + 70 * i, 20)) for i in range(hero.health)],
+            doreturn=False
+        )
 
     def visited_departments(self):
         # This function draws how many departments were completed.
@@ -107,13 +105,13 @@ class Scores:
         # Count how many departments are finished.
         count = len(self.completed_departments)
 
-        # Create a font object to draw the number.
-        # SysFont picks a system font by name.
-        font = pygame.font.SysFont("Optima", 50)
+        # Get the font from the font registry.
+        # (It is created only once, not every frame.)
+        font = fonts.font("Optima", 50)
 
         # Turn the number into a text image (surface).
-        # render(text, antialias, color)
-        text = font.render(str(count), True, "white")
+        # fonts.render keeps the image, so the same number is not rendered again.
+        text = fonts.render(str(count), font, "white")
 
         # Draw the progress icon image.
         self.window.blit(self.image_progress, (1000, 20))
@@ -121,17 +119,16 @@ class Scores:
         # Draw the number next to the icon.
         self.window.blit(text, (1110, 10))
 
-    def finish(self, hero):
-        # This function checks if the game should end
-        # and draws the final messages.
+    def check_finish(self, hero):
+        # This function checks if the game should end.
+        # It only changes the switches, it does not draw anything
+        # (it runs in every simulation step).
 
         # -------------------------------
         # WIN CONDITION
         # -------------------------------
         # If reached_planet is True, the player has already won.
-        # We show the win text and stop the game.
         if self.reached_planet:
-            self._draw_win_text()
             self.game = False
             return
 
@@ -140,39 +137,50 @@ class Scores:
         # -------------------------------
         # If hero health is 0 or less, the player lost.
         if hero.health <= 0:
-            self._draw_lose_text()
             self.game = False
             self.game_over = True
 
+    def draw_result(self):
+        # This function draws the final messages.
+        # It only draws: whether the game is won or lost was already
+        # decided by check_finish() in the simulation step
+        # (drawing may happen several times per step, or not at all).
+        if self.reached_planet:
+            # We show the win text.
+            self._draw_win_text()
+        elif self.game_over:
+            # We show the lose text.
+            self._draw_lose_text()
+
     def _draw_lose_text(self):
         # Helper function that draws the "game over" message.
-        # We keep it separate so finish() is easier to read.
+        # We keep it separate so draw_result() is easier to read.
 
-        font = pygame.font.SysFont("Optima", 50)
-        text = font.render("You were not cautious enough", True, "white")
+        font = fonts.font("Optima", 50)
+        text = fonts.render("You were not cautious enough", font, "white")
 
         # Draw it on the screen.
         self.window.blit(text, (275, 330))
 
     def _draw_win_text(self):
         # Helper function that draws the "mission completed" message and the score.
-        # Separate function = less clutter inside finish().
+        # Separate function = less clutter inside draw_result().
 
-        font_big = pygame.font.SysFont("Optima", 40)
-        font_small = pygame.font.SysFont("Optima", 30)
+        font_big = fonts.font("Optima", 40)
+        font_small = fonts.font("Optima", 30)
 
         # First line: winning message.
-        line1 = font_big.render(
+        line1 = fonts.render(
             "Mission completed! You successfully reached AIity",
-            True,
+            font_big,
             "white"
         )
 
         # Second line: show score.
         # f"..." is an f-string: it allows us to insert variables inside text.
-        line2 = font_small.render(
+        line2 = fonts.render(
             f"with a score of: {self.total_correct_answers} / {self.max_answers}",
-            True,
+            font_small,
             "white"
         )
 
@@ -188,18 +196,30 @@ class Scores:
         if not self.game_over:
             return
 
-        # Draw button background (filled rectangle).
-        pygame.draw.rect(self.window, (39, 44, 78), self.restart_rect, border_radius=12)
+        # The button never changes: it is drawn once into its own image,
+        # later it is only blitted (one blit, see render_queue.py).
+        if self.restart_image is None:
+            self.restart_image = self._make_restart_button()
+
+        self.window.blit(self.restart_image, self.restart_rect)
+
+    def _make_restart_button(self):
+        # Draws the restart button into a new transparent image.
+        button = pygame.Surface(self.restart_rect.size, pygame.SRCALPHA)
+        rect = button.get_rect()
+
+        # Button background (filled rectangle).
+        pygame.draw.rect(button, (39, 44, 78), rect, border_radius=12)
 
-        # Draw button border (2 px thickness).
-        pygame.draw.rect(self.window, (255, 255, 255), self.restart_rect, 2, border_radius=12)
+        # Button border (2 px thickness).
+        pygame.draw.rect(button, (255, 255, 255), rect, 2, border_radius=12)
 
-        # Draw button text.
-        font = pygame.font.SysFont("Optima", 40)
-        t = font.render("Start from beginning", True, "white")
+        # Button text, centered inside the button.
+        font = fonts.font("Optima", 40)
+        t = fonts.render("Start from beginning", font, "white")
+        button.blit(t, t.get_rect(center=rect.center))
 
-        # Center the text inside the button rectangle.
-        self.window.blit(t, t.get_rect(center=self.restart_rect.center))
+        return button
 
     def restart_clicked(self, pos):
         # This function checks if the restart button was clicked.
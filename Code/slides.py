@@ -0,0 +1,149 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+import assets
+import tracing
+
+
+# =====================================================
+#      SLIDE LOADER (RULES SCREEN)
+# =====================================================
+# The 16 rules slides are big PNG files (2784x1498). Decoding and
+# scaling all of them when "Assessment rules" is clicked froze the game
+# for more than a second, and afterwards ~50 MB of full-screen images
+# stayed in memory for the rest of the game.
+#
+# The SlideLoader:
+# - decodes only the slide that is needed right now
+# - decodes the next "ahead" slides in a worker thread while the
+#   player reads (load + smoothscale; convert_alpha() stays in the
+#   main thread, it needs the display)
+# - keeps at most "budget" bytes of decoded slides: when a new one
+#   does not fit, the slides already passed (then the farthest ahead)
+#   are dropped
+#
+# The browser build has no threads: there the next slide is decoded
+# when it is shown (still only one at a time).
+
+THREADS = sys.platform != "emscripten"
+
+
+def _decode(path, size):
+    # Worker thread part: file -> scaled surface (not converted yet).
+    with tracing.span("load " + path, "assets"):
+        raw = assets.bundle.raw(path, size, True, True)
+        if raw is not None:
+            # Raw pixels in the bundle: nothing to decode
+            # (converted, i.e. copied, in the main thread)
+            return raw
+        file = assets.baked(path, size, True, True)
+        if file is not None:
+            # Already scaled by build_assets.py
+            return pygame.image.load(file)
+        surface = pygame.image.load(path)
+        return pygame.transform.smoothscale(surface, size)
+
+
+class SlideLoader:
+
+    def __init__(self, paths, size, budget, ahead=2):
+        # paths  -> image files, in slide order
+        # size   -> (width, height) every slide is scaled to
+        # budget -> most bytes of decoded slides kept in memory
+        # ahead  -> how many slides after the current one are prefetched
+        self.paths = paths
+        self.size = size
+        self.slide_bytes = size[0] * size[1] * 4
+        # A converted slide has 4 bytes per pixel (RGBA)
+
+        # At least the current slide must fit
+        self.keep = max(1, budget // self.slide_bytes)
+        self.ahead = min(ahead, self.keep - 1)
+
+        self.ready = {}
+        # slide number -> finished surface
+
+        self.pending = {}
+        # slide number -> Future of a decode in the worker thread
+
+        self.executor = None
+        # Created on first use, ended by close()
+
+        # hits     -> slide was ready when it was shown
+        # waits    -> had to wait for (or decode) the slide right then
+        # dropped  -> slides removed to stay in the budget
+        self.stats = {"hits": 0, "waits": 0, "dropped": 0}
+
+    def __len__(self):
+        return len(self.paths)
+
+    def get(self, index):
+        # The finished slide "index" (decoded now if it is not ready).
+        # Also starts prefetching the slides after it.
+        surface = self.ready.get(index)
+
+        if surface is None:
+            self.stats["waits"] += 1
+            future = self.pending.pop(index, None)
+            if future is not None:
+                scaled = future.result()
+                # Almost done in the worker -> wait for it
+            else:
+                scaled = _decode(self.paths[index], self.size)
+            surface = self._store(index, scaled, index)
+        else:
+            self.stats["hits"] += 1
+
+        self._collect(index)
+        self._prefetch(index)
+        return surface
+
+    def _store(self, index, scaled, current):
+        # Converts a decoded slide and keeps it (within the budget).
+        surface = scaled.convert_alpha()
+        self.ready[index] = surface
+        self._trim(current)
+        return surface
+
+    def _collect(self, current):
+        # Takes over slides the worker has finished in the meantime.
+        for index, future in list(self.pending.items()):
+            if future.done():
+                del self.pending[index]
+                self._store(index, future.result(), current)
+
+    def _prefetch(self, current):
+        # Starts decoding the next slides in the worker thread.
+        if not THREADS:
+            return
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slides")
+
+        for index in range(current + 1, min(current + 1 + self.ahead, len(self.paths))):
+            if index not in self.ready and index not in self.pending:
+                self.pending[index] = self.executor.submit(_decode, self.paths[index], self.size)
+
+    def _trim(self, current):
+        # Drops slides until the budget is kept.
+        # First the slides already passed, then the ones farthest ahead.
+        while len(self.ready) > self.keep:
+            behind = [i for i in self.ready if i < current]
+            index = min(behind) if behind else max(self.ready)
+            del self.ready[index]
+            self.stats["dropped"] += 1
+
+    def memory(self):
+        # Bytes of decoded slides in memory right now.
+        return len(self.ready) * self.slide_bytes
+
+    def close(self):
+        # Forgets all slides (rules finished) and ends the worker thread.
+        for future in self.pending.values():
+            future.cancel()
+        self.pending = {}
+        self.ready = {}
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
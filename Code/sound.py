@@ -2,6 +2,30 @@ import pygame
 # Import pygame.
 # We need pygame here specifically for its sound system (mixer).
 
+from sound_bank import SoundBank, resolve
+import tracing
+# Loading times show up in traces (see tracing.py).
+# The sound bank decodes every effect once and plays it on reserved channels.
+# resolve() picks the right file type (.ogg / .mp3) for this platform.
+
+
+# =========================
+# SOUND EFFECTS (REGISTERED ONCE)
+# =========================
+# Effects are registered without a file extension.
+# priority: a collision is more important than a click or a heal,
+# so it may interrupt them when all channels are busy.
+bank = SoundBank(channels=4)
+bank.add("click", "PICS/Music/Sound_82750500 1634320431", max_voices=1, priority=1)
+bank.add("hit", "PICS/Music/Collision1", max_voices=2, priority=2)
+bank.add("heal", "PICS/Music/Heilung", max_voices=1, priority=1)
+
+
+def load_sounds():
+    # Decode all effects now (called once in main.py after pygame.init()),
+    # so nothing is read from disk at the moment of a collision.
+    bank.load()
+
 
 # =========================
 # BACKGROUND MUSIC
@@ -12,7 +36,8 @@ def music():
 
     # pygame.mixer.music is a special music player in pygame.
     # It is meant for long sounds like background music.
-    pygame.mixer.music.load('PICS/Music/Hintergrund.ogg')
+    with tracing.span("load music", "assets"):
+        pygame.mixer.music.load(resolve('PICS/Music/Hintergrund'))
     # This loads the music file from disk into memory.
     # The file path must exist, otherwise the game will crash.
 
@@ -32,12 +57,8 @@ def music():
 def click_on_depart():
     # This function plays a short sound when the player clicks on a department.
     # It is a sound effect, NOT background music.
-    # pygame.mixer.Sound is used for short sounds (effects).
-    # These sounds can overlap and be played many times.
-    click_on_depart = pygame.mixer.Sound("PICS/Music/Sound_82750500 1634320431.mp3")
-    # Load the sound effect into memory.
-    click_on_depart.play()
-    # Play the sound once immediately.
+    # The sound was already decoded by load_sounds(), so this is instant.
+    bank.play("click")
 
 
 # =========================
@@ -46,12 +67,7 @@ def click_on_depart():
 def hit_cometa():
     # This function plays a sound when the hero is hit by a comet (asteroid).
     # It gives audio feedback that something bad happened.
-
-    hit_cometa = pygame.mixer.Sound("PICS/Music/Collision1.ogg")
-    # Load the collision sound.
-
-    hit_cometa.play()
-    # Play the collision sound once.
+    bank.play("hit")
 
 
 # =========================
@@ -60,7 +76,4 @@ def hit_cometa():
 def heal_rocket():
     # This function plays a sound when the hero collects a health key.
     # It gives positive feedback to the player.
-    heal_rocket = pygame.mixer.Sound("PICS/Music/Heilung.ogg")
-    # Load the healing sound effect.
-    heal_rocket.play()
-    # Play the healing sound once.
+    bank.play("heal")
@@ -0,0 +1,184 @@
+import os
+import sys
+import time
+
+import pygame
+# We need pygame.mixer for sounds and channels.
+
+import tracing
+# Loading times show up in traces (see tracing.py).
+
+
+# =====================================================
+#                  FILE FORMAT PER BACKEND
+# =====================================================
+# The desktop build can decode .ogg and .mp3.
+# The browser build (pygbag, sys.platform == "emscripten") can only use .ogg.
+# Sounds are registered WITHOUT extension and we pick the first file
+# that exists for the current backend.
+if sys.platform == "emscripten":
+    FORMATS = ("ogg",)
+else:
+    FORMATS = ("ogg", "mp3")
+
+
+def resolve(base):
+    # Turns "PICS/Music/Heilung" into "PICS/Music/Heilung.ogg" (or .mp3).
+    for ext in FORMATS:
+        path = f"{base}.{ext}"
+        if os.path.exists(path):
+            return path
+
+    raise FileNotFoundError(f"No {'/'.join(FORMATS)} file for sound '{base}'")
+
+
+# =====================================================
+#                  SOUND BANK
+# =====================================================
+# A SoundBank decodes every sound effect ONCE (at startup)
+# and plays them through a small pool of reserved mixer channels.
+#
+# Why reserved channels?
+# pygame's Sound.play() grabs any free channel, and music or other
+# sounds can take them all. Reserved channels belong only to the bank.
+#
+# Every effect has:
+# - max_voices -> how many copies may play at the same time
+# - priority   -> a more important sound may interrupt a less important one
+#                 when all channels are busy
+class SoundBank:
+
+    def __init__(self, channels=4):
+        # How many mixer channels the bank reserves for itself.
+        self.channel_count = channels
+
+        # name -> settings + decoded pygame.mixer.Sound
+        self.effects = {}
+
+        # The reserved pygame.mixer.Channel objects (filled by load()).
+        self.channels = []
+
+        # For every channel: which effect was started on it,
+        # its priority and when it was started.
+        # None means "nothing was started here yet".
+        self.voices = []
+
+        # Play statistics.
+        # latency = time spent inside play() until the channel is playing.
+        self.stats = {
+            "plays": 0,
+            "dropped": 0,
+            "stolen": 0,
+            "latency_total": 0.0,
+            "latency_max": 0.0,
+        }
+
+    def add(self, name, base, max_voices=1, priority=0, volume=1.0):
+        # Registers an effect. Nothing is decoded yet, see load().
+        self.effects[name] = {
+            "base": base,
+            "max_voices": max_voices,
+            "priority": priority,
+            "volume": volume,
+            "sound": None,
+        }
+
+    def load(self):
+        # Decodes all registered effects and reserves the channels.
+        # Returns False when the mixer is not running (e.g. no audio device).
+
+        if not pygame.mixer.get_init():
+            return False
+
+        # Make sure the mixer has enough channels for us
+        # plus some free ones for everything else.
+        if pygame.mixer.get_num_channels() < self.channel_count + 2:
+            pygame.mixer.set_num_channels(self.channel_count + 2)
+
+        # The first "channel_count" channels now belong only to the bank.
+        pygame.mixer.set_reserved(self.channel_count)
+        self.channels = [pygame.mixer.Channel(i) for i in range(self.channel_count)]
+        self.voices = [None] * self.channel_count
+
+        for effect in self.effects.values():
+            if effect["sound"] is None:
+                with tracing.span("load sound " + effect["base"], "assets"):
+                    effect["sound"] = pygame.mixer.Sound(resolve(effect["base"]))
+                effect["sound"].set_volume(effect["volume"])
+
+        return True
+
+    def _pick_channel(self, name, priority):
+        # Chooses the channel index for a new voice of "name".
+        # Returns (index, stolen) or (None, False) if the sound must be dropped.
+
+        free = None
+        own = []       # channels currently playing this effect
+        weaker = []    # channels playing something with lower/equal priority
+
+        for i, channel in enumerate(self.channels):
+            voice = self.voices[i]
+
+            if not channel.get_busy() or voice is None:
+                if free is None:
+                    free = i
+                continue
+
+            if voice[0] == name:
+                own.append(i)
+            if voice[1] <= priority:
+                weaker.append(i)
+
+        # Too many copies of this effect -> restart the oldest copy.
+        if len(own) >= self.effects[name]["max_voices"]:
+            return min(own, key=lambda i: self.voices[i][2]), True
+
+        if free is not None:
+            return free, False
+
+        # All channels busy -> interrupt the oldest weaker sound.
+        if weaker:
+            return min(weaker, key=lambda i: self.voices[i][2]), True
+
+        return None, False
+
+    def play(self, name):
+        # Plays a registered effect. Returns True if it is playing.
+
+        start = time.perf_counter()
+
+        if not self.channels:
+            # Not loaded (or no audio device) -> stay silent.
+            return False
+
+        effect = self.effects[name]
+        index, stolen = self._pick_channel(name, effect["priority"])
+
+        if index is None:
+            self.stats["dropped"] += 1
+            return False
+
+        self.channels[index].play(effect["sound"])
+        self.voices[index] = (name, effect["priority"], start)
+
+        latency = time.perf_counter() - start
+        self.stats["plays"] += 1
+        self.stats["latency_total"] += latency
+        if latency > self.stats["latency_max"]:
+            self.stats["latency_max"] = latency
+        if stolen:
+            self.stats["stolen"] += 1
+
+        return True
+
+    def latency_info(self):
+        # Summary of play() timings in milliseconds.
+        plays = self.stats["plays"]
+        average = self.stats["latency_total"] / plays if plays else 0.0
+        return {
+            "plays": plays,
+            "dropped": self.stats["dropped"],
+            "stolen": self.stats["stolen"],
+            "avg_ms": average * 1000,
+            "max_ms": self.stats["latency_max"] * 1000,
+        }
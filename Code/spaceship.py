@@ -1,44 +1,28 @@
 import pygame
+import timestep
+from animation import from_sheet
 
 class Spaceship:
     def __init__(self, window):
 
-        self.fly_right = [
-            pygame.transform.scale(
-                pygame.image.load('PICS/Player_right/R11.png').convert_alpha(), (230, 150)),
-            pygame.transform.scale(
-                pygame.image.load('PICS/Player_right/R22.png').convert_alpha(), (230, 150)),
-            pygame.transform.scale(
-                pygame.image.load('PICS/Player_right/R33.png').convert_alpha(), (230, 150)),
-            pygame.transform.scale(
-                pygame.image.load('PICS/Player_right/R44.png').convert_alpha(), (230, 150)),
-            pygame.transform.scale(
-                pygame.image.load('PICS/Player_right/R55.png').convert_alpha(), (230, 150)),
-            pygame.transform.scale(
-                pygame.image.load('PICS/Player_right/R66.png').convert_alpha(), (230, 150)),
-        ]
-
-        self.move_left = [
-            pygame.transform.scale(
-                pygame.image.load('PICS/Player_left/L11.png').convert_alpha(), (230, 150)),
-            pygame.transform.scale(
-                pygame.image.load('PICS/Player_left/L22.png').convert_alpha(), (230, 150)),
-            pygame.transform.scale(
-                pygame.image.load('PICS/Player_left/L33.png').convert_alpha(), (230, 150)),
-            pygame.transform.scale(
-                pygame.image.load('PICS/Player_left/L44.png').convert_alpha(), (230, 150)),
-            pygame.transform.scale(
-                pygame.image.load('PICS/Player_left/L55.png').convert_alpha(), (230, 150)),
-            pygame.transform.scale(
-                pygame.image.load('PICS/Player_left/L66.png').convert_alpha(), (230, 150)),
-        ]
+        # Rocket animation clips, 230x150 pixels per frame.
+        # The frames come from one sprite sheet (atlas.py) in the shared
+        # asset cache; flying left = the same frames flipped.
+        #
+        # Each of the 6 frames is shown for 6 steps, but the loop is
+        # 31 steps long (index 0..30, like the old "index // 6" counter),
+        # so the last frame only shows for one step.
+        self.fly_right = from_sheet('PICS/Player_right/rocket.png', (230, 150), steps=6, length=31)
+        self.move_left = from_sheet('PICS/Player_right/rocket.png', (230, 150), steps=6, length=31,
+                                    mirrored=True)
 
         # Store the game window so the hero can draw itself later.
         self.window = window
 
         # Set the starting image (first right-facing frame).
         self.index = 0
-        self.image = self.fly_right[self.index]
+        # Animation step (see the clips above)
+        self.image = self.fly_right.frame(self.index)
 
         # Create a rectangle around the image.
         # The rectangle is used for position and movement.
@@ -52,41 +36,40 @@ class Spaceship:
         # This makes collisions fairer (not the full image size).
         self.hitbox = self.rect.inflate(0, -100)
 
-        # Speed of the hero (pixels per frame).
+        # Speed of the hero (pixels per simulation step).
         self.speed = 3
 
         # Health points (lives).
         self.health = 3
 
-    def update(self):
-        # update() is called every frame while the game runs.
+    def update(self, pressed=None):
+        # update() is called once per simulation step while the game runs.
+        # pressed -> keyboard state to use instead of the real keyboard
+        #            (headless test runs and replays pass their own).
         # It handles:
         # - movement
         # - animation
-        # - drawing
         # - hitbox updates
+        # Drawing is done separately in draw().
 
         # ---- ANIMATION DEFAULT ----
         # NOTE (Tiny note #2):
         # This sets a default animation frame every frame.
         # If no key is pressed, the rocket still animates gently.
         #
-        # self.index // 6 explanation (Tiny note #1):
-        # index goes from 0 to 30.
-        # Dividing by 6 gives values from 0 to 5.
-        # That matches the 6 images in move_right / move_left.
-        # This slows down animation so it doesn't change every frame.
-        self.image = self.fly_right[self.index // 6] #default direction
+        # The clip knows which frame belongs to the animation step
+        # (see animation.py), so it doesn't change every frame.
+        self.image = self.fly_right.frame(self.index) #default direction
 
         # Get the current state of all keyboard keys.
         # keys[pygame.K_RIGHT] is True if the RIGHT arrow is held down.
-        arrow = pygame.key.get_pressed()
+        arrow = pressed if pressed is not None else pygame.key.get_pressed()
 
         # ---- MOVE RIGHT ----
         # If RIGHT arrow is pressed and the hero is not too far right:
         if arrow[pygame.K_RIGHT] and self.rect.x < 700:
             # Use right-facing animation
-            self.image = self.fly_right[self.index // 6]
+            self.image = self.fly_right.frame(self.index)
             # Move hero to the right
             self.rect.x += self.speed
 
@@ -94,7 +77,7 @@ class Spaceship:
         # If LEFT arrow is pressed and hero is not too far left:
         if arrow[pygame.K_LEFT] and self.rect.x > 0:
             # Use left-facing animation
-            self.image = self.move_left[self.index // 6]
+            self.image = self.move_left.frame(self.index)
             # Move hero to the left
             self.rect.x -= self.speed
 
@@ -110,18 +93,16 @@ class Spaceship:
             self.rect.y += self.speed
 
         # ---- ANIMATION COUNTER ----
-        # Increase animation index to move to the next frame.
-        # 0 → 30 gives a smooth loop.
-        if self.index < 30:
-            self.index += 1
-        else:
-            # Reset index to loop animation again.
-            self.index = 0
-
-        # ---- DRAW HERO ----
-        # Draw the current image at the hero's position.
-        self.window.blit(self.image, self.rect)
+        # Move to the next animation step.
+        # 0 → 30, then back to 0, gives a smooth loop.
+        self.index = self.fly_right.next(self.index)
 
         # ---- UPDATE HITBOX ----
         # Keep hitbox centered on the hero.
         self.hitbox.center = self.rect.center
+
+    def draw(self, alpha=1.0):
+        # Draw the current image at the hero's position.
+        # alpha (0..1) places the hero between its last two positions,
+        # so the movement looks smooth at any frame rate (see timestep.py).
+        self.window.blit(self.image, timestep.draw_pos(self, alpha))
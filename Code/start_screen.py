@@ -1,5 +1,8 @@
 import pygame
 import confi
+import assets
+import fonts
+from slides import SlideLoader
 
 # We import MMain
 # This file contains WIDTH and HEIGHT of the game window.
@@ -27,8 +30,9 @@ class StartScreen:
         # We use two sizes:
         # - a bigger one for button titles
         # - a smaller one for helper text
-        self.font_btn = pygame.font.SysFont("Optima", 44)
-        self.font_btn_small = pygame.font.SysFont("Optima", 24)
+        # They come from the font registry, so they are shared with the rest of the game.
+        self.font_btn = fonts.font("Optima", 44)
+        self.font_btn_small = fonts.font("Optima", 24)
 
         # ----- BUTTON SIZE -----
         # These numbers define how big our buttons are.
@@ -64,12 +68,8 @@ class StartScreen:
         # IMPORTANT:
         # convert_alpha() needs a window to exist,
         # so this class must be created AFTER set_mode() in Main.
-        self.logo = pygame.image.load(
-            'PICS/Player_right/LOGO.png'
-        ).convert_alpha()
-
-        # Resize the logo so it fits nicely on screen.
-        self.logo = pygame.transform.smoothscale(self.logo, (950, 300))
+        # The logo is resized so it fits nicely on screen.
+        self.logo = assets.image('PICS/Player_right/LOGO.png', (950, 300), smooth=True)
 
     def draw(self, window, start_allowed=False):
         # draw() is called every frame while the menu is visible.
@@ -113,7 +113,7 @@ class StartScreen:
             )
 
             # Draw the text "Start"
-            t1 = self.font_btn.render("Start", True, "white")
+            t1 = fonts.render("Start", self.font_btn, "white")
             window.blit(t1, t1.get_rect(center=self.btn_start.center))
 
         else:
@@ -135,8 +135,8 @@ class StartScreen:
             )
 
             # Two lines of text so it fits inside the button
-            line1 = self.font_btn.render("Start", True, (96, 96, 96))
-            line2 = self.font_btn_small.render("(Read the rules first)", True, (96, 96, 96))
+            line1 = fonts.render("Start", self.font_btn, (96, 96, 96))
+            line2 = fonts.render("(Read the rules first)", self.font_btn_small, (96, 96, 96))
 
             window.blit(
                 line1,
@@ -166,7 +166,7 @@ class StartScreen:
             border_radius=18
         )
 
-        t2 = self.font_btn.render("Assessment rules", True, "white")
+        t2 = fonts.render("Assessment rules", self.font_btn, "white")
         window.blit(t2, t2.get_rect(center=self.btn_rules.center))
 
     def handle_click(self, pos, start_allowed=False):
@@ -187,6 +187,28 @@ class StartScreen:
         return None
 
 
+# Image paths of the rules slides, in order
+# (also baked in advance by build_assets.py)
+RULE_IMAGES = [
+    "PICS/Rules/Rules/Ru1.png",
+    "PICS/Rules/Rules/Ru2.png",
+    "PICS/Rules/Rules/Ru3.png",
+    "PICS/Rules/Rules/Ru4.png",
+    "PICS/Rules/Rules/Ru5.png",
+    "PICS/Rules/Rules/Ru6.png",
+    "PICS/Rules/Rules/Ru7.png",
+    "PICS/Rules/Rules/Ru8.png",
+    "PICS/Rules/Rules/Ru9.png",
+    "PICS/Rules/Rules/Ru10.png",
+    "PICS/Rules/Rules/Ru11.png",
+    "PICS/Rules/Rules/Ru12.png",
+    "PICS/Rules/Rules/Ru13.png",
+    "PICS/Rules/Rules/Ru14.png",
+    "PICS/Rules/Rules/Ru15.png",
+    "PICS/Rules/Rules/Ru16.png",
+]
+
+
 # =====================================================
 #                  RULES SCREEN
 # =====================================================
@@ -196,34 +218,20 @@ class RulesScreen:
 
     def __init__(self):
         # Font for the arrow symbol ">"
-        self.font_arrow = pygame.font.SysFont("Gill Sans", 40)
+        self.font_arrow = fonts.font("Gill Sans", 40)
 
         # List of image paths for the rules slides
-        self.rule_images = [
-            "PICS/Rules/Rules/Ru1.png",
-            "PICS/Rules/Rules/Ru2.png",
-            "PICS/Rules/Rules/Ru3.png",
-            "PICS/Rules/Rules/Ru4.png",
-            "PICS/Rules/Rules/Ru5.png",
-            "PICS/Rules/Rules/Ru6.png",
-            "PICS/Rules/Rules/Ru7.png",
-            "PICS/Rules/Rules/Ru8.png",
-            "PICS/Rules/Rules/Ru9.png",
-            "PICS/Rules/Rules/Ru10.png",
-            "PICS/Rules/Rules/Ru11.png",
-            "PICS/Rules/Rules/Ru12.png",
-            "PICS/Rules/Rules/Ru13.png",
-            "PICS/Rules/Rules/Ru14.png",
-            "PICS/Rules/Rules/Ru15.png",
-            "PICS/Rules/Rules/Ru16.png",
-        ]
+        self.rule_images = RULE_IMAGES
 
         # index tells us WHICH rule image is currently shown
         self.index = 0
 
-        # _loaded will store the loaded images
-        # so we don’t load them again and again
-        self._loaded = []
+        # The slides are decoded only when needed (the next ones in the
+        # background), and only a few are kept in memory (see slides.py).
+        self.slides = SlideLoader(
+            self.rule_images, (confi.WIDTH, confi.HEIGHT),
+            budget=confi.RULES_MEMORY_MB * 1024 * 1024
+        )
 
         # Circle button settings
         self.circle_r = 30
@@ -234,12 +242,8 @@ class RulesScreen:
         # Always start at the first slide.
         self.index = 0
 
-        # Load images only once
-        if not self._loaded:
-            for p in self.rule_images:
-                img = pygame.image.load(p).convert_alpha()
-                img = pygame.transform.smoothscale(img, (confi.WIDTH, confi.HEIGHT))
-                self._loaded.append(img)
+        # Decode the first slide now (the next ones follow in the background)
+        self.slides.get(0)
 
     def _circle_hit(self, pos):
         # Checks if the mouse click is inside the circle.
@@ -253,14 +257,14 @@ class RulesScreen:
 
     def draw(self, window):
         # Draw the current rule image
-        window.blit(self._loaded[self.index], (0, 0))
+        window.blit(self.slides.get(self.index), (0, 0))
 
         # Draw the circle button
         pygame.draw.circle(window, (39, 44, 78), self.circle_center, self.circle_r)
         pygame.draw.circle(window, (200, 200, 200), self.circle_center, self.circle_r, 2)
 
         # Draw the arrow inside the circle
-        arrow = self.font_arrow.render(">", True, "white")
+        arrow = fonts.render(">", self.font_arrow, "white")
         window.blit(arrow, arrow.get_rect(center=self.circle_center))
 
     def handle_click(self, pos):
@@ -269,7 +273,34 @@ class RulesScreen:
             self.index += 1
 
             # If all slides were shown, tell Main we are done
-            if self.index >= len(self._loaded):
+            # (and free the slides, they are not needed anymore)
+            if self.index >= len(self.slides):
+                self.slides.close()
                 return "done"
 
         return None
+
+
+# =====================================================
+#                  PAUSE SCREEN
+# =====================================================
+# Drawn on top of the frozen game while the game is paused.
+# The overlay and the text are created once, not every frame.
+class PauseScreen:
+
+    def __init__(self):
+        # Dark blue, semi-transparent overlay
+        self.overlay = pygame.Surface((confi.WIDTH, confi.HEIGHT))
+        self.overlay.set_alpha(150)
+        self.overlay.fill((39, 44, 78))
+
+        self.font = fonts.font("Optima", 50)
+
+    def draw(self, window):
+        window.blit(self.overlay, (0, 0))
+
+        pause_text = fonts.render("Pause! Press SPACE to continue", self.font, "white")
+        window.blit(
+            pause_text,
+            pause_text.get_rect(center=(confi.WIDTH // 2, confi.HEIGHT // 2))
+        )
@@ -0,0 +1,125 @@
+# =====================================================
+#                  TEXT LAYOUT ENGINE
+# =====================================================
+# Breaks long texts (quiz questions and answers) into a fixed number
+# of lines that fit a given width, with "..." when the text is too long.
+#
+# The old quiz code measured the WHOLE candidate line with font.size()
+# for every word it added, and then removed the last character
+# one at a time (again measuring every step) to make room for "...".
+# With long texts that is a lot of font.size() calls.
+#
+# This engine:
+# - measures every word only once per font (word width cache)
+# - adds up word widths to guess where each line breaks,
+#   then checks the guess with one or two real measurements
+# - finds the "..." cut position with a binary search
+# - works for any number of lines
+
+# font -> {word: width in pixels}
+_word_widths = {}
+
+# hits   = word width already known
+# misses = font.size() had to be called
+stats = {"hits": 0, "misses": 0}
+
+
+def word_width(font, word):
+    # Width of one word in pixels, measured once per font.
+    widths = _word_widths.get(font)
+    if widths is None:
+        widths = _word_widths[font] = {}
+
+    w = widths.get(word)
+    if w is None:
+        stats["misses"] += 1
+        w = font.size(word)[0]
+        widths[word] = w
+    else:
+        stats["hits"] += 1
+
+    return w
+
+
+def truncate(text, font, max_width, ellipsis="..."):
+    # Returns the longest start of "text" that still fits together with
+    # the ellipsis, e.g. "A very long sent..." .
+    # Same result as removing one character at a time, but only
+    # about log2(len(text)) font.size() calls.
+
+    if font.size(text + ellipsis)[0] <= max_width:
+        return text + ellipsis
+
+    # Binary search for the biggest "keep" that fits.
+    # low always fits (0 characters = only the ellipsis),
+    # high never fits.
+    low, high = 0, len(text)
+    while high - low > 1:
+        mid = (low + high) // 2
+        if font.size(text[:mid].rstrip() + ellipsis)[0] <= max_width:
+            low = mid
+        else:
+            high = mid
+
+    return text[:low].rstrip() + ellipsis
+
+
+def _fits(font, words, start, count, max_width):
+    # Real width check of words[start:start + count] joined with spaces.
+    return font.size(" ".join(words[start:start + count]))[0] <= max_width
+
+
+def wrap(text, font, max_width, max_lines, sep=None, ellipsis="..."):
+    # Splits "text" into exactly "max_lines" lines (unused lines are "").
+    #
+    # sep      -> how words are split (None = any whitespace, like str.split())
+    # ellipsis -> added to the last line if not all words fit
+    #
+    # A word that does not fit on the current line moves to the next line.
+
+    # Empty "words" (two spaces in a row) never change a line, so drop them.
+    words = [w for w in text.split(sep) if w]
+    lines = [""] * max_lines
+    space = word_width(font, " ")
+
+    i = 0
+    for line_index in range(max_lines):
+        if i >= len(words):
+            break
+
+        # 1) Guess how many words fit by adding up cached word widths.
+        count = 0
+        estimate = -space
+        while i + count < len(words):
+            estimate += space + word_width(font, words[i + count])
+            if estimate > max_width:
+                break
+            count += 1
+
+        # 2) The guess can be a few pixels off (kerning, glyph overhang),
+        #    so correct it with real measurements. Usually 1-2 calls.
+        if count > 0 and not _fits(font, words, i, count, max_width):
+            count -= 1
+            while count > 0 and not _fits(font, words, i, count, max_width):
+                count -= 1
+        else:
+            while i + count < len(words) and _fits(font, words, i, count + 1, max_width):
+                count += 1
+
+        lines[line_index] = " ".join(words[i:i + count])
+        i += count
+
+    # Words left over -> shorten the last line and add the ellipsis.
+    if i < len(words):
+        lines[-1] = truncate(lines[-1], font, max_width, ellipsis)
+
+    return lines
+
+
+def cache_info():
+    return {
+        "fonts": len(_word_widths),
+        "words": sum(len(w) for w in _word_widths.values()),
+        "hits": stats["hits"],
+        "misses": stats["misses"],
+    }
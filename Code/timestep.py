@@ -0,0 +1,95 @@
+import pygame
+
+
+# =====================================================
+#                  FIXED TIMESTEP
+# =====================================================
+# All speeds in the game are "pixels per update"
+# (rocket 3, asteroids 4-6, keys 3, departments/planet 2, background 1).
+# If we update once per drawn frame, a slow computer that only reaches
+# 40 FPS makes the whole game 1.5x slower (and easier).
+#
+# Instead we update the world at a FIXED rate (SIM_RATE times per second),
+# no matter how fast we draw:
+# - every frame we add the real time that passed to an "accumulator"
+# - while the accumulator holds at least one step, we run one update
+# - what is left over (alpha, 0..1) tells us how far we are between
+#   the last two updates, so drawing can place things in between
+#   (interpolation = smooth movement even if FPS != SIM_RATE)
+#
+# If the computer is far too slow, we would need more and more updates
+# per frame and never catch up ("spiral of death").
+# max_steps limits the updates per frame; the rest of the time is dropped
+# (the game then slows down a bit instead of freezing).
+
+class FixedTimestep:
+
+    def __init__(self, rate=60, max_steps=5):
+        # rate      -> updates per second
+        # max_steps -> most updates we run in one frame
+        self.step = 1.0 / rate
+        self.max_steps = max_steps
+
+        # Real time (seconds) not yet simulated.
+        self.accumulator = 0.0
+
+        # How often we had to drop time because of max_steps.
+        self.stats = {"steps": 0, "capped_frames": 0}
+
+    def advance(self, dt):
+        # dt = real seconds since the last frame.
+        # Returns how many updates to run this frame.
+
+        self.accumulator += dt
+        steps = int(self.accumulator / self.step)
+
+        if steps > self.max_steps:
+            # Too far behind -> run the maximum and forget the rest.
+            steps = self.max_steps
+            self.accumulator = 0.0
+            self.stats["capped_frames"] += 1
+        else:
+            self.accumulator -= steps * self.step
+
+        self.stats["steps"] += steps
+        return steps
+
+    @property
+    def alpha(self):
+        # 0.0 = draw at the previous update, 1.0 = at the latest one.
+        return min(self.accumulator / self.step, 1.0)
+
+    def reset(self):
+        # Forget unsimulated time (after a pause, a long wait, ...).
+        self.accumulator = 0.0
+
+
+# =====================================================
+#                  INTERPOLATION HELPERS
+# =====================================================
+# Before every update we remember where each object was (prev_pos).
+# When drawing, we place it between prev_pos and its current rect.
+
+def snapshot(objects):
+    # Remember the current top-left corner of every object.
+    # objects can be a sprite group or a list (e.g. [rocket]).
+    for obj in objects:
+        obj.prev_pos = obj.rect.topleft
+
+
+def draw_pos(obj, alpha):
+    # Position to draw "obj" at, between prev_pos and rect.
+    # Objects created in the last update have no prev_pos yet.
+    x, y = obj.rect.topleft
+    px, py = getattr(obj, "prev_pos", (x, y))
+    return (round(px + (x - px) * alpha), round(py + (y - py) * alpha))
+
+
+def draw_rect(obj, alpha):
+    # The rectangle "obj" is drawn into (used for dirty-rectangle tracking).
+    return pygame.Rect(draw_pos(obj, alpha), obj.rect.size)
+
+
+def draw_group(window, group, alpha):
+    # Like group.draw(window), but at interpolated positions.
+    window.blits([(s.image, draw_pos(s, alpha)) for s in group], doreturn=False)
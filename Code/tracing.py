@@ -0,0 +1,215 @@
+import json
+import os
+import queue
+import sys
+import threading
+import time
+
+
+# =====================================================
+#          TIMELINE TRACING (CHROME TRACE FORMAT)
+# =====================================================
+# The profiler (profiler.py) gives percentiles: HOW OFTEN frames are slow.
+# A trace shows WHAT happened in one slow frame: a timeline with a bar
+# for every frame phase, image/sound load, quiz open/close and timer.
+#
+# The file is a Chrome "trace event" JSON file. Open it in
+# chrome://tracing or https://ui.perfetto.dev
+#
+#     with tracing.span("load PICS/...png", "assets"):
+#         ...                                    -> one bar ("X" event)
+#     tracing.complete("draw", "frame", start, end)  -> bar from two times
+#     tracing.instant("quiz open", "quiz")           -> one mark ("i" event)
+#
+# Writing JSON to disk in the middle of a frame would make exactly the
+# hitches we want to find. So events are only appended to a list in memory;
+# every FLUSH_EVENTS events the full list is handed to a background thread
+# that writes it to the file.
+# (The browser build has no threads: there everything is written at the end.)
+#
+# Switched off (the default, confi.TRACE), span() gives back one shared
+# do-nothing object and the other functions return at once.
+
+FLUSH_EVENTS = 2000
+# Events collected before they are handed to the writer thread
+
+THREADS = sys.platform != "emscripten"
+
+
+class _NoSpan:
+    # What span() gives back while tracing is off.
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+class _Span:
+    __slots__ = ("name", "cat", "start")
+
+    def __init__(self, name, cat):
+        self.name = name
+        self.cat = cat
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        complete(self.name, self.cat, self.start, time.perf_counter())
+        return False
+
+
+class Tracer:
+
+    def __init__(self):
+        self.enabled = False
+        self.path = None
+        self.events = []
+        self.origin = time.perf_counter()
+        # Timestamps are microseconds since start()
+
+        self._file = None
+        self._queue = None
+        self._writer = None
+        self._first = True
+        # No "," before the first event in the file
+
+        self._lock = threading.Lock()
+
+        self.stats = {"events": 0, "flushes": 0}
+
+    def start(self, path):
+        # Starts tracing into a new file.
+        if self.enabled:
+            return
+        self.path = path
+        self.origin = time.perf_counter()
+        self.events = []
+        self._first = True
+
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self._file = open(path, "w")
+        self._file.write("[\n")
+
+        if THREADS:
+            self._queue = queue.Queue()
+            self._writer = threading.Thread(target=self._write_loop, name="trace-writer",
+                                            daemon=True)
+            self._writer.start()
+
+        self.enabled = True
+        self.metadata("process_name", {"name": "KikoGame"})
+
+    def stop(self):
+        # Writes everything that is left and closes the file.
+        if not self.enabled:
+            return
+        self.enabled = False
+        self._hand_over()
+
+        if self._writer is not None:
+            self._queue.put(None)
+            # None = "no more events", the writer thread ends
+            self._writer.join()
+            self._writer = None
+            self._queue = None
+
+        self._file.write("\n]\n")
+        self._file.close()
+        self._file = None
+
+    # ---------- ADDING EVENTS ----------
+    def add(self, event):
+        event["pid"] = 1
+        event["tid"] = threading.get_ident()
+        with self._lock:
+            # (images may also be loaded in other threads)
+            self.events.append(event)
+            self.stats["events"] += 1
+            full = len(self.events) >= FLUSH_EVENTS
+        if full and self._queue is not None:
+            self._hand_over()
+
+    def micros(self, t):
+        # perf_counter() seconds -> microseconds since start()
+        return round((t - self.origin) * 1_000_000, 1)
+
+    def metadata(self, name, args):
+        self.add({"name": name, "ph": "M", "args": args})
+
+    # ---------- WRITING ----------
+    def _hand_over(self):
+        # Gives the collected events to the writer (and starts a new list).
+        with self._lock:
+            events, self.events = self.events, []
+        if not events:
+            return
+        self.stats["flushes"] += 1
+        if self._queue is not None:
+            self._queue.put(events)
+        else:
+            # Browser: only called by stop(), never during a frame
+            self._write(events)
+
+    def _write_loop(self):
+        # Runs in the writer thread.
+        while True:
+            events = self._queue.get()
+            if events is None:
+                return
+            self._write(events)
+
+    def _write(self, events):
+        text = ",\n".join(json.dumps(e, separators=(",", ":")) for e in events)
+        if not self._first:
+            text = ",\n" + text
+        self._first = False
+        self._file.write(text)
+
+
+tracer = Tracer()
+# The one tracer of the game (module functions below use it)
+
+
+def start(path):
+    tracer.start(path)
+
+
+def stop():
+    tracer.stop()
+
+
+def span(name, cat="game"):
+    # with tracing.span("name"): ...  -> one bar for the time inside.
+    if not tracer.enabled:
+        return _NO_SPAN
+    return _Span(name, cat)
+
+
+def complete(name, cat, start, end, args=None):
+    # One bar from "start" to "end" (perf_counter() seconds).
+    if not tracer.enabled:
+        return
+    event = {"name": name, "cat": cat, "ph": "X",
+             "ts": tracer.micros(start), "dur": round((end - start) * 1_000_000, 1)}
+    if args:
+        event["args"] = args
+    tracer.add(event)
+
+
+def instant(name, cat="game", args=None):
+    # A mark at this moment (e.g. "quiz open").
+    if not tracer.enabled:
+        return
+    event = {"name": name, "cat": cat, "ph": "i", "s": "p",
+             "ts": tracer.micros(time.perf_counter())}
+    if args:
+        event["args"] = args
+    tracer.add(event)
@@ -0,0 +1,343 @@
+import pygame
+import Events
+import timestep
+import pool
+from collision import HitboxGroup
+import hazards
+import render_queue as layers
+from render_queue import RenderQueue
+from profiler import FrameProfiler
+from spaceship import Spaceship               #  rocket
+from scores import Scores             # Health / progress / win-lose logic + restart button
+from departments_data import Departments           # To know how many departments exist
+from confi import SIM_RATE, NUMPY_HAZARDS
+
+# Length of one simulation step in milliseconds (for the game-clock timers).
+STEP_MS = 1000 / SIM_RATE
+
+
+# =====================================================
+#                  GAME WORLD
+# =====================================================
+# The World holds everything that belongs to ONE running game:
+# - the rocket, the scores
+# - the sprite groups (asteroids, departments, keys, planet)
+# - the quiz and the department that is being answered
+#
+# It can:
+# - start / restart a session
+# - process gameplay events (clicks, pause key, timers)
+# - move everything forward by one simulation step
+# - draw itself
+#
+# main.py uses it for the real game with menus around it.
+# headless.py uses the same World to play test sessions without a screen.
+class World:
+
+    def __init__(self, window, background, quiz, numpy_hazards=NUMPY_HAZARDS):
+        # window     -> surface everything is drawn on
+        # background -> the scrolling space background (shared with the menu)
+        # quiz       -> the Quiz overlay
+        # numpy_hazards -> asteroids and keys in NumPy arrays (see hazards.py)
+
+        self.window = window
+        self.background = background
+        self.quiz = quiz
+
+        self.queue = RenderQueue(window)
+        # Collects everything drawn in one frame and draws it with
+        # one blits() call, layer by layer (see render_queue.py).
+
+        self.rocket = Spaceship(self.queue.layer(layers.ROCKET))
+        # The rocket/player object.
+        #  pass its layer because Spaceship draws itself onto it in rocket.draw().
+
+        self.scores = Scores(self.queue.layer(layers.HUD))
+        # Handles health display, visited department counter,
+        # win text, lose text, and restart button
+
+        self.scores.to_planet = False
+        # True when all departments are done and the planet phase started.
+
+        #CREATE SPRITE GROUPS
+
+        self.asteroids = HitboxGroup()       # Asteroids
+        self.departments = pygame.sprite.Group()       # Departments
+        self.keys = HitboxGroup()    # Healing keys
+        self.planets = HitboxGroup()       # Final planet (AIity)
+        # (HitboxGroup = fast collision checks with the rocket, see collision.py)
+
+        self.numpy_hazards = numpy_hazards and hazards.available()
+        if self.numpy_hazards:
+            # Asteroids and keys in NumPy arrays instead (see hazards.py)
+            self.asteroids = hazards.HazardArray()
+            self.keys = hazards.HazardArray()
+
+        self.active_house = None
+        # Stores the department sprite the player clicked.
+        # after quiz finishes we must remove THIS department.
+
+        # Counters for statistics (used by headless.py)
+        self.stats = {"steps": 0, "hits": 0, "heals": 0}
+
+        self.fired = []
+        # Names of the timers that fired in the last step
+        # (recorded for replays, see recording.py)
+
+        self.profiler = FrameProfiler()
+        # Measures update vs. collision time (main.py gives it its own,
+        # this one is switched off, see profiler.py)
+
+    # RESET GAME WORLD OBJECTS
+    def reset(self):
+        # This clears all moving objects and resets hero to start position.
+
+        pool.empty(self.asteroids)
+        # Remove all asteroids from the game (they go back to their pool).
+
+        pool.empty(self.departments)
+        # Remove all departments from the game.
+
+        pool.empty(self.keys)
+        # Remove all keys from the game.
+
+        self.planets.empty()
+        # Remove planet from the game.
+
+        self.rocket.health = 3
+        # Reset hero health to full.
+
+        self.rocket.rect.center = (600, 400)
+        # Move hero to the starting position
+
+        self.rocket.hitbox.center = self.rocket.rect.center
+        # Keep the hitbox aligned with the hero rectangle
+
+        self.rocket.index = 0
+        # Start the animation from the first frame (same start for replays)
+
+        timestep.snapshot([self.rocket])
+        # Don't slide the hero from its old place to the start position
+
+        self.quiz.close_quiz()
+        # If quiz was open, close it
+
+        self.active_house = None
+        # No department currently active.
+
+        Events.stop_timers()
+        # Forget timers of the last session (e.g. a planet that never came)
+
+        self.stats = {"steps": 0, "hits": 0, "heals": 0}
+
+    #START = NEW SESSION (RESET EVERYTHING)
+    def start_new_session(self):
+        scores = self.scores
+
+        self.reset()
+        # Clear all objects and reset hero.
+
+        scores.game = True
+        # Game is running again.
+
+        scores.game_over = False
+        # Not in "game over" state.
+
+        scores.to_planet = False
+        # Not in planet phase yet.
+
+        scores.reached_planet = False
+        # Not reached planet yet.
+
+        # NEW session means: reset progress completely.
+        scores.completed_departments = set()
+        # Remove all remembered completed departments.
+
+        scores.total_correct_answers = 0
+        # Reset total score across departments.
+
+        Events.init_events(self.departments, self.keys, scores)
+        # Starts timers:
+        # - first department appears after 12 seconds
+        # - keys appear every 9 seconds
+
+    # RESTART = CONTINUE PROGRESS (KEEP COMPLETED DEPARTMENTS)
+    def restart_keep_departments(self):
+        scores = self.scores
+
+        self.reset()
+        # Clear asteroids, keys, planet, etc. and reset hero.
+
+        scores.game = True
+        # Game runs again.
+
+        scores.game_over = False
+        # Not game over anymore.
+
+        scores.reached_planet = False
+        # Planet not reached yet.
+
+        # Restart keeps progress, so departments already completed are NOT repeated.
+        scores.to_planet = (len(scores.completed_departments) >= len(Departments))
+        # If all departments are already completed,  go directly into planet phase.
+
+        Events.init_events(self.departments, self.keys, scores)
+        # Restart timers again.
+
+        # If we are already in planet phase:
+        # - stop the department timer
+        # - schedule the planet spawn
+        if scores.to_planet:
+            Events.timers.cancel(Events.Department_fly_in)            # stop department spawning
+            Events.schedule_planet_spawn(self.planets, scores)        # spawn planet after delay
+
+    # GAMEPLAY EVENTS
+    def handle_events(self, events):
+        #  Events.py process gameplay events:
+        # - pause
+        # - quiz clicks
+        # - restart click
+        # Returns "continue", "quit", "restart" or "pause".
+        status, self.active_house = Events.handle_events(
+            events, self.departments, self.keys, self.scores,
+            self.quiz, self.active_house, self.planets
+        )
+        return status
+
+    def resume_after_pause(self):
+        # The pause screen was closed -> timers go on
+        # (not while a quiz is open, see Events.resume_after_pause).
+        Events.resume_after_pause(self.quiz)
+
+    # ONE SIMULATION STEP OF THE GAME
+    def snapshot(self):
+        # Remember where everything was (for smooth drawing, see timestep.py).
+        timestep.snapshot([self.rocket])
+        for group in (self.departments, self.planets):
+            timestep.snapshot(group)
+
+        if self.numpy_hazards:
+            self.asteroids.snapshot()
+            self.keys.snapshot()
+        else:
+            timestep.snapshot(self.asteroids)
+            timestep.snapshot(self.keys)
+
+    def step(self, pressed=None):
+        # Moves the game world forward by exactly one step (1 / SIM_RATE seconds).
+        # pressed -> keyboard state for the rocket (None = real keyboard)
+
+        scores = self.scores
+        self.stats["steps"] += 1
+        self.fired = []
+
+        # The background always scrolls in the game
+        # (also behind the open quiz and the end screen)
+        self.background.update()
+
+        # GAME OVER OR WIN SCREEN
+        if not scores.game:
+            # The planet may still be flying in.
+            self.planets.update()
+            return
+
+        # Departments move while the game is running (also behind the quiz)
+        self.departments.update()
+
+        # If quiz is open, freeze gameplay (no asteroid damage)
+        if self.quiz.quiz_active:
+            return
+
+        # Game-clock timers: keys, departments, planet
+        self.fired = Events.tick_timers(STEP_MS)
+
+        # Normal gameplay logic
+        self.rocket.update(pressed)
+        Events.make_comet(self.asteroids)
+        Events.move_key(self.keys)
+
+        # Planet phase objects
+        self.planets.update()
+        self.profiler.lap("update")
+
+        # Asteroid hits, keys, and did the hero reach the planet?
+        hits, heals = Events.collide(self.rocket, self.asteroids, self.keys,
+                                     self.planets, scores)
+        self.profiler.lap("collision")
+        self.stats["hits"] += hits
+        self.stats["heals"] += heals
+
+        # Won or lost?
+        scores.check_finish(self.rocket)
+
+    def counts(self):
+        # How many objects there are right now (for the profiler).
+        return (len(self.asteroids), len(self.keys), len(self.departments),
+                len(self.planets), self.queue.stats["blits"])
+
+    # DRAWING
+    def draw(self, alpha=1.0):
+        # Draws the game. Nothing moves here, only drawing.
+        # alpha (0..1) = how far we are between the last two steps.
+        # Everything goes into the render queue, which draws the whole
+        # frame at the end with one blits() call (see render_queue.py).
+        queue = self.queue
+        scores = self.scores
+
+        # Always draw background first
+        self.background.render(queue.layer(layers.BACKGROUND), alpha)
+
+        # Drawing is OK even when game is over (it just shows where they are)
+        timestep.draw_group(queue.layer(layers.DEPARTMENTS), self.departments, alpha)
+
+        # GAME is STILL RUNNING
+        if scores.game:
+            # If quiz is open, gameplay is frozen
+            if self.quiz.quiz_active:
+                # Only show UI and quiz
+                scores.show_health(self.rocket)
+                scores.visited_departments()
+                self.quiz.draw(queue.layer(layers.QUIZ))
+
+            else:
+                # Normal gameplay
+                self.rocket.draw(alpha)
+                self.draw_hazards(alpha)
+
+                # Planet phase objects
+                timestep.draw_group(queue.layer(layers.PLANET), self.planets, alpha)
+
+                # UI and quiz (quiz not active now, but still safe)
+                scores.show_health(self.rocket)
+                scores.visited_departments()
+                self.quiz.draw(queue.layer(layers.QUIZ))
+
+        # GAME OVER OR WIN SCREEN
+        else:
+            # Even when game ended, planet might still be visible
+            timestep.draw_group(queue.layer(layers.PLANET), self.planets, alpha)
+
+            # Draw score texts and restart button
+            scores.show_health(self.rocket)
+            scores.visited_departments()
+            scores.draw_result()
+            scores.draw_restart_button()
+
+        queue.flush()
+
+    def draw_hazards(self, alpha=1.0):
+        # Asteroids and keys (sprites or arrays, see hazards.py)
+        target = self.queue.layer(layers.HAZARDS)
+        if self.numpy_hazards:
+            self.asteroids.draw(target, alpha)
+            self.keys.draw(target, alpha)
+        else:
+            timestep.draw_group(target, self.asteroids, alpha)
+            timestep.draw_group(target, self.keys, alpha)
+
+    def draw_frozen(self):
+        # Used behind the pause screen.
+        # Nothing moves while paused, so this is the normal draw()
+        # with everything exactly where it is right now (alpha = 1).
+        # (the win / game over screen can be paused too)
+        self.draw(1.0)